@@ -0,0 +1,268 @@
+#!/usr/bin/python3
+
+#
+# Aerodynamic coefficient database
+# The lift, drag and moment tables used to be written by wing.m as Python
+# literals, in wing_tables.py, which made thousands of small objects every
+# time it was imported.  Now they are generated from the same source data in
+# wing.m into a packed binary file, which is mapped into memory to load it.
+#  - Run this module to regenerate the tables after changing the data:
+#      python3 aerodb.py [wing.m] [wing_tables.bin]
+#  - A table is a grid of coefficients over any number of axes, eg: angle
+#    of attack, sideslip, flap, Reynolds number
+#  - An Interpolator looks up coefficients in a table, one point at a time
+#    for the flight model, or many at once
+#
+# File layout:
+#   magic   8 bytes, b'AERODB\x00\x01'
+#   length  4 bytes, little endian, length of the header
+#   header  JSON: for each table its name, axes, columns and data offset
+#   tables  float32, little endian, C order, each one 16 byte aligned
+#
+
+import os
+import re
+import math
+import sys
+import json
+import mmap
+import bisect
+import struct
+import numpy as np
+
+magic = b'AERODB\x00\x01'
+dtype = np.dtype('<f4')
+align = 16
+here  = os.path.dirname(os.path.abspath(__file__))
+default_src  = os.path.join(here, 'wing.m')
+default_path = os.path.join(here, 'wing_tables.bin')
+
+# A grid of coefficients
+class Table:
+
+  # Params: name - name of table
+  #         axes - list of (name, values) for each axis, values ascending
+  #         columns - names of the coefficients at each grid point
+  #         data - array shaped (len(values) for each axis) + (len(columns),)
+  def __init__(self, name, axes, columns, data):
+    self.name    = name
+    self.axes    = [(n, np.asarray(v, dtype=np.float64)) for (n, v) in axes]
+    self.columns = list(columns)
+    self.data    = data
+    shape = tuple(len(v) for (n, v) in self.axes) + (len(self.columns),)
+    if data.shape != shape:
+      raise ValueError(f"Table {name}: data is {data.shape}, axes are {shape}")
+
+  # Values along the named axis
+  def axis(self, name):
+    for (n, v) in self.axes:
+      if n == name:
+        return v
+    raise KeyError(f"Table {self.name} has no axis {name}")
+
+# Multilinear interpolation in a Table
+# Inputs outside a table are clamped to its edges.  From one step to the
+# next the inputs mostly stay in the same grid cell, so the corners of the
+# last cell are kept, and finding the cell and fetching its corners is
+# skipped until they leave it.
+class Interpolator:
+
+  def __init__(self, table):
+    self.table  = table
+    self.ncols  = len(table.columns)
+    self.flat   = table.data.reshape(-1, self.ncols)
+    self.values = [v for (n, v) in table.axes]
+    self.axes   = [v.tolist() for v in self.values] # Plain floats, for scalar lookups
+    self.inv    = [(1.0 / np.diff(v)).tolist() for v in self.values] # 1 / width of each cell
+
+    # Distance between neighbouring grid points along each axis, in rows of
+    # flat, and offsets of a cell's corners from its lowest one, with the
+    # first axis in the most significant bit
+    shape = table.data.shape[:-1]
+    self.strides = [int(np.prod(shape[i+1:])) for i in range(0, len(shape))]
+    self.offsets = np.array([sum(s for (j, s) in enumerate(self.strides)
+                                 if k & (1 << (len(shape) - 1 - j)))
+                             for k in range(0, 1 << len(shape))])
+
+    self.cell    = None # Along each axis of the kept cell: range of inputs it
+                        # covers, its edges and 1 / its width
+    self.corners = None # Its corners' coefficients
+    self.hits    = 0
+    self.misses  = 0
+
+  # Coefficients at one point
+  # Params: x - one value for each axis, in the order of the table's axes
+  # Returns tuple of coefficients, in the order of the table's columns
+  def __call__(self, *x):
+    cell = self.cell
+    if cell != None and all(start <= v <= end for (v, (start, end, lo, hi, inv)) in zip(x, cell)):
+      self.hits += 1
+    else:
+      self.misses += 1
+      cell = self.locate(x)
+
+    # Weight of each corner, built up an axis at a time from the last, as
+    # the first axis is the most significant bit of a corner's number
+    w = [1.0]
+    for (v, (start, end, lo, hi, inv)) in zip(reversed(x), reversed(cell)):
+      t = (min(max(v, lo), hi) - lo) * inv
+      w = [a * (1.0 - t) for a in w] + [a * t for a in w]
+    return tuple(np.dot(w, self.corners).tolist())
+
+  # Find the cell containing x, and keep its corners
+  # Returns the cell
+  def locate(self, x):
+    cell = []
+    base = 0
+    for (v, axis, inv, stride) in zip(x, self.axes, self.inv, self.strides):
+      i = min(max(bisect.bisect_right(axis, v) - 1, 0), len(axis) - 2)
+      base += i * stride
+      # Open ended at the edges of the table, so clamped inputs still hit
+      start = axis[i] if i > 0 else -math.inf
+      end = axis[i + 1] if i < len(axis) - 2 else math.inf
+      cell.append((start, end, axis[i], axis[i + 1], inv[i]))
+    self.cell = cell
+    self.corners = self.flat[base + self.offsets].astype(np.float64)
+    return cell
+
+  # Coefficients at many points at once
+  # Params: x - one array-like for each axis, all the same length
+  # Returns array of coefficients, one row for each point
+  def batch(self, *x):
+    base = 0
+    ts = []
+    for (v, axis, stride) in zip(x, self.values, self.strides):
+      v = np.clip(np.asarray(v, dtype=np.float64), axis[0], axis[-1])
+      i = np.clip(np.searchsorted(axis, v, side='right') - 1, 0, len(axis) - 2)
+      base = base + i * stride
+      ts.append(((v - axis[i]) / (axis[i + 1] - axis[i]))[:, None, None])
+    corners = self.flat[np.asarray(base)[:, None] + self.offsets]
+    for t in ts:
+      half = corners.shape[1] // 2
+      corners = corners[:, :half] + (corners[:, half:] - corners[:, :half]) * t
+    return corners[:, 0]
+
+# Returns dict of the numeric matrices in an Octave script, by name
+# Matrices with anything but numbers in them, eg: expressions, are skipped.
+def parse_matrices(text):
+  text = re.sub(r'[%#][^\n]*', '', text) # Comments
+  matrices = {}
+  for m in re.finditer(r'(\w+)\s*=\s*\[([^\]]*)\]', text):
+    rows = [r.split() for r in m.group(2).strip().splitlines() if r.strip() != '']
+    try:
+      matrices[m.group(1)] = np.array(rows, dtype=np.float64)
+    except ValueError:
+      pass
+  return matrices
+
+# Generate the tables from the CFD data in wing.m, the same way wing.m does
+# Returns list of Tables
+def generate(src=default_src):
+  with open(src) as f:
+    m = parse_matrices(f.read())
+
+  # Columns are not in same order for clean table as the other two
+  clean_orig = m['clean_orig']
+  clean   = clean_orig[:, [0, 2, 3, 1]]
+  tailoff = m['tailoff']
+  flap30  = m['flap30']
+
+  # Resample to every degree, columns: lift, drag, moment
+  alpha = np.arange(-180.0, 181.0, 1.0)
+  def resample(t):
+    return np.stack([np.interp(alpha, t[:, 0], t[:, c]) for c in (2, 1, 3)], axis=-1)
+  clean   = resample(clean)
+  tailoff = resample(tailoff)
+  flap30  = resample(flap30)
+  flap30_delta = flap30 - tailoff # Flap 30 data appears to be tail-off too
+
+  # Max CoL ought to be about 1.6 and min CoD about 0.006, per
+  # http://airfoiltools.com/airfoil/details?airfoil=naca2412-il
+  clean[:, 0] *= 1.6 / np.max(clean[:, 0])
+  clean[:, 1] *= 0.006 / np.min(clean[:, 1])
+
+  columns = ['CoL', 'CoD', 'CoM']
+  tables = [Table('clean', [('alpha', alpha)], columns, clean),
+            Table('flap30_delta', [('alpha', alpha)], columns, flap30_delta)]
+  tables.append(generate_wing(alpha, clean, flap30_delta, columns))
+  return tables
+
+# The whole wing: angle of attack x sideslip x flap x Reynolds number
+# The CFD data only covers angle of attack and flap, so the other two axes
+# are simple models on top of it:
+#  - Sideslip: only the airflow across the span counts, so all three
+#    coefficients fall off with cos^2 of sideslip
+#  - Reynolds number: skin friction goes as Re^-0.2 (turbulent flat plate),
+#    applied to the minimum drag, relative to the data's Reynolds number,
+#    taken to be about cruise
+def generate_wing(alpha, clean, flap30_delta, columns):
+  beta   = np.array([-30.0, -20.0, -10.0, -5.0, 0.0, 5.0, 10.0, 20.0, 30.0])
+  flap   = np.array([0.0, 30.0])
+  log_re = np.array([5.0, 5.5, 6.0, 6.5, 7.0])
+  re_ref = 5e6
+  cod_min = np.min(clean[:, 1])
+
+  wing = np.empty((len(alpha), len(beta), len(flap), len(log_re), len(columns)))
+  base = np.stack([clean, clean + flap30_delta], axis=1) # alpha x flap
+  sideslip = np.cos(np.radians(beta)) ** 2
+  friction = cod_min * ((10.0 ** log_re / re_ref) ** -0.2 - 1.0)
+  wing[...] = base[:, None, :, None, :] * sideslip[None, :, None, None, None]
+  wing[..., 1] += friction[None, None, None, :]
+  return Table('wing', [('alpha', alpha), ('beta', beta), ('flap', flap), ('log_re', log_re)],
+               columns, wing)
+
+# Write tables to a database file
+def write(tables, path=default_path):
+  header = []
+  offset = 0
+  for t in tables:
+    header.append({'name': t.name,
+                   'axes': [{'name': n, 'values': v.tolist()} for (n, v) in t.axes],
+                   'columns': t.columns,
+                   'offset': offset})
+    offset += -(-t.data.size * dtype.itemsize // align) * align
+  header = json.dumps(header).encode()
+  start = -(-(len(magic) + 4 + len(header)) // align) * align
+
+  with open(path, 'wb') as f:
+    f.write(magic)
+    f.write(struct.pack('<I', len(header)))
+    f.write(header)
+    for (t, h) in zip(tables, json.loads(header)):
+      f.seek(start + h['offset'])
+      f.write(np.ascontiguousarray(t.data, dtype=dtype).tobytes())
+    f.truncate(start + offset)
+
+# Load a database file, mapping it into memory.  Generates it first if it
+# isn't there.
+# Returns dict of Tables, by name.  Their data is read-only.
+def load(path=default_path):
+  if not os.path.exists(path):
+    write(generate(), path)
+
+  with open(path, 'rb') as f:
+    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # Stays mapped after close
+  if buf[0:len(magic)] != magic:
+    raise ValueError(f"{path} is not an aero database")
+  (length,) = struct.unpack_from('<I', buf, len(magic))
+  pos = len(magic) + 4
+  header = json.loads(buf[pos:pos + length])
+  start = -(-(pos + length) // align) * align
+
+  tables = {}
+  for h in header:
+    axes = [(a['name'], a['values']) for a in h['axes']]
+    shape = tuple(len(v) for (n, v) in axes) + (len(h['columns']),)
+    data = np.frombuffer(buf, dtype=dtype, count=int(np.prod(shape)),
+                         offset=start + h['offset']).reshape(shape)
+    tables[h['name']] = Table(h['name'], axes, h['columns'], data)
+  return tables
+
+if __name__ == '__main__':
+  src  = sys.argv[1] if len(sys.argv) > 1 else default_src
+  path = sys.argv[2] if len(sys.argv) > 2 else default_path
+  tables = generate(src)
+  write(tables, path)
+  for t in tables:
+    print(f"{t.name}: {' x '.join(f'{n}[{len(v)}]' for (n, v) in t.axes)} x {t.columns}")
+  print(f"Wrote {path}, {os.path.getsize(path)} bytes")
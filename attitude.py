@@ -0,0 +1,71 @@
+#
+# Attitude ball
+# The moving part of an attitude indicator - sky, ground and pitch ladder -
+# drawn by sampling an upright ladder strip, drawn once, through a rotation.
+# All buffers are allocated up front.  A frame is a few NumPy passes over
+# the pixels inside the circle, and one copy into the ball surface.
+#
+
+import numpy as np
+import pygame
+
+class AttitudeBall:
+
+  # Params: strip - upright ladder, sky above ground, centred left to right
+  #         row0 - row of strip level with the horizon at zero pitch
+  #         radius - radius of the ball in pixels
+  #         colorkey - colour of the ball surface outside the circle
+  def __init__(self, strip, row0, radius, colorkey=(255,0,255)):
+    (self.sw, self.sh) = strip.get_size()
+    self.strip = pygame.surfarray.array2d(strip).T.copy().ravel() # Rows first
+    self.row0  = row0
+    self.col0  = self.sw / 2
+
+    d = int(radius * 2)
+    self.surf = pygame.Surface((d, d), 0, strip)
+    self.surf.set_colorkey(colorkey)
+    self.pixels = np.full((d, d), self.surf.map_rgb(colorkey), dtype=self.strip.dtype)
+
+    # Pixels inside the circle, as offsets of their centres from the middle
+    (v, u) = np.mgrid[0:d, 0:d] + 0.5 - radius
+    inside = u * u + v * v <= radius * radius
+    self.circle = np.flatnonzero(inside)
+    self.u = u[inside].astype(np.float32)
+    self.v = v[inside].astype(np.float32)
+
+    # Work space
+    n = len(self.circle)
+    self.a    = np.empty(n, dtype=np.float32)
+    self.p    = np.empty(n, dtype=np.float32)
+    self.t    = np.empty(n, dtype=np.float32)
+    self.cols = np.empty(n, dtype=np.int32)
+    self.rows = np.empty(n, dtype=np.int32)
+    self.vals = np.empty(n, dtype=self.strip.dtype)
+
+  # Draw the ball
+  # Params: shift - pixels the ladder moves down the ball, ie: pitch
+  #         sin_roll, cos_roll - roll, the ladder turns anticlockwise with it
+  # Returns the ball surface, which is reused by the next call
+  def render(self, shift, sin_roll, cos_roll):
+    # Position of each pixel along and across the ladder
+    np.multiply(self.u, cos_roll, out=self.a)
+    np.multiply(self.v, sin_roll, out=self.t)
+    np.subtract(self.a, self.t, out=self.a)
+    np.multiply(self.u, sin_roll, out=self.p)
+    np.multiply(self.v, cos_roll, out=self.t)
+    np.add(self.p, self.t, out=self.p)
+
+    # Into strip coordinates, clamped to the strip
+    np.add(self.a, self.col0, out=self.a)
+    np.add(self.p, self.row0 - shift, out=self.p)
+    np.clip(self.a, 0, self.sw - 1, out=self.a)
+    np.clip(self.p, 0, self.sh - 1, out=self.p)
+    self.cols[:] = self.a # Truncates, same as floor as they are positive
+    self.rows[:] = self.p
+
+    np.multiply(self.rows, self.sw, out=self.rows)
+    np.add(self.rows, self.cols, out=self.rows)
+    np.take(self.strip, self.rows, out=self.vals)
+    np.put(self.pixels, self.circle, self.vals)
+    pygame.surfarray.blit_array(self.surf, self.pixels.T)
+    return self.surf
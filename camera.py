@@ -0,0 +1,99 @@
+#
+# Cameras
+# A camera is an eye position and a rotation: the matrix taking offsets from
+# the eye in world coordinates (north, east, up) into camera coordinates,
+# x ahead, y to the right and z up.  Any view can be made this way: from the
+# cockpit looking in any direction, chasing the aircraft, or from a tower on
+# the ground.
+#  - zoom is the distance to the projection plane in display pixels, so
+#    the field of view depends on how wide the view is drawn
+#  - turned() gives a camera at the same eye looking off to one side, which
+#    is how one view is split across several windows
+#
+
+import math
+import numpy as np
+
+# Views, as kept in pipeline.Snapshot.view
+cockpit = 0
+chase   = 1
+tower   = 2
+names   = ['Cockpit', 'Chase', 'Tower']
+
+eye_height    = 3.0                   # Pilot's eye above the aircraft's reference point
+chase_behind  = 25.0                  # Chase camera distance behind the aircraft,
+chase_above   = 5.0                   # height above it,
+chase_ahead   = 50.0                  # and how far ahead of the aircraft it looks
+tower_pos     = (1500.0, -150.0, 20.0) # Control tower cab, beside the main runway
+
+class Camera:
+
+  # Params: north, east, alt - position of the eye
+  #         rotation - 3x3 world to camera matrix
+  #         zoom - distance to the projection plane in display pixels
+  def __init__(self, north, east, alt, rotation, zoom):
+    self.eye      = np.array((north, east, alt), dtype=float)
+    self.rotation = rotation
+    self.zoom     = zoom
+
+  # A camera at the same eye looking off to one side
+  # Params: yaw - radians to the right
+  #         pitch - radians up, after turning
+  def turned(self, yaw, pitch=0.0):
+    if yaw == 0.0 and pitch == 0.0:
+      return self
+    (sy, cy) = (math.sin(yaw), math.cos(yaw))
+    (sp, cp) = (math.sin(pitch), math.cos(pitch))
+    look = np.array([[cp * cy,  cp * sy, sp],
+                     [-sy,      cy,      0.0],
+                     [-sp * cy, -sp * sy, cp]])
+    return Camera(*self.eye, look @ self.rotation, self.zoom)
+
+  # Horizontal field of view, in radians, across a view w display pixels wide
+  def fov(self, w):
+    return 2 * math.atan(w / 2 / self.zoom)
+
+# Rotation matrix for an attitude, the aircraft's own convention: roll right
+# wing down, pitch nose up, heading clockwise from north, all in radians
+def attitude(roll, pitch, hdg):
+  (sr, cr) = (math.sin(roll), math.cos(roll))
+  (sp, cp) = (math.sin(pitch), math.cos(pitch))
+  (sh, ch) = (math.sin(hdg), math.cos(hdg))
+  heading = np.array([[ch,  sh,  0.0],
+                      [-sh, ch,  0.0],
+                      [0.0, 0.0, 1.0]])
+  nose    = np.array([[cp,  0.0, sp],
+                      [0.0, 1.0, 0.0],
+                      [-sp, 0.0, cp]])
+  wings   = np.array([[1.0, 0.0, 0.0],
+                      [0.0, cr,  -sr],
+                      [0.0, sr,  cr]])
+  return wings @ nose @ heading
+
+# Camera at eye looking towards target, level (no roll)
+def look_at(eye, target, zoom):
+  ahead = np.asarray(target, dtype=float) - eye
+  ahead /= max(np.linalg.norm(ahead), 1e-9)
+  right = np.cross((0.0, 0.0, 1.0), ahead)
+  if np.linalg.norm(right) < 1e-9: # Straight up or down
+    right = np.array((0.0, 1.0, 0.0))
+  right /= np.linalg.norm(right)
+  return Camera(*eye, np.array([ahead, right, np.cross(ahead, right)]), zoom)
+
+# Camera, and the aircraft to draw, for a snapshot's view
+# Params: s - pipeline.Snapshot
+# Returns (camera, traffic) where traffic has the aircraft itself added in
+# the views from outside it
+def for_snapshot(s):
+  if s.view == chase:
+    (sh, ch) = (math.sin(s.hdg), math.cos(s.hdg))
+    eye = (s.n_world - ch * chase_behind, s.e_world - sh * chase_behind, s.z_world + chase_above)
+    cam = look_at(eye, (s.n_world + ch * chase_ahead, s.e_world + sh * chase_ahead, s.z_world), s.zoom)
+  elif s.view == tower:
+    cam = look_at(tower_pos, (s.n_world, s.e_world, s.z_world), s.zoom)
+  else:
+    cam = Camera(s.n_world, s.e_world, s.z_world + eye_height,
+                 attitude(s.roll, s.pitch, s.hdg), s.zoom).turned(math.radians(s.viewangle))
+    return (cam, s.traffic)
+  own = (s.n_world, s.e_world, s.z_world, s.roll, s.pitch, s.hdg)
+  return (cam, tuple(s.traffic) + (own,))
@@ -0,0 +1,94 @@
+#
+# Pre-rotated instrument cards
+# A rotating card - compass card, heading bug, ADF card - looks the same
+# every time it is at the same angle, so instead of drawing it every frame
+# it is drawn once for every step of angle and the nearest one blitted.
+#  - Only a quarter turn is kept.  The rest are exact 90 degree rotations
+#    of those, which are lossless and cheap.
+#  - Optionally the nearest frame is rotated the rest of the way, for
+#    coarse steps.
+#  - Frames can be saved to a cache directory and loaded from there next
+#    time instead of being drawn again.  Set FLIGHT_CACHE_DIR to enable it.
+#
+
+import os
+import pygame
+
+class CardAtlas:
+
+  # Params: name - name of card, used for the cache file.  Change it if the
+  #                card's artwork changes.
+  #         size - (w, h) of card in pixels
+  #         draw - function(surf, angle) drawing the card onto surf, turned
+  #                anticlockwise by angle degrees
+  #         step - resolution in degrees.  Should divide 90.
+  #         substep - if True, rotate the nearest frame the rest of the way
+  #         colorkey - colour of the see-through parts of the card
+  #         cache_dir - directory for cached frames, or None to use
+  #                     FLIGHT_CACHE_DIR, if that is set
+  def __init__(self, name, size, draw, step=0.5, substep=False,
+               colorkey=(255,0,255), cache_dir=None):
+    (w, h) = size
+    self.size     = size
+    self.step     = step
+    self.substep  = substep
+    self.colorkey = colorkey
+    self.nframes  = int(round(90.0 / step))
+
+    path = None
+    if cache_dir == None:
+      cache_dir = os.environ.get('FLIGHT_CACHE_DIR')
+    if cache_dir != None:
+      path = os.path.join(cache_dir, f"{name}-{w:d}x{h:d}-{step:g}.tga")
+    strip = self.load(path)
+    if strip == None:
+      # One frame under the other in a tall strip
+      strip = pygame.Surface((w, h * self.nframes))
+      for i in range(0, self.nframes):
+        frame = strip.subsurface((0, i * h, w, h))
+        frame.fill(colorkey)
+        draw(frame, i * step)
+      if path != None:
+        os.makedirs(cache_dir, exist_ok=True)
+        pygame.image.save(strip, path)
+
+    strip.set_colorkey(colorkey)
+    self.frames = [strip.subsurface((0, i * h, w, h)) for i in range(0, self.nframes)]
+
+  # Returns the strip of frames cached at path, or None if there isn't one
+  def load(self, path):
+    if path == None or not os.path.exists(path):
+      return None
+    try:
+      strip = pygame.image.load(path)
+    except pygame.error:
+      return None
+    (w, h) = self.size
+    if strip.get_size() != (w, h * self.nframes):
+      return None
+    if pygame.display.get_surface() != None:
+      strip = strip.convert()
+    return strip
+
+  # Card turned anticlockwise by angle degrees
+  def frame(self, angle):
+    steps = angle / self.step
+    i = int(round(steps)) % (4 * self.nframes)
+    (quarter, i) = divmod(i, self.nframes)
+    surf = self.frames[i]
+    if quarter != 0:
+      surf = pygame.transform.rotate(surf, quarter * 90)
+    if self.substep:
+      rest = (steps - round(steps)) * self.step
+      if rest != 0.0:
+        surf = pygame.transform.rotate(surf, rest)
+    if surf is not self.frames[i]:
+      surf.set_colorkey(self.colorkey) # Rotated copies would be RLE encoded, for the one blit
+    return surf
+
+  # Blit the card turned anticlockwise by angle degrees, centred on centre
+  def blit(self, dest, centre, angle):
+    surf = self.frame(angle)
+    rect = surf.get_rect()
+    rect.center = centre
+    dest.blit(surf, rect)
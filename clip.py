@@ -0,0 +1,58 @@
+#
+# Batched Sutherland-Hodgman polygon clipping
+#
+# Polygons are passed around as a 'ragged' pair of arrays:
+#  pts    - (M, D) array of vertices for all polygons, one after the other
+#  counts - (P,) array with the number of vertices in each polygon
+# Every polygon is clipped against a plane in one go, without any Python
+# loop over polygons or vertices.  Works in 2D (screen) or 3D (camera) space.
+#
+
+import numpy as np
+
+# Clip all polygons against one plane
+# Params: pts, counts - ragged polygon arrays, as above
+#         plane - (D+1,) array (a, b, ..., d).  Points where
+#                 a*x + b*y + ... + d >= 0 are inside.
+# Returns (pts, counts) for the clipped polygons.  Polygons entirely
+# outside the plane are left with a count of zero.
+def clip_polygons(pts, counts, plane):
+  numpolys = counts.size
+  if pts.shape[0] == 0:
+    return (pts, counts)
+
+  # Index of the previous vertex of every vertex, wrapping around within
+  # each polygon so every vertex is the end point of one edge
+  starts = np.cumsum(counts) - counts
+  prev = np.arange(pts.shape[0]) - 1
+  nonempty = counts > 0
+  prev[starts[nonempty]] = (starts + counts - 1)[nonempty]
+
+  dist = pts @ plane[:-1] + plane[-1]
+  cur_in = dist >= 0
+  prev_in = cur_in[prev]
+
+  # For each edge prev->cur emit the intersection if the edge crosses the
+  # plane, followed by cur if it is inside
+  crossing = cur_in != prev_in
+  num_out = crossing.astype(np.intp) + cur_in
+  offs = np.cumsum(num_out) - num_out
+  out = np.empty((offs[-1] + num_out[-1], pts.shape[1]))
+
+  p0 = pts[prev[crossing]]
+  p1 = pts[crossing]
+  d0 = dist[prev[crossing]]
+  d1 = dist[crossing]
+  t = d0 / (d0 - d1)
+  out[offs[crossing]] = p0 + t[:, np.newaxis] * (p1 - p0)
+  out[(offs + crossing)[cur_in]] = pts[cur_in]
+
+  poly_id = np.repeat(np.arange(numpolys), counts)
+  new_counts = np.bincount(poly_id, weights=num_out, minlength=numpolys).astype(np.intp)
+  return (out, new_counts)
+
+# Clip all polygons against a list of planes (eg: all faces of the frustrum)
+def clip_polygons_to_planes(pts, counts, planes):
+  for plane in planes:
+    (pts, counts) = clip_polygons(pts, counts, plane)
+  return (pts, counts)
@@ -0,0 +1,56 @@
+#
+# Frame compositor
+# The steam panel and the out-the-window view both blit into the compositor,
+# which keeps track of the parts of the display that changed and presents
+# them once per frame.
+#
+
+import pygame
+
+class Compositor:
+
+  def __init__(self, display):
+    self.display = display
+    self.dirty   = [] # Rects changed since the last present()
+
+  # Blit a subsystem's buffer onto the display and mark that area dirty
+  # Params: surf - surface to blit
+  #         dest - (x, y) position on the display
+  #         area - part of surf to blit, or None for all of it
+  def blit(self, surf, dest, area=None):
+    self.mark_dirty(self.display.blit(surf, dest, area))
+
+  # Scale a buffer straight onto an area of the display, without an
+  # intermediate surface, and mark that area dirty
+  # Params: surf - surface to scale
+  #         rect - (x, y, w, h) area of the display to fill
+  #         smooth - if True, filter with smoothscale, else nearest pixel
+  def blit_scaled(self, surf, rect, smooth=False):
+    rect = pygame.Rect(rect)
+    dest = self.display.subsurface(rect)
+    if smooth:
+      pygame.transform.smoothscale(surf, rect.size, dest)
+    else:
+      pygame.transform.scale(surf, rect.size, dest)
+    self.mark_dirty(rect)
+
+  # Record a rectangle of the display as changed
+  # Overlapping rectangles are merged so no pixel is sent twice
+  def mark_dirty(self, rect):
+    rect = pygame.Rect(rect)
+    i = rect.collidelist(self.dirty)
+    while i != -1:
+      rect.union_ip(self.dirty.pop(i))
+      i = rect.collidelist(self.dirty)
+    self.dirty.append(rect)
+
+  # Present the frame.  Only the dirty rectangles are updated.
+  def present(self):
+    if len(self.dirty) > 0:
+      pygame.display.update(self.dirty)
+      self.dirty = []
+
+  # The whole display as a (w, h, 3) NumPy array, without copying
+  # The display stays locked until the array is deleted
+  def pixels(self):
+    return pygame.surfarray.pixels3d(self.display)
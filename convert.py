@@ -22,6 +22,12 @@ def speedtofeetpermin(metrespersec):
 def lbstokgs(lbs):
   return lbs * 0.453592 
 
+def kgstolbs(kgs):
+  return kgs / 0.453592
+
+def speedtomph(metrespersec):
+  return metrespersec / 0.44704
+
 def radpersecondtorpm(radpersec):
   return radpersec * 60 / (2 * math.pi)
 
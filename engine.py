@@ -10,7 +10,6 @@ import math
 #  - Power curve is linear with RPM (consequence of above)
 # The reality is more complex, but this is good enough for our purposes
 class PistonEngine:
-  prop         = propeller.FixedPitchProp() # Propeller model
   moi          = 1.5     # Typical MOI for small prop
 
   delta_t      = 0.1     # Simulation interval
@@ -30,8 +29,11 @@ class PistonEngine:
   running      = False
 
   # Params: delta_t is the simulation interval in seconds
-  def __init__(self, delta_t):
+  #         verbose - print the workings of every step
+  def __init__(self, delta_t, verbose=True):
     self.delta_t = delta_t
+    self.verbose = verbose
+    self.prop    = propeller.FixedPitchProp(verbose) # Propeller model
 
   # Params: tas      - true airspeed m/s
   #         throttle - throttle setting (0 to 1)
@@ -44,7 +46,8 @@ class PistonEngine:
   def update(self, tas, throttle, mixture, starter, rho, altitude, fuellev):
  
     if starter == True:
-      print("Attempting to start ...")
+      if self.verbose:
+        print("Attempting to start ...")
       self.rpm = 1000
       self.running = True
 
@@ -70,7 +73,8 @@ class PistonEngine:
       pct = 92.5 + (af_ratio - self.mix_best_ec)/(self.mix_max_p - self.mix_best_ec) * 7.5 # 100% at mix_max_p
     else:
       pct = 100.0 - (self.mix_max_p - af_ratio) * 2
-    print("Percent of max power is ", pct)
+    if self.verbose:
+      print("Percent of max power is ", pct)
     max_power *= pct / 100.0
 
     max_torque = max_power / convert.rpmtoradpersecond(self.max_rpm)
@@ -86,7 +90,8 @@ class PistonEngine:
     frict_c = 2.0e-5
     frict_torque = frict_a + frict_b * self.rpm + frict_c * self.rpm * self.rpm
 
-    print(f"Engine {engine_torque:.2f} Prop {prop_torque:.2f} Frict {frict_torque:.2f}")
+    if self.verbose:
+      print(f"Engine {engine_torque:.2f} Prop {prop_torque:.2f} Frict {frict_torque:.2f}")
     ang_acc = (engine_torque - prop_torque - frict_torque) / self.moi
     self.rpm += convert.radpersecondtorpm(ang_acc) * self.delta_t
 
@@ -0,0 +1,86 @@
+#
+# Quality governor
+# Watches how long frames take to draw, and turns the rendering quality
+# down when they run long, and back up when there is time to spare, so the
+# frame rate, which the physics is tied to, holds steady on slower machines.
+#  - It goes by a high percentile of the last few dozen frame times, so one
+#    slow frame (eg: a garbage collection) makes no difference, but a run of
+#    them does
+#  - Hysteresis: quality drops when the percentile is over high of the
+#    frame budget, but only comes back once it is under low, well short of
+#    it.  After any change it waits for a window of frames at the new level
+#    before deciding again.
+#  - Level 0 is full quality.  Each renderer attaches the knobs it has, and
+#    every knob is set to its value for the current level.
+#
+
+import collections
+
+# Knob settings, best quality first
+levels            = 5
+world_lod_bias    = [1.0, 0.7, 0.5, 0.35, 0.25] # Distance detail is drawn to
+world_dot_density = [1.0, 0.7, 0.5, 0.35, 0.25] # Distance dots are thinned from
+world_res_bias    = [1.0, 1.0, 0.8, 0.65, 0.5]  # Fraction of resolution drawn at
+panel_max_hz      = [None, 8, 5, 3, 2]          # Cap on gauge redraw rates
+
+class Governor:
+
+  # Params: budget - seconds a frame ought to take
+  #         best, worst - range of levels it may use
+  #         low, high - fractions of budget to raise and lower quality at
+  #         window - frames to take the percentile over
+  #         percentile - which one, 0 to 100
+  def __init__(self, budget, best=0, worst=levels - 1, low=0.6, high=0.9, window=30, percentile=90):
+    self.budget     = budget
+    self.best       = max(0, min(best, levels - 1))
+    self.worst      = max(self.best, min(worst, levels - 1))
+    self.low        = low
+    self.high       = high
+    self.percentile = percentile
+    self.times      = collections.deque(maxlen=window)
+    self.knobs      = [] # (function(value) setting the knob, value at each level)
+    self.level      = self.best
+    self.changes    = 0
+
+  # Add a knob, and set it for the current level
+  # Params: setter - function(value)
+  #         values - value at each level, best first
+  def attach(self, setter, values):
+    self.knobs.append((setter, values))
+    setter(values[self.level])
+
+  # Knobs of an out-the-window view
+  def attach_world(self, world):
+    self.attach(lambda v: setattr(world, 'lod_bias', v), world_lod_bias)
+    self.attach(lambda v: setattr(world, 'dot_density', v), world_dot_density)
+    self.attach(world.set_res_bias, world_res_bias)
+
+  # Knobs of an instrument panel
+  def attach_panel(self, panel):
+    self.attach(panel.set_max_hz, panel_max_hz)
+
+  # Record how long a frame took, and change level if need be
+  # Params: seconds - time spent on the frame, not counting waiting for the
+  #                   next one
+  # Returns True if the level changed
+  def frame(self, seconds):
+    self.times.append(seconds)
+    if len(self.times) < self.times.maxlen:
+      return False
+    times = sorted(self.times)
+    t = times[min(len(times) * self.percentile // 100, len(times) - 1)]
+    if t > self.budget * self.high and self.level < self.worst:
+      self.set_level(self.level + 1)
+      return True
+    if t < self.budget * self.low and self.level > self.best:
+      self.set_level(self.level - 1)
+      return True
+    return False
+
+  # Set every knob for a level, and start measuring afresh
+  def set_level(self, level):
+    self.level = level
+    self.changes += 1
+    for (setter, values) in self.knobs:
+      setter(values[level])
+    self.times.clear()
@@ -0,0 +1,255 @@
+#
+# Multiprocess rendering
+# The instrument panel and the out-the-window view share nothing but the aircraft
+# state, so each can be drawn by its own process, on its own core.
+#  - The main process writes the state into a small shared struct, guarded
+#    by a sequence counter (a 'seqlock') so no locks are needed
+#  - Each renderer process draws into shared-memory pixel buffers
+#  - The main process blits the newest finished buffers onto the display
+#
+
+import os
+import time
+import atexit
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+
+import pipeline
+
+# Aircraft state shared between processes
+# Layout is float64: [seq, stop, snapshot fields ..., number of other
+# aircraft, their (n, e, z, roll, pitch, hdg) ...]
+# The writer makes seq odd while it is writing and even when done, so a
+# reader that sees an odd or changed seq knows its copy is torn and retries.
+class SharedState:
+
+  max_traffic = 64 # Other aircraft beyond this many aren't drawn
+
+  # Params: name - name of existing shared memory block, or None to create one
+  def __init__(self, name=None):
+    self.nscalars = len(pipeline.Snapshot._fields) - 1 # All but traffic
+    nfields = 2 + self.nscalars + 1 + self.max_traffic * 6
+    if name == None:
+      self.shm = shared_memory.SharedMemory(create=True, size=nfields * 8)
+    else:
+      self.shm = shared_memory.SharedMemory(name=name)
+    self.vals = np.ndarray((nfields,), dtype=np.float64, buffer=self.shm.buf)
+    if name == None:
+      self.vals[:] = 0.0
+    self.name = self.shm.name
+
+  # Publish a snapshot (main process only)
+  def write(self, snapshot):
+    traffic = snapshot.traffic[0:self.max_traffic]
+    end = 3 + self.nscalars
+    self.vals[0] += 1 # Odd - write in progress
+    self.vals[2:end - 1] = snapshot[:-1]
+    self.vals[end - 1] = len(traffic)
+    if len(traffic) > 0:
+      self.vals[end:end + len(traffic) * 6] = np.ravel(traffic)
+    self.vals[0] += 1 # Even - done
+
+  # Params: seq - sequence number of the last snapshot read
+  # Returns (seq, snapshot), or (seq, None) if there is nothing newer
+  def read(self, seq):
+    while True:
+      seq1 = self.vals[0]
+      if seq1 == seq:
+        return (seq, None)
+      if seq1 % 2 == 0:
+        end = 3 + self.nscalars
+        vals = self.vals[2:end].tolist()
+        count = min(int(vals.pop()), self.max_traffic)
+        traffic = tuple(map(tuple, self.vals[end:end + count * 6].reshape(-1, 6).tolist()))
+        if self.vals[0] == seq1:
+          return (seq1, pipeline.Snapshot(*vals, traffic))
+
+  def stop(self):
+    self.vals[1] = 1.0
+
+  def close(self):
+    del self.vals # Views must go before the memory can be released
+    self.shm.close()
+
+  def stopping(self):
+    return self.vals[1] != 0.0
+
+# Triple-buffered shared pixel buffers for one renderer
+# Control block is int64: [published, reading, seq]
+#  published - buffer holding the newest finished frame
+#  reading   - buffer the main process is blitting from
+#  seq       - incremented for every finished frame
+# The renderer always draws into the buffer that is neither, so it never
+# overwrites a frame that might still be on its way to the display.
+class SharedFrames:
+
+  # Params: size - (w, h) in pixels
+  #         name - name of existing shared memory block, or None to create one
+  def __init__(self, size, name=None):
+    (w, h) = size
+    self.size = size
+    self.framebytes = w * h * 4
+    total = 3 * 8 + 3 * self.framebytes
+    if name == None:
+      self.shm = shared_memory.SharedMemory(create=True, size=total)
+    else:
+      self.shm = shared_memory.SharedMemory(name=name)
+    self.ctrl = np.ndarray((3,), dtype=np.int64, buffer=self.shm.buf)
+    if name == None:
+      self.ctrl[:] = (0, 0, 0)
+    self.name = self.shm.name
+    # Surfaces drawing straight into (or blitting straight out of) shared memory
+    self.surfaces = [pygame.image.frombuffer(self.shm.buf[24 + i * self.framebytes:24 + (i + 1) * self.framebytes],
+                                             size, 'BGRA')
+                     for i in range(0, 3)]
+
+  # Buffer for the renderer to draw the next frame into
+  def back(self):
+    busy = (self.ctrl[0], self.ctrl[1])
+    return [i for i in range(0, 3) if i not in busy][0]
+
+  # Mark buffer i as the newest finished frame (renderer)
+  def publish(self, i):
+    self.ctrl[0] = i
+    self.ctrl[2] += 1
+
+  def close(self):
+    del self.ctrl
+    self.surfaces = []
+    self.shm.close()
+
+  # Claim the newest finished frame for blitting (main process)
+  # Returns index of the buffer
+  def acquire(self):
+    while True:
+      i = self.ctrl[0]
+      self.ctrl[1] = i
+      if self.ctrl[0] == i: # Still newest, so the renderer won't pick it
+        return i
+
+# Body of a renderer process
+# Params: kind - 'steam', 'pfd' or 'world'
+#         size - (w, h) of the renderer's area of the display
+#         state_name, frames_name - shared memory blocks to attach to
+#         limits - arguments for the quality Governor, or None for none
+#         views - viewports to split the world view into
+def render_worker(kind, size, state_name, frames_name, limits=None, views=1):
+  os.environ['SDL_VIDEODRIVER'] = 'dummy'
+  pygame.init()
+  pygame.display.set_mode((1, 1))
+
+  import compositor
+  state  = SharedState(state_name)
+  frames = SharedFrames(size, frames_name)
+  for i in range(0, 3):
+    frames.surfaces[i].fill((0, 0, 0)) # Opaque, so the main process can blit without blending
+  target = compositor.Compositor(frames.surfaces[0])
+  if kind == 'steam':
+    import steam
+    renderer = steam.Steam(target, (0, 0), size)
+  elif kind == 'pfd':
+    import pfd
+    renderer = pfd.PFD(target, (0, 0), size)
+  else:
+    import world
+    import camera
+    renderer = world.World(target, (0, 0), size, views)
+  quality = None
+  if limits != None:
+    import governor
+    quality = governor.Governor(**limits)
+    if kind == 'world':
+      quality.attach_world(renderer)
+    else:
+      quality.attach_panel(renderer)
+
+  full = pygame.Rect((0, 0), size)
+  seq = 0
+  while not state.stopping():
+    (seq, s) = state.read(seq)
+    if s == None:
+      time.sleep(0.001)
+      continue
+    start = time.perf_counter()
+    back = frames.back()
+    target.display = frames.surfaces[back]
+    if kind != 'world':
+      renderer.draw(s.roll, s.pitch, s.hdg, s.yaw_d, s.x_d, s.z_world, s.z_d_world,
+                    s.aileron, s.elevator, s.rudder, s.throttle, s.mixture, s.flap, s.autorudder,
+                    s.y_dd, s.alpha, s.rpm, s.fuel_flow, s.egt, s.fuel_left, s.fuel_right)
+    else:
+      renderer.smooth = s.smooth
+      renderer.set_resolution(s.resolution)
+      renderer.show(*camera.for_snapshot(s))
+    if len(target.dirty) > 0: # Nothing to publish if nothing was drawn
+      if kind != 'world' and target.dirty != [full]:
+        # Only part was redrawn, and this buffer is a few frames old, so
+        # bring the rest of it up to date too.  The world is redrawn whole
+        # every frame.
+        target.display.blit(renderer.imgbuf, (0, 0))
+      target.dirty = []
+      frames.publish(back)
+    if quality != None:
+      quality.frame(time.perf_counter() - start)
+
+  target.display = None
+  state.close()
+  frames.close()
+
+# One renderer process and its pixel buffers, as seen from the main process
+class RenderProcess:
+
+  # Params: kind - 'steam', 'pfd' or 'world'
+  #         state - SharedState to render from
+  #         offset, size - area of the display to draw in
+  #         limits - arguments for the renderer's quality Governor, or None
+  #         views - viewports to split a world view into
+  def __init__(self, kind, state, offset, size, limits=None, views=1):
+    self.offset = offset
+    self.frames = SharedFrames(size)
+    self.seq    = 0
+    ctx = multiprocessing.get_context('spawn')
+    self.process = ctx.Process(target=render_worker, daemon=True,
+                               args=(kind, size, state.name, self.frames.name, limits, views))
+    self.process.start()
+
+  # Blit the newest frame onto the display, if there is one we haven't shown
+  def composite(self, compositor):
+    if self.frames.ctrl[2] != self.seq:
+      self.seq = self.frames.ctrl[2]
+      compositor.blit(self.frames.surfaces[self.frames.acquire()], self.offset)
+
+# The whole multiprocess renderer: an instrument panel process and a world
+# process
+class MultiProcessRenderer:
+
+  # Params: panel_area, world_area - ((x, y), (w, h)) for each renderer
+  #         panel - 'steam' or 'pfd'
+  #         limits - arguments for each renderer's quality Governor, or None
+  #         views - viewports to split the world view into
+  def __init__(self, panel_area, world_area, panel='steam', limits=None, views=1):
+    self.state = SharedState()
+    self.renderers = [RenderProcess(panel, self.state, *panel_area, limits),
+                      RenderProcess('world', self.state, *world_area, limits, views)]
+    atexit.register(self.close)
+
+  # Hand a new snapshot to the renderers and composite whatever they have
+  # finished.  Renderers run a frame behind the main process.
+  def render(self, snapshot, compositor):
+    self.state.write(snapshot)
+    for r in self.renderers:
+      r.composite(compositor)
+
+  def close(self):
+    if len(self.renderers) == 0:
+      return
+    self.state.stop()
+    for r in self.renderers:
+      r.process.join(timeout=1.0)
+      r.frames.close()
+      r.frames.shm.unlink()
+    self.renderers = []
+    self.state.close()
+    self.state.shm.unlink()
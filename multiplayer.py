@@ -0,0 +1,432 @@
+#!/usr/bin/python3
+
+#
+# Multiplayer
+# Several simulators share a sky through a relay server, over UDP.
+#  - Each client sends its own aircraft to the server at a fixed rate, and
+#    the server sends each client everyone else's, up to a fixed packet
+#    size.  When they don't all fit, the ones left out wait their turn, and
+#    nearer ones come round more often.
+#  - States are quantized to integers, and only the differences from the
+#    last state the other end acknowledged are sent, as variable length
+#    integers.  A lost packet just means the next one is against an older
+#    baseline, so nothing is ever resent.
+#  - Between packets other aircraft are dead-reckoned from their rates,
+#    and the jump when a packet arrives is blended away
+#  - The client's networking runs on its own thread, with asyncio, so the
+#    simulator never waits for the network
+#
+# Run the server with:  python3 multiplayer.py [--port PORT]
+#
+
+import math
+import time
+import struct
+import asyncio
+import argparse
+import threading
+import collections
+
+default_port = 7400
+
+# Packet header: magic, kind, seq, ack, baseline
+# seq numbers the sender's packets, ack is the newest seq received from the
+# other end, and baseline is the seq of the state the contents are relative
+# to.  0 means none.
+# A state packet is then the client's state.  A snapshot packet is a count
+# of aircraft, a flag set if that is all of them, and for each one its id
+# and state.
+header = struct.Struct('<2sBHHH')
+magic  = b'FS'
+kind_state    = 1 # Client to server: the client's aircraft
+kind_snapshot = 2 # Server to client: everyone else's
+kind_bye      = 3 # Client to server: leaving
+
+# Fields of an aircraft's state, and how many steps per unit they are
+# quantized to.  Angles are fractions of a turn, so they wrap.
+fields = ['n', 'e', 'z', 'vn', 've', 'vz', 'roll', 'pitch', 'hdg', 'roll_d', 'pitch_d', 'hdg_d']
+scales = [32.0, 32.0, 32.0,                      # 1/32 m
+          64.0, 64.0, 64.0,                      # 1/64 m/s
+          65536 / (2 * math.pi), 65536 / (2 * math.pi), 65536 / (2 * math.pi),
+          1024.0, 1024.0, 1024.0]                # 1/1024 rad/s
+wraps  = [None] * 6 + [65536] * 3 + [None] * 3
+zeros  = (0,) * len(fields)
+
+history   = 64   # States kept to use as baselines
+max_bytes = 1200 # Largest packet, to stay clear of fragmentation
+near      = 1000.0 # Metres.  Aircraft this close are sent twice as often as far ones.
+
+# Next sequence number, skipping 0
+def next_seq(seq):
+  return seq % 65535 + 1
+
+# True if seq a is newer than b, allowing for wrap-around
+def newer(a, b):
+  return b == 0 or (a != b and (a - b) % 65536 < 32768)
+
+# Returns state as a tuple of ints
+def quantize(state):
+  return tuple(round(v * s) % w if w != None else round(v * s) for (v, s, w) in zip(state, scales, wraps))
+
+def dequantize(q):
+  return tuple(v / s for (v, s) in zip(q, scales))
+
+# Encode the difference between two quantized states: a mask of the fields
+# that changed, then zigzag varints of how much
+def encode(state, base):
+  mask = 0
+  out = bytearray(2)
+  for (i, (v, b, w)) in enumerate(zip(state, base, wraps)):
+    d = v - b
+    if w != None:
+      d = (d + w // 2) % w - w // 2 # Shortest way round
+    if d != 0:
+      mask |= 1 << i
+      z = d * 2 if d >= 0 else -d * 2 - 1
+      while z >= 0x80:
+        out.append((z & 0x7f) | 0x80)
+        z >>= 7
+      out.append(z)
+  struct.pack_into('<H', out, 0, mask)
+  return bytes(out)
+
+# Returns (state, position after it)
+def decode(buf, pos, base):
+  (mask,) = struct.unpack_from('<H', buf, pos)
+  pos += 2
+  state = list(base)
+  for (i, w) in enumerate(wraps):
+    if mask & (1 << i):
+      z = 0
+      shift = 0
+      while True:
+        b = buf[pos]
+        pos += 1
+        z |= (b & 0x7f) << shift
+        shift += 7
+        if b < 0x80:
+          break
+      d = z // 2 if z % 2 == 0 else -(z + 1) // 2
+      state[i] += d
+      if w != None:
+        state[i] %= w
+  return (tuple(state), pos)
+
+# Dict that forgets its oldest entries beyond size
+class History(collections.OrderedDict):
+
+  def __init__(self, size=history):
+    super().__init__()
+    self.size = size
+
+  def __setitem__(self, key, value):
+    super().__setitem__(key, value)
+    while len(self) > self.size:
+      self.popitem(last=False)
+
+##############################################################################
+# Server
+##############################################################################
+
+# What the server knows about one client
+class Peer:
+
+  def __init__(self, id, addr):
+    self.id       = id
+    self.addr     = addr
+    self.seq      = 0       # Newest seq received from it
+    self.acked    = 0       # Newest of our seqs it has received
+    self.out_seq  = 0       # Our last seq to it
+    self.state    = None    # Its newest quantized state
+    self.received = History() # Its states, by its seq
+    self.sent     = History() # What we sent it, {id: state}, by our seq
+    self.priority = {}      # How overdue each other client is, by id
+    self.heard    = 0.0     # When we last heard from it
+
+class Server(asyncio.DatagramProtocol):
+
+  # Params: rate - snapshots per second to each client
+  #         timeout - seconds of silence before a client is dropped
+  def __init__(self, rate=20, timeout=5.0):
+    self.rate    = rate
+    self.timeout = timeout
+    self.peers   = {} # By address
+    self.next_id = 1
+    self.bytes_out = 0
+
+  def connection_made(self, transport):
+    self.transport = transport
+    self.ticker = asyncio.get_running_loop().create_task(self.tick())
+
+  def datagram_received(self, data, addr):
+    try:
+      (m, kind, seq, ack, base) = header.unpack_from(data)
+    except struct.error:
+      return
+    if m != magic or kind not in (kind_state, kind_bye):
+      return
+    if kind == kind_bye:
+      self.peers.pop(addr, None)
+      return
+    peer = self.peers.get(addr)
+    if peer == None:
+      peer = Peer(self.next_id, addr)
+      self.next_id = next_seq(self.next_id)
+      self.peers[addr] = peer
+    if not newer(seq, peer.seq):
+      return # Old or duplicate
+    baseline = zeros if base == 0 else peer.received.get(base)
+    if baseline == None:
+      return # Can't decode it, the next one will be against a newer baseline
+    try:
+      (state, pos) = decode(data, header.size, baseline)
+    except (IndexError, struct.error):
+      return
+    peer.received[seq] = state
+    peer.seq   = seq
+    peer.state = state
+    peer.heard = time.monotonic()
+    if ack != 0 and newer(ack, peer.acked):
+      peer.acked = ack
+
+  # Send every client a snapshot of the others, rate times a second
+  async def tick(self):
+    deadline = time.monotonic()
+    while True:
+      now = time.monotonic()
+      entries = {} # Clients mostly acknowledge the same snapshots, so share
+                   # the encoding of each aircraft against each baseline
+      for (addr, peer) in list(self.peers.items()):
+        if now - peer.heard > self.timeout:
+          del self.peers[addr]
+        elif peer.state != None:
+          self.send_snapshot(peer, entries)
+      deadline += 1.0 / self.rate
+      await asyncio.sleep(max(deadline - time.monotonic(), 0.0))
+
+  # The other clients, against the last snapshot this client acknowledged,
+  # most overdue first, until the packet is full
+  # Params: entries - encoded aircraft, by (id, id of baseline state), to
+  #                   share between clients
+  def send_snapshot(self, peer, entries):
+    (n, e, z) = peer.state[0:3]
+    others = [p for p in self.peers.values() if p is not peer and p.state != None]
+    priority = {}
+    for p in others:
+      d = math.sqrt((p.state[0] - n) ** 2 + (p.state[1] - e) ** 2 + (p.state[2] - z) ** 2) / scales[0]
+      priority[p.id] = peer.priority.get(p.id, 0.0) + 1.0 / (1.0 + d / near)
+    others.sort(key=lambda p: priority[p.id], reverse=True)
+    base = peer.acked if peer.acked in peer.sent else 0
+    baseline = peer.sent.get(base, {})
+    peer.out_seq = next_seq(peer.out_seq)
+
+    body = []
+    size = header.size + 2
+    included = {}
+    for p in others[0:255]:
+      b = baseline.get(p.id, zeros)
+      entry = entries.get((p.id, id(b)))
+      if entry == None:
+        entry = entries[(p.id, id(b))] = struct.pack('<H', p.id) + encode(p.state, b)
+      if size + len(entry) > max_bytes:
+        break
+      body.append(entry)
+      size += len(entry)
+      included[p.id] = p.state
+      priority[p.id] = 0.0
+    peer.sent[peer.out_seq] = included
+    peer.priority = priority
+
+    complete = len(body) == len(others) # Everyone else is in it
+    packet = (header.pack(magic, kind_snapshot, peer.out_seq, peer.seq, base) +
+              bytes([len(body), complete]) + b''.join(body))
+    self.transport.sendto(packet, peer.addr)
+    self.bytes_out += len(packet)
+
+##############################################################################
+# Client
+##############################################################################
+
+# Another aircraft, as last heard of
+class Remote:
+
+  blend_time = 0.5 # Seconds to blend away the jump when a new state arrives
+  max_extrapolation = 2.0 # Seconds to dead-reckon for before stopping
+
+  def __init__(self, state, now):
+    self.state = state
+    self.t     = now
+    self.error = (0.0, 0.0, 0.0)
+
+  def update(self, state, now):
+    shown = self.position(now)
+    self.state = state
+    self.t     = now
+    self.error = tuple(a - b for (a, b) in zip(shown[0:3], state[0:3]))
+
+  # Dead-reckoned (n, e, z, roll, pitch, hdg) at time now
+  def position(self, now):
+    (n, e, z, vn, ve, vz, roll, pitch, hdg, roll_d, pitch_d, hdg_d) = self.state
+    age = min(now - self.t, self.max_extrapolation)
+    blend = max(1.0 - (now - self.t) / self.blend_time, 0.0)
+    (en, ee, ez) = self.error
+    return (n + vn * age + en * blend,
+            e + ve * age + ee * blend,
+            max(z + vz * age + ez * blend, 0.0),
+            roll + roll_d * age, pitch + pitch_d * age, hdg + hdg_d * age)
+
+class Client(asyncio.DatagramProtocol):
+
+  # Params: host, port - the server
+  #         rate - states per second to send
+  #         timeout - seconds before forgetting an aircraft not heard of
+  def __init__(self, host, port=default_port, rate=20, timeout=5.0):
+    self.rate    = rate
+    self.timeout = timeout
+    self.lock    = threading.Lock()
+    self.latest  = None  # Our newest quantized state, to send
+    self.last    = None  # (t, n, e, z, roll, pitch, hdg) of the last update()
+    self.rates   = (0.0,) * 6
+    self.seq     = 0     # Our last seq sent
+    self.acked   = 0     # Newest of our seqs the server has received
+    self.sent    = History() # Our states, by our seq
+    self.server_seq = 0  # Newest seq received from the server
+    self.received = History() # Snapshots from the server, {id: state}, by its seq
+    self.remotes = {}    # Remote aircraft, by id
+    self.bytes_out = 0
+    self.bytes_in  = 0
+
+    self.loop = asyncio.new_event_loop()
+    self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+    self.thread.start()
+    asyncio.run_coroutine_threadsafe(self.start(host, port), self.loop).result()
+
+  async def start(self, host, port):
+    await self.loop.create_datagram_endpoint(lambda: self, remote_addr=(host, port))
+    self.ticker = self.loop.create_task(self.tick())
+
+  def connection_made(self, transport):
+    self.transport = transport
+
+  def error_received(self, exc):
+    pass # eg: server not running yet.  Keep trying.
+
+  # Our aircraft's new position (simulator thread)
+  # Rates for dead-reckoning are worked out from successive positions.
+  # Params: t - simulation time
+  def update(self, t, n, e, z, roll, pitch, hdg):
+    if self.last != None:
+      (t0, n0, e0, z0, roll0, pitch0, hdg0) = self.last
+      dt = t - t0
+      if dt > 0.0:
+        turn = lambda a, b: ((a - b + math.pi) % (2 * math.pi) - math.pi) / dt
+        self.rates = ((n - n0) / dt, (e - e0) / dt, (z - z0) / dt,
+                      turn(roll, roll0), turn(pitch, pitch0), turn(hdg, hdg0))
+    self.last = (t, n, e, z, roll, pitch, hdg)
+    (vn, ve, vz, roll_d, pitch_d, hdg_d) = self.rates
+    state = quantize((n, e, z, vn, ve, vz, roll, pitch, hdg, roll_d, pitch_d, hdg_d))
+    with self.lock:
+      self.latest = state
+
+  # Other aircraft, dead-reckoned to now (simulator thread)
+  # Returns tuple of (n, e, z, roll, pitch, hdg)
+  def traffic(self):
+    now = time.monotonic()
+    with self.lock:
+      return tuple(r.position(now) for r in self.remotes.values())
+
+  # Send our state, rate times a second
+  async def tick(self):
+    deadline = time.monotonic()
+    while True:
+      with self.lock:
+        state = self.latest
+        now = time.monotonic()
+        for (id, r) in list(self.remotes.items()):
+          if now - r.t > self.timeout:
+            del self.remotes[id]
+      if state != None:
+        base = self.acked if self.acked in self.sent else 0
+        self.seq = next_seq(self.seq)
+        self.sent[self.seq] = state
+        packet = (header.pack(magic, kind_state, self.seq, self.server_seq, base) +
+                  encode(state, self.sent.get(base, zeros)))
+        self.transport.sendto(packet)
+        self.bytes_out += len(packet)
+      deadline += 1.0 / self.rate
+      await asyncio.sleep(max(deadline - time.monotonic(), 0.0))
+
+  def datagram_received(self, data, addr):
+    try:
+      (m, kind, seq, ack, base) = header.unpack_from(data)
+      if m != magic or kind != kind_snapshot or not newer(seq, self.server_seq):
+        return
+      baseline = {} if base == 0 else self.received.get(base)
+      if baseline == None:
+        return
+      (count, complete) = data[header.size:header.size + 2]
+      pos = header.size + 2
+      snapshot = {}
+      for i in range(0, count):
+        (id,) = struct.unpack_from('<H', data, pos)
+        (snapshot[id], pos) = decode(data, pos + 2, baseline.get(id, zeros))
+    except (IndexError, struct.error):
+      return
+
+    self.bytes_in += len(data)
+    self.received[seq] = snapshot
+    self.server_seq = seq
+    if ack != 0 and newer(ack, self.acked):
+      self.acked = ack
+    now = time.monotonic()
+    with self.lock:
+      for (id, q) in snapshot.items():
+        state = dequantize(q)
+        r = self.remotes.get(id)
+        if r == None:
+          self.remotes[id] = Remote(state, now)
+        else:
+          r.update(state, now)
+      if complete:
+        for id in [id for id in self.remotes if id not in snapshot]:
+          del self.remotes[id] # Gone
+
+  # Tell the server we're leaving, and stop
+  def close(self):
+    try:
+      asyncio.run_coroutine_threadsafe(self.leave(), self.loop).result(timeout=1.0)
+    finally:
+      self.loop.call_soon_threadsafe(self.loop.stop)
+      self.thread.join(timeout=1.0)
+
+  async def leave(self):
+    self.ticker.cancel()
+    try:
+      await self.ticker
+    except asyncio.CancelledError:
+      pass
+    self.transport.sendto(header.pack(magic, kind_bye, next_seq(self.seq), self.server_seq, 0))
+    self.transport.close()
+
+# Run a server until interrupted
+async def serve(port, rate):
+  loop = asyncio.get_running_loop()
+  (transport, server) = await loop.create_datagram_endpoint(lambda: Server(rate), local_addr=('0.0.0.0', port))
+  print(f"Multiplayer server on UDP port {port:d}")
+  try:
+    while True:
+      await asyncio.sleep(10)
+      print(f"{len(server.peers):d} aircraft, {server.bytes_out / 10 / 1024:.1f} KiB/s out")
+      server.bytes_out = 0
+  finally:
+    transport.close()
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Flight simulator multiplayer server')
+  parser.add_argument('--port', type=int, default=default_port, help=f"UDP port (default: {default_port:d})")
+  parser.add_argument('--rate', type=int, default=20, help='snapshots per second to each client (default: 20)')
+  args = parser.parse_args()
+  try:
+    asyncio.run(serve(args.port, args.rate))
+  except KeyboardInterrupt:
+    pass
@@ -0,0 +1,179 @@
+#
+# Instrument panel
+# What the steam panel and the PFD have in common: scaling with the panel
+# size, cached gauge faces and labels, and redrawing only the gauges that
+# have changed.
+#
+
+import math
+import time
+import pygame
+import convert
+import textcache
+
+# An instrument on a panel
+# It is redrawn only when its needles would move by threshold pixels or
+# more, and no more than hz times a second.
+class Gauge:
+
+  # Params: draw - function() drawing the gauge on the panel
+  #         rect - area of the panel the gauge covers
+  #         inputs - function() returning the positions of the gauge's
+  #                  needles, or anything else that moves, in pixels
+  #         threshold - movement in pixels worth redrawing for
+  #         hz - maximum redraw rate, or None for every frame
+  #         opaque - if True, draw() covers all of rect, so it isn't cleared
+  #                  first
+  def __init__(self, draw, rect, inputs, threshold=1.0, hz=None, opaque=False):
+    self.draw      = draw
+    self.rect      = pygame.Rect(rect)
+    self.inputs    = inputs
+    self.threshold = threshold
+    self.interval  = 0.0 if hz == None else 1.0 / hz
+    self.opaque    = opaque
+    self.key       = None # Quantized inputs when last drawn
+    self.drawn     = -math.inf # Time when last drawn
+
+  # Inputs, rounded to the threshold
+  def quantize(self):
+    return tuple(int(round(v / self.threshold)) for v in self.inputs())
+
+# Base class for panels.  Subclasses lay out their gauges in layout().
+class Panel:
+
+  background   = (128,128,128)
+  min_interval = 0.0 # Shortest time between redraws of any gauge
+
+  def __init__(self, compositor, offset, size):
+    self.compositor = compositor
+    self.offset  = offset
+    self.black   = (0,0,0)
+    self.white   = (255,255,255)
+    self.grey    = (128,128,128)
+    self.brown   = (0x98,0x76,0x54)
+    self.blue    = (0x95,0xcb,0xdb)
+    self.magenta = (255,0,255)
+    self.red     = (255,0,0)
+    self.yellow  = (255,255,0)
+    self.green   = (0,255,0)
+    self.resize(size)
+
+  # Set the size of the panel.  Everything scales with it.
+  def resize(self, size):
+    (sx, sy)     = size
+    self.xscale  = sx / 800 # Used for rescaling UI
+    self.yscale  = sy / 700 # Used for rescaling UI
+    self.size    = size
+
+    self.font32  = pygame.font.Font('freesansbold.ttf', self.rescale_y(32))
+    self.font24  = pygame.font.Font('freesansbold.ttf', self.rescale_y(24))
+    self.font16  = pygame.font.Font('freesansbold.ttf', self.rescale_y(16))
+    self.imgbuf  = pygame.Surface(size)
+    self.faces   = {}   # Static gauge faces, drawn at this size
+    self.text    = textcache.TextCache() # Labels, in these fonts
+    self.inputs  = None # Inputs for the last frame drawn
+    self.pending = True # Gauges changed but held back by their refresh rate
+    self.imgbuf.fill(self.background)
+    self.gauges  = self.layout()
+
+  # Draw the panel.  Main entry point.
+  def draw(self, roll, pitch, hdg, yaw_d, x_d, z_world, z_d_world,
+           aileron, elevator, rudder, throttle, mixture, flap, autorudder, y_dd, alpha,
+           rpm, fuel_flow, egt, fuel_left, fuel_right):
+    inputs = (roll, pitch, hdg, yaw_d, x_d, z_world, z_d_world,
+              aileron, elevator, rudder, throttle, mixture, flap, autorudder, y_dd, alpha,
+              rpm, fuel_flow, egt, fuel_left, fuel_right)
+
+    self.roll      = roll
+    self.pitch     = pitch
+    self.hdg       = hdg
+    self.turnrate  = yaw_d
+    self.sideslip  = y_dd
+    self.alpha     = alpha
+    self.airspeed  = convert.speedtoknots(x_d)
+    self.roc       = convert.speedtofeetpermin(z_d_world)
+    self.altitude  = convert.metrestofeet(z_world)
+    self.rpm       = rpm
+    self.fuel_flow = fuel_flow
+    self.egt       = egt
+    self.fuel_left = fuel_left
+    self.fuel_right= fuel_right
+
+    self.aileron    = aileron
+    self.elevator   = elevator
+    self.rudder     = rudder
+    self.throttle   = throttle
+    self.mixture    = mixture
+    self.flap       = flap
+    self.autorudder = autorudder
+
+    self.sin_roll = math.sin(roll)
+    self.cos_roll = math.cos(roll)
+
+    self.redraw(inputs)
+
+  # Cap the redraw rate of every gauge, to save time on slow machines
+  # Params: hz - maximum redraw rate, or None for no cap
+  def set_max_hz(self, hz):
+    self.min_interval = 0.0 if hz == None else 1.0 / hz
+
+  # Returns list of Gauges on the panel
+  def layout(self):
+    return []
+
+  def rescale_x(self, pixels):
+    return int(round(pixels * self.xscale))
+
+  def rescale_y(self, pixels):
+    return int(round(pixels * self.yscale))
+
+  # Blit the static face of a gauge - bezel, scale, labels - drawing it
+  # first if it isn't cached yet.  Only the needles are drawn every frame.
+  # Params: name - name of gauge, key for the cache
+  #         x, y - top left of gauge
+  #         w, h - size of gauge
+  #         draw_face - function(surf, x, y, *args) drawing the face with
+  #                     the gauge at (x, y) on surf
+  #         colorkey - if set, the face is see-through where it is this
+  #                    colour.  For faces that go over moving parts.
+  def blit_face(self, name, x, y, w, h, draw_face, *args, colorkey=None):
+    (ix, iy) = (int(x), int(y))
+    face = self.faces.get(name)
+    if face == None:
+      face = pygame.Surface((int(w) + 3, int(h) + 3))
+      face.fill(self.background if colorkey == None else colorkey)
+      face.set_colorkey(colorkey)
+      draw_face(face, x - ix, y - iy, *args) # Same sub-pixel position as on the panel
+      if colorkey != None:
+        face.set_colorkey(colorkey, pygame.RLEACCEL) # Mostly see-through, and never drawn on again
+      self.faces[name] = face
+    self.imgbuf.blit(face, (ix, iy))
+
+  # Redraw the gauges that have changed, and pass just those on
+  # Params: inputs - everything the panel shows, to skip unchanged frames
+  def redraw(self, inputs):
+    if inputs == self.inputs and not self.pending:
+      return
+
+    (ox, oy) = self.offset
+    now = time.perf_counter()
+    first = self.inputs == None
+    self.pending = False
+    for g in self.gauges:
+      key = g.quantize()
+      if key == g.key:
+        continue
+      if now - g.drawn < max(g.interval, self.min_interval):
+        self.pending = True # Come back for it
+        continue
+      g.key   = key
+      g.drawn = now
+      if not g.opaque:
+        self.imgbuf.fill(self.background, g.rect)
+      g.draw()
+      if not first:
+        self.compositor.blit(self.imgbuf, (ox + g.rect.x, oy + g.rect.y), g.rect)
+    if first:
+      (sx, sy) = self.size
+      self.compositor.blit(self.imgbuf, self.offset, (0, 0, sx, sy)) # Blit buffer to real display
+    self.inputs = inputs
@@ -9,248 +9,390 @@
 import math
 import pygame
 import convert
+import panel
+import cardatlas
+
+# A scrolling tape, drawn once into a tall strip
+# Each frame is a blit of the part of the strip around the current value.
+class Tape:
+
+  # Params: strip - the tape, highest value at the top
+  #         top - value at the top row of the strip
+  #         scale - pixels per unit
+  #         lo, hi - range of values the tape can show
+  def __init__(self, strip, top, scale, lo, hi):
+    self.strip = strip
+    self.top   = top
+    self.scale = scale
+    self.lo    = lo
+    self.hi    = hi
+
+  # Blit the window of the tape centred on value into rect of dest
+  def blit(self, dest, rect, value):
+    value = min(max(value, self.lo), self.hi)
+    row = (self.top - value) * self.scale - rect.h / 2
+    dest.blit(self.strip, rect.topleft, (0, row, rect.w, rect.h))
 
 # Primary flight display (PFD)
-class PFD:
-
-  # Initialize graphics for PFD
-  def __init__(self, display, offset, size):
-    self.display = display
-    self.offset  = offset
-    (sx, sy)     = size
-    self.xscale  = sx / 800 # Used for rescaling UI
-    self.yscale  = sy / 700 # Used for rescaling UI
-    self.size    = size
-    
-    self.font32  = pygame.font.Font('freesansbold.ttf', self.rescale_y(32))
-    self.font24  = pygame.font.Font('freesansbold.ttf', self.rescale_y(24))
-    self.font16  = pygame.font.Font('freesansbold.ttf', self.rescale_y(16))
-    self.black   = (0,0,0)
-    self.white   = (255,255,255)
-    self.grey    = (128,128,128)
-    self.brown   = (0x98,0x76,0x54)
-    self.blue    = (0x95,0xcb,0xdb)
-    self.magenta = (255,0,255)
-    self.red     = (255,0,0)
-    self.yellow  = (255,255,0)
-    self.pfdimgbuf = pygame.Surface(size)
-
-  def rescale_x(self, pixels):
-    return int(round(pixels * self.xscale))
-
-  def rescale_y(self, pixels):
-    return int(round(pixels * self.yscale))
-
-  # Draw compass rose with yaw rate arc above
-  def draw_rose(self, yaw_d):
+class PFD(panel.Panel):
+
+  background = (0,0,0)
+  tape_grey  = (64,64,64)
+  card_step  = 0.5 # Resolution of pre-rotated compass card, degrees
+
+  # Set the size of the PFD.  Everything scales with it.
+  def resize(self, size):
+    self.rose  = None # Compass card atlas, built on first use
+    self.tapes = {}   # Speed and altitude tapes, built on first use
+    super().resize(size)
+
+  # Place the displays on the PFD, left to right:
+  # controls and engine, speed tape, attitude, altitude tape, VSI, HSI
+  def layout(self):
     (w, h) = self.size
-    centx = w / 2          # Centre of compass rose - x
-    centy = w * 11/7       # Centre of compass rose - y
-    radius = w * 5/8       # Radius of compass rose
-    trradius = radius + self.rescale_x(10) # Radius of turn rate trend arc
-    arcwidth = self.rescale_x(5)
-  
-    # Yaw rate arc
-    if yaw_d > 0.0:
-      pygame.draw.arc(self.pfdimgbuf, self.magenta,
-                      (centx-trradius, centy-trradius, 2*trradius, 2*trradius),
-                      math.pi/2-yaw_d, math.pi/2, width=arcwidth)
-    else:
-      pygame.draw.arc(self.pfdimgbuf, self.magenta,
-                      (centx-trradius, centy-trradius, 2*trradius, 2*trradius),
-                      math.pi/2, math.pi/2-yaw_d, width=arcwidth)
-
-    pygame.draw.line(self.pfdimgbuf, self.white,
-                     (centx, centy-trradius-self.rescale_y(25)),
-                     (centx, centy-trradius+self.rescale_y(10)), self.rescale_x(7))
-  
-    # Compass rose
-    pygame.draw.circle(self.pfdimgbuf, self.grey, (centx, centy), radius, 0)
-    for h in range(0, 36):
-  
-      a = convert.degtorad(h * 10) - self.hdg
-      inner_rad = 0.9 if ((h % 2) == 1) else 0.975
+    m = self.rescale_y(10)
+    top = m
+    hh = h - 2 * m
+    widths = [hh * 0.55, hh * 0.22, hh * 1.0, hh * 0.26, hh * 0.1, hh * 0.8]
+    gap = m * 2
+    scale = min(1.0, (w - gap * (len(widths) + 1)) / sum(widths)) # Shrink to fit
+    widths = [int(x * scale) for x in widths]
+    x = (w - sum(widths) - gap * (len(widths) - 1)) // 2
+    rects = []
+    for wd in widths:
+      rects.append(pygame.Rect(x, top, wd, hh))
+      x += wd + gap
+    (ctl, spd, att, alt, vsi, hsi) = rects
+
+    # Controls at the top of the left column, then angle of attack and engine
+    th = self.font24.get_linesize()
+    ctl_rect = pygame.Rect(ctl.x, ctl.y, ctl.w, int(hh * 0.55))
+    alpha_rect = pygame.Rect(ctl.x, ctl_rect.bottom + m, ctl.w, th)
+    eng_rect = pygame.Rect(ctl.x, alpha_rect.bottom + m, ctl.w, ctl.bottom - alpha_rect.bottom - m)
+    ctl_size = min(ctl.w * 0.6, ctl_rect.h - th - m)
+    controls = panel.Gauge(lambda: self.draw_controls(ctl_rect, ctl_size), ctl_rect,
+                           lambda: (self.aileron * ctl_size / 2, self.elevator * ctl_size / 2,
+                                    self.rudder * ctl_size / 2, self.autorudder,
+                                    self.throttle * ctl_size, self.mixture * ctl_size,
+                                    self.flap > 0, int(self.flap * 10)))
+    alpha = panel.Gauge(lambda: self.draw_alpha(alpha_rect), alpha_rect,
+                        lambda: (math.degrees(self.alpha) * 10,), hz=10)
+    engine = panel.Gauge(lambda: self.draw_engine(eng_rect), eng_rect,
+                         lambda: (self.rpm, self.fuel_flow * 10, self.egt,
+                                  self.fuel_left * 10, self.fuel_right * 10), hz=2)
+
+    # Speed tape shows +/-40 knots, altitude tape +/-500 feet
+    spd_scale = hh / 80
+    alt_scale = hh / 1000
+    speed = panel.Gauge(lambda: self.draw_speed(spd, spd_scale), spd,
+                        lambda: (self.airspeed * spd_scale, int(self.airspeed)), opaque=True)
+    altitude = panel.Gauge(lambda: self.draw_altitude(alt, alt_scale), alt,
+                           lambda: (self.altitude * alt_scale, int(self.altitude)), opaque=True)
+
+    # Attitude shows +/-25 degrees of pitch
+    att_scale = hh / 50
+    attitude = panel.Gauge(lambda: self.draw_attitude(att, att_scale), att,
+                           lambda: (math.degrees(self.pitch) * att_scale,
+                                    self.roll * att.h / 2,
+                                    self.sideslip * self.rescale_y(20)), opaque=True)
+
+    # VSI shows +/-2000 feet per minute
+    vsi_scale = (hh / 2 - th) / 2000
+    vs = panel.Gauge(lambda: self.draw_vsi(vsi, vsi_scale), vsi,
+                     lambda: (max(min(self.roc, 2100), -2100) * vsi_scale,), opaque=True)
+
+    # HSI, with room around the card for the turn rate trend.  The card
+    # only turns by whole steps of the atlas, so heading is counted in those,
+    # and redrawing it is rate limited like the engine gauges.
+    hsi = pygame.Rect(hsi.x, hsi.y + (hsi.h - hsi.w) // 2, hsi.w, hsi.w)
+    radius = hsi.w / 2 - self.rescale_y(60)
+    heading = panel.Gauge(lambda: self.draw_hsi(hsi, radius), hsi,
+                          lambda: (math.degrees(self.hdg) / self.card_step,
+                                   int(math.degrees(self.hdg)), # Digital readout
+                                   self.turnrate * radius), hz=20)
+
+    return [controls, alpha, engine, speed, attitude, altitude, vs, heading]
+
+  # Draw control positions
+  def draw_controls(self, rect, size):
+    r5 = self.rescale_y(5)
+    r10 = self.rescale_y(10)
+    r20 = self.rescale_y(20)
+    (x, y) = rect.topleft
+    pygame.draw.rect(self.imgbuf, self.red, (x, y, size, size), 1)
+    pygame.draw.circle(self.imgbuf, self.red,
+                       (x+size/2+size/2*self.aileron, y+size/2+size/2*self.elevator), r10)
+    pygame.draw.circle(self.imgbuf, self.red,
+                       (x+size/2+size/2*self.rudder, y+size), r10, 1 if self.autorudder == True else 0)
+
+    # Throttle and mixture
+    x += size + r20
+    pygame.draw.rect(self.imgbuf, self.white, (x, y, r20, size), 1)
+    pygame.draw.rect(self.imgbuf, self.white, (x, y+size-size*self.throttle, r20, size*self.throttle))
+    x += r20 + r10
+    pygame.draw.rect(self.imgbuf, self.red, (x, y, r20, size), 1)
+    pygame.draw.rect(self.imgbuf, self.red, (x, y+size-size*self.mixture, r20, size*self.mixture))
+
+    if self.flap > 0:
+      text = self.text.render(self.font24, f"FLAPS {int(self.flap*10):d}", self.red, self.black)
+      self.imgbuf.blit(text, (rect.x, rect.y + size + r20 + r5))
+
+  # Angle of attack
+  def draw_alpha(self, rect):
+    text = self.text.render(self.font24, f"α={convert.radtodeg(self.alpha):+0.1f}°", self.magenta, self.black)
+    self.imgbuf.blit(text, rect.topleft)
+
+  # Engine and fuel readouts
+  def draw_engine(self, rect):
+    lines = [f"RPM  {self.rpm:4.0f}",
+             f"FF   {self.fuel_flow:4.1f} lb/hr",
+             f"EGT  {self.egt:4.0f}°F",
+             f"FUEL {self.fuel_left:4.1f} {self.fuel_right:4.1f} gal"]
+    y = rect.y
+    for t in lines:
+      text = self.text.render(self.font24, t, self.white, self.black)
+      self.imgbuf.blit(text, (rect.x, y))
+      y += self.font24.get_linesize()
+
+  # Draw a tape strip
+  # Params: w - width
+  #         lo, hi - range of values
+  #         scale - pixels per unit
+  #         margin - extra rows above and below the range
+  #         minor, major - step between short ticks, and long labelled ticks
+  #         left - if True, ticks are on the left edge, else the right
+  # Returns the Tape
+  def draw_tape(self, w, lo, hi, scale, margin, minor, major, left):
+    top = hi + margin / scale
+    h = int((hi - lo) * scale + 2 * margin)
+    strip = pygame.Surface((w, h), 0, self.imgbuf)
+    strip.fill(self.tape_grey)
+    short = w * 0.1
+    long = w * 0.2
+    v = lo
+    while v <= hi:
+      y = (top - v) * scale
+      l = long if v % major == 0 else short
+      if left:
+        pygame.draw.line(strip, self.white, (0, y), (l, y), 2)
+      else:
+        pygame.draw.line(strip, self.white, (w - l, y), (w, y), 2)
+      if v % major == 0:
+        text = self.font24.render(f"{v:d}", True, self.white, self.tape_grey)
+        textRect = text.get_rect()
+        if left:
+          textRect.midleft = (long * 1.5, y)
+        else:
+          textRect.midright = (w - long * 1.5, y)
+        strip.blit(text, textRect)
+      v += minor
+    return Tape(strip, top, scale, lo, hi)
+
+  # Box in the middle of a tape with the current value in it
+  def draw_readout(self, rect, value):
+    r4 = self.rescale_y(4)
+    text = self.text.render(self.font32, value, self.white, self.black)
+    box = text.get_rect().inflate(r4 * 2, r4 * 2)
+    box.center = rect.center
+    box.clamp_ip(rect)
+    pygame.draw.rect(self.imgbuf, self.black, box)
+    pygame.draw.rect(self.imgbuf, self.white, box, 1)
+    self.imgbuf.blit(text, text.get_rect(center=box.center))
+
+  # Airspeed tape, with stall and never-exceed speeds in red
+  def draw_speed(self, rect, scale):
+    if self.tapes.get('speed') == None:
+      tape = self.draw_tape(rect.w, 0, 250, scale, rect.h / 2, 5, 10, False)
+      band = self.rescale_x(4)
+      stall = 45
+      vne   = 160
+      for (lo, hi, colour) in [(0, stall, self.red), (stall, vne, self.green), (vne, 250, self.red)]:
+        pygame.draw.rect(tape.strip, colour, (rect.w - band, (tape.top - hi) * scale, band, (hi - lo) * scale))
+      self.tapes['speed'] = tape
+    self.tapes['speed'].blit(self.imgbuf, rect, self.airspeed)
+    self.draw_readout(rect, f"{int(self.airspeed):3d}")
+
+  # Altitude tape
+  def draw_altitude(self, rect, scale):
+    if self.tapes.get('altitude') == None:
+      self.tapes['altitude'] = self.draw_tape(rect.w, -1000, 15000, scale, rect.h / 2, 20, 100, True)
+    self.tapes['altitude'].blit(self.imgbuf, rect, self.altitude)
+    self.draw_readout(rect, f"{int(self.altitude):5d}")
+
+  # Attitude, with pitch ladder, bank pointer and sideslip
+  # The face goes over the top: airplane symbol and bank scale
+  def face_attitude(self, surf, x, y, w, h):
+    cx = x + w / 2
+    cy = y + h / 2
+    r6 = self.rescale_y(6)
+    r8 = self.rescale_y(8)
+    r20 = self.rescale_y(20)
+    r50 = self.rescale_y(50)
+    wing = w * 0.15
+
+    # Airplane symbol
+    pygame.draw.line(surf, self.yellow, (cx-wing*2, cy), (cx-wing, cy), r8)
+    pygame.draw.line(surf, self.yellow, (cx+wing, cy), (cx+wing*2, cy), r8)
+    pygame.draw.line(surf, self.yellow, (cx-r50, cy+r20), (cx, cy), r6)
+    pygame.draw.line(surf, self.yellow, (cx+r50, cy+r20), (cx, cy), r6)
+
+    # Bank scale
+    radius = h * 0.42
+    for a in [-60, -45, -30, -20, -10, 0, 10, 20, 30, 45, 60]:
+      l = r20 if a % 30 == 0 else r20 / 2
+      s = math.sin(math.radians(a))
+      c = math.cos(math.radians(a))
+      pygame.draw.line(surf, self.white, (cx + radius * s, cy - radius * c),
+                       (cx + (radius + l) * s, cy - (radius + l) * c), 2)
+
+  def draw_attitude(self, rect, scale):
+    sin_roll = self.sin_roll
+    cos_roll = self.cos_roll
+    (cx, cy) = rect.center
+    self.imgbuf.set_clip(rect)
+
+    # Sky, then ground below the horizon
+    pitch_px = convert.radtodeg(self.pitch) * scale
+    hx = cx + pitch_px * sin_roll
+    hy = cy + pitch_px * cos_roll
+    l = rect.w + rect.h
+    self.imgbuf.fill(self.blue, rect)
+    pygame.draw.polygon(self.imgbuf, self.brown,
+                        [(hx - l * cos_roll, hy + l * sin_roll),
+                         (hx + l * cos_roll, hy - l * sin_roll),
+                         (hx + l * cos_roll + l * sin_roll, hy - l * sin_roll + l * cos_roll),
+                         (hx - l * cos_roll + l * sin_roll, hy + l * sin_roll + l * cos_roll)])
+
+    # Pitch ladder, just the lines near the middle
+    r2 = self.rescale_y(2)
+    window = rect.h * 0.3
+    ladder_w = rect.w * 0.15
+    roll_deg = convert.radtodeg(self.roll)
+    for i in range(-36, 37):
+      pl = i * 2.5
+      px = pitch_px - pl * scale
+      if abs(px) > window:
+        continue
+      l = ladder_w * (2 if i % 4 == 0 else 1 if i % 2 == 0 else 0.5)
+      lx = cx + px * sin_roll
+      ly = cy + px * cos_roll
+      x1 = lx - l/2 * cos_roll
+      x2 = lx + l/2 * cos_roll
+      y1 = ly + l/2 * sin_roll
+      y2 = ly - l/2 * sin_roll
+      pygame.draw.line(self.imgbuf, self.white, (x1, y1), (x2, y2), r2)
+      if i % 4 == 0 and i != 0:
+        text = self.text.render(self.font24, f"{int(abs(pl)):d}", self.white, None, roll_deg)
+        for (tx, ty) in [(x1 - 0.1 * ladder_w * cos_roll, y1 + 0.1 * ladder_w * sin_roll),
+                         (x2 + 0.1 * ladder_w * cos_roll, y2 - 0.1 * ladder_w * sin_roll)]:
+          textRect = text.get_rect()
+          textRect.center = (tx, ty)
+          self.imgbuf.blit(text, textRect)
+
+    # Bank pointer turns with the horizon, sideslip under it
+    radius = rect.h * 0.42
+    r10 = self.rescale_y(10)
+    r20 = self.rescale_y(20)
+    (px, py) = (cx - radius * sin_roll, cy - radius * cos_roll) # Tip
+    pygame.draw.polygon(self.imgbuf, self.white,
+                        [(px, py),
+                         (px + r10 * cos_roll + r20 * sin_roll, py - r10 * sin_roll + r20 * cos_roll),
+                         (px - r10 * cos_roll + r20 * sin_roll, py + r10 * sin_roll + r20 * cos_roll)])
+    ss = max(min(self.sideslip, 2.0), -2.0) * r20
+    (bx, by) = (px + (r20 + 4) * sin_roll + ss * cos_roll, py + (r20 + 4) * cos_roll - ss * sin_roll)
+    pygame.draw.polygon(self.imgbuf, self.white,
+                        [(bx - r10 * cos_roll, by + r10 * sin_roll),
+                         (bx + r10 * cos_roll, by - r10 * sin_roll),
+                         (bx + r10 * cos_roll + 4 * sin_roll, by - r10 * sin_roll + 4 * cos_roll),
+                         (bx - r10 * cos_roll + 4 * sin_roll, by + r10 * sin_roll + 4 * cos_roll)])
+
+    self.imgbuf.set_clip(None)
+    self.blit_face('attitude', rect.x, rect.y, rect.w, rect.h, self.face_attitude, rect.w, rect.h,
+                   colorkey=self.magenta)
+
+  # Vertical speed, a needle from the right edge against a scale
+  def face_vsi(self, surf, x, y, w, h, scale):
+    cy = y + h / 2
+    pygame.draw.rect(surf, self.tape_grey, (x, y, w, h))
+    for roc in range(-2, 3):
+      ty = cy - roc * 1000 * scale
+      pygame.draw.line(surf, self.white, (x, ty), (x + w * 0.3, ty), 2)
+      if roc != 0:
+        text = self.font24.render(f"{abs(roc):d}", True, self.white, self.tape_grey)
+        textRect = text.get_rect()
+        textRect.midleft = (x + w * 0.4, ty)
+        surf.blit(text, textRect)
+
+  def draw_vsi(self, rect, scale):
+    self.blit_face('vsi', rect.x, rect.y, rect.w, rect.h, self.face_vsi, rect.w, rect.h, scale)
+    roc = max(min(self.roc, 2100), -2100)
+    r4 = self.rescale_y(4)
+    pygame.draw.line(self.imgbuf, self.white, (rect.right - r4, rect.centery),
+                     (rect.x + r4, rect.centery - roc * scale), r4) # Inside rect, thickness and all
+
+  # Draw compass card onto surf, centred
+  # Params: hdg - heading in degrees
+  #         radius - radius of card
+  def draw_card(self, surf, hdg, radius):
+    (ww, hh) = surf.get_size()
+    centx = ww / 2
+    centy = hh / 2
+    pygame.draw.circle(surf, self.tape_grey, (centx, centy), radius, 0)
+    for h in range(0, 72):
+      a = convert.degtorad(h * 5 - hdg)
+      inner_rad = 0.9 if h % 2 == 0 else 0.95
       x1 = centx + radius * inner_rad * math.sin(a)
       y1 = centy - radius * inner_rad * math.cos(a)
-      x2 = centx + radius * 1.0 * math.sin(a)
-      y2 = centy - radius * 1.0 * math.cos(a)
-      xt = centx + radius * 0.9 * math.sin(a)
-      yt = centy - radius * 0.9 * math.cos(a)
-      pygame.draw.line(self.pfdimgbuf, self.white, (x1, y1), (x2, y2), 3)
-  
-      if h == 0:
-        t = 'N'
-      elif h == 9:
-        t = 'E'
-      elif h == 18:
-        t = 'S'
-      elif h == 27:
-        t = 'W'
-      else:
-        t = f"{h:d}"
-  
-      if t != "":
-        text = self.font32.render(t, True, self.white, self.grey)
+      x2 = centx + radius * math.sin(a)
+      y2 = centy - radius * math.cos(a)
+      pygame.draw.line(surf, self.white, (x1, y1), (x2, y2), 2)
+
+      if h % 6 == 0:
+        t = {0: 'N', 18: 'E', 36: 'S', 54: 'W'}.get(h, f"{h // 2:d}")
+        text = self.font24.render(t, True, self.white, self.tape_grey)
         rtext = pygame.transform.rotate(text, -convert.radtodeg(a))
         textRect = rtext.get_rect()
-        textRect.center = (xt, yt)
-        self.pfdimgbuf.blit(rtext, textRect)
-  
-    text = self.font24.render(f"{int(convert.radtodeg(self.hdg)):03d}\u00b0",
-                              True, self.white, self.black)
-    textRect = text.get_rect()
-    textRect.center = (centx, self.rescale_y(575))
-    self.pfdimgbuf.blit(text, textRect)
-  
-  # Draw pitch lines on PFD
-  # Params: pl - pitch for pitch line in degrees
-  #         l - length of pitch line
-  #         withtext - if True, label the line
-  def draw_pitchline(self, pl, l, withtext):
-    (w, h) = self.size
-    pl_vert_px = (pl + convert.radtodeg(self.pitch)) * self.rescale_y(10)
-    hcent = w/2 + pl_vert_px * math.sin(self.roll)
-    vcent = h/2 + pl_vert_px * math.cos(self.roll)
-    x1 = hcent - l/2 * math.cos(self.roll)
-    x2 = hcent + l/2 * math.cos(self.roll)
-    y1 = vcent + l/2 * math.sin(self.roll)
-    y2 = vcent - l/2 * math.sin(self.roll)
-    pygame.draw.line(self.pfdimgbuf, self.white, (x1, y1), (x2, y2), self.rescale_y(2))
-    if (withtext and pl != 0):
-      text = self.font24.render(f"{int(math.fabs(pl)):2d}",
-                                True, self.white, self.blue if pl < 0 else self.brown)
-      rtext = pygame.transform.rotate(text, convert.radtodeg(self.roll))
-      textRect = rtext.get_rect()
-      textRect.center = (x2, y2)
-      self.pfdimgbuf.blit(rtext, textRect)
-  
-  # Draw PFD.  Main entry point.
-  def draw(self, roll, pitch, hdg, yaw_d, x_d, z_world, z_d_world,
-           aileron, elevator, rudder, throttle, autorudder, y_dd, alpha):
-    (w, h) = self.size
-    h *= 6/7 # Leave space for compass rose at bottom
-
-    self.roll     = roll
-    self.pitch    = pitch
-    self.hdg      = hdg
-    self.sideslip = y_dd
+        textRect.center = (centx + radius * 0.78 * math.sin(a), centy - radius * 0.78 * math.cos(a))
+        surf.blit(rtext, textRect)
 
-    # Rescale fixed-sized elements
-    r5 = self.rescale_y(5)
+  # Horizontal situation indicator.  The face goes over the card: lubber
+  # line and airplane symbol.
+  def face_hsi(self, surf, x, y, w, h, radius):
+    cx = x + w / 2
+    cy = y + h / 2 + self.rescale_y(20)
     r6 = self.rescale_y(6)
-    r8 = self.rescale_y(8)
     r10 = self.rescale_y(10)
-    r15 = self.rescale_y(15)
     r20 = self.rescale_y(20)
-    r25 = self.rescale_y(25)
-    r30 = self.rescale_y(30)
-    r50 = self.rescale_y(50)
-    r70 = self.rescale_y(70)
-    r75 = self.rescale_y(75)
-    r100 = self.rescale_y(100)
-    r150 = self.rescale_y(150)
-    r200 = self.rescale_y(200)
-    r300 = self.rescale_y(300)
-    r565 = self.rescale_y(565)
-    r615 = self.rescale_y(615)
-  
-    # Artificial horizon
-    vert_px = (convert.radtodeg(pitch)) * r10
-    hcent = w/2 + vert_px * math.sin(roll)
-    vcent = h/2 + vert_px * math.cos(roll)
-    x1 = hcent - w/2 * math.cos(roll)
-    x2 = hcent + w/2 * math.cos(roll)
-    y1 = vcent + w/2 * math.sin(roll)
-    y2 = vcent - w/2 * math.sin(roll)
-    vert_px = (convert.radtodeg(pitch) - 100) * r10
-    hcent = w/2 + vert_px * math.sin(roll)
-    vcent = h/2 + vert_px * math.cos(roll)
-    x3 = hcent - w/2 * math.cos(roll)
-    x4 = hcent + w/2 * math.cos(roll)
-    y3 = vcent + w/2 * math.sin(roll)
-    y4 = vcent - w/2 * math.sin(roll)
-    pygame.draw.polygon(self.pfdimgbuf, self.blue, [(x1, y1), (x2, y2), (x4, y4), (x3, y3)])
-    vert_px = (convert.radtodeg(pitch) + 100) * r10
-    hcent = w/2 + vert_px * math.sin(roll)
-    vcent = h/2 + vert_px * math.cos(roll)
-    x3 = hcent - w/2 * math.cos(roll)
-    x4 = hcent + w/2 * math.cos(roll)
-    y3 = vcent + w/2 * math.sin(roll)
-    y4 = vcent - w/2 * math.sin(roll)
-    pygame.draw.polygon(self.pfdimgbuf, self.brown, [(x1, y1), (x2, y2), (x4, y4), (x3, y3)])
-
-    # Pitch graticule
-    for pl in range(-8, 8):
-      self.draw_pitchline(pl * 10,       r200, True)
-      self.draw_pitchline(pl * 10 + 2.5, r50,  False)
-      self.draw_pitchline(pl * 10 + 5,   r75,  False)
-      self.draw_pitchline(pl * 10 + 7.5, r50,  False)
-   
-    # Airplane symbol 
-    pygame.draw.line(self.pfdimgbuf, self.yellow, (r200, h/2), (r300, h/2), r8)
-    pygame.draw.line(self.pfdimgbuf, self.yellow, (w-r300, h/2), (w-r200, h/2), r8)
-    pygame.draw.line(self.pfdimgbuf, self.yellow, (w/2-r50, h/2+r20), (w/2, h/2), r6)
-    pygame.draw.line(self.pfdimgbuf, self.yellow, (w/2+r50, h/2+r20), (w/2, h/2), r6)
- 
-    # Black border 
-    pygame.draw.rect(self.pfdimgbuf, self.black, (0, 0, w, r50))
-    pygame.draw.rect(self.pfdimgbuf, self.black, (0, h-r50, w, r50+r100))
-    pygame.draw.rect(self.pfdimgbuf, self.black, (0, 0, r50, h))
-    pygame.draw.rect(self.pfdimgbuf, self.black, (w-r50, 0, r50, h))
-  
-    # ASI, altimeter, rate of climb
-    text = self.font32.render(f"{int(convert.speedtoknots(x_d)):03d}",
-                              True, self.white, self.black)
-    textRect = text.get_rect()
-    textRect.center = (r50, h/2)
-    self.pfdimgbuf.blit(text, textRect)
-    text = self.font32.render(f"{int(convert.metrestofeet(z_world)):05d}",
-                              True, self.white, self.black)
-    textRect = text.get_rect()
-    textRect.center = (w-r50, h/2)
-    self.pfdimgbuf.blit(text, textRect)
-    for roc in range (1, 4):
-      roc_len = roc * h/2 / 5
-      text = self.font24.render(f"{-roc:+1d}", True, self.red, self.black)
-      textRect = text.get_rect()
-      textRect.center = (w-r20, h/2+r15 + roc_len)
-      self.pfdimgbuf.blit(text, textRect)
-      pygame.draw.line(self.pfdimgbuf, self.red,
-                       (w-r70, h/2+r15+roc_len), (w-r30,h/2+r15+roc_len), 1)
-      text = self.font24.render(f"{roc:+1d}", True, self.red, self.black)
-      textRect = text.get_rect()
-      textRect.center = (w-r20, h/2-r15 - roc_len)
-      self.pfdimgbuf.blit(text, textRect)
-      pygame.draw.line(self.pfdimgbuf, self.red,
-                       (w-r70, h/2-r15-roc_len), (w-r30, h/2-r15-roc_len), 1)
-    roc_len = convert.speedtofeetpermin(z_d_world) * h/2 / 5000
-    if (roc_len > 0):
-      pygame.draw.rect(self.pfdimgbuf, self.red, (w-r50, h/2-r15-roc_len, r20, roc_len))
-    else:
-      pygame.draw.rect(self.pfdimgbuf, self.red, (w-r50, h/2+r15, r20, -roc_len))
-  
-    # Control positions
-    pygame.draw.rect(self.pfdimgbuf, self.red, (r50, r565, r100, r100), 1)
-    pygame.draw.circle(self.pfdimgbuf, self.red,
-                       (r100+r50*aileron, r615+r50*elevator), r5)
-    pygame.draw.circle(self.pfdimgbuf, self.red,
-                       (r100+r50*rudder, r565+r100), r5, 1 if autorudder == True else 0)
-    pygame.draw.circle(self.pfdimgbuf, self.yellow, (r150, r565+r100-throttle*r100), r5)
-  
-    # Sideslip
-    pygame.draw.line(self.pfdimgbuf, self.red, (w/2, r25), (w/2, r50), 3)
-    pygame.draw.circle(self.pfdimgbuf, self.red, (w/2 + self.sideslip * r50, r25), r10)
-  
-    # Angle of attack
-    text = self.font24.render(f"\u03b1={convert.radtodeg(alpha):+0.1f}\u00b0", True, self.magenta, self.black)
-    textRect = text.get_rect()
-    textRect.center = (50, 20)
-    self.pfdimgbuf.blit(text, textRect)
-    
-    self.draw_rose(yaw_d)
- 
-    (sx, sy) = self.size 
-    self.display.blit(self.pfdimgbuf, self.offset, (0, 0, sx, sy)) # Blit buffer to real display
-    pygame.display.flip()
-  
-  
+    pygame.draw.polygon(surf, self.white, [(cx, cy - radius + r20), (cx - r10, cy - radius), (cx + r10, cy - radius)])
+    pygame.draw.line(surf, self.yellow, (cx, cy - r20 * 1.5), (cx, cy + r20 * 1.5), r6)
+    pygame.draw.line(surf, self.yellow, (cx - r20 * 1.5, cy - r10), (cx + r20 * 1.5, cy - r10), r6)
+    pygame.draw.line(surf, self.yellow, (cx - r20 * 0.7, cy + r20 * 1.2), (cx + r20 * 0.7, cy + r20 * 1.2), r6)
+
+  def draw_hsi(self, rect, radius):
+    (cx, cy) = rect.center
+    cy += self.rescale_y(20) # Room for the readout
+    if self.rose == None:
+      cardsize = int(radius * 2) + 4
+      self.rose = cardatlas.CardAtlas('pfd-compass', (cardsize, cardsize),
+                                      lambda surf, hdg: self.draw_card(surf, hdg, radius),
+                                      self.card_step)
+    self.rose.blit(self.imgbuf, (cx, cy), convert.radtodeg(self.hdg))
+    self.blit_face('hsi', rect.x, rect.y, rect.w, rect.h, self.face_hsi, rect.w, rect.h, radius,
+                   colorkey=self.magenta)
+
+    # Turn rate trend, as far round as the heading will be in 6 seconds
+    trradius = radius + self.rescale_y(10)
+    arc = max(min(self.turnrate * 6, math.pi / 2), -math.pi / 2)
+    arcrect = (cx - trradius, cy - trradius, 2 * trradius, 2 * trradius)
+    if arc > 0.0:
+      pygame.draw.arc(self.imgbuf, self.magenta, arcrect, math.pi/2 - arc, math.pi/2, self.rescale_y(5))
+    elif arc < 0.0:
+      pygame.draw.arc(self.imgbuf, self.magenta, arcrect, math.pi/2, math.pi/2 - arc, self.rescale_y(5))
+
+    # Heading readout above the card
+    text = self.text.render(self.font32, f"{int(convert.radtodeg(self.hdg)) % 360:03d}°", self.white, self.black)
+    box = text.get_rect().inflate(self.rescale_y(8), self.rescale_y(8))
+    box.midtop = rect.midtop
+    pygame.draw.rect(self.imgbuf, self.black, box)
+    pygame.draw.rect(self.imgbuf, self.white, box, 1)
+    self.imgbuf.blit(text, text.get_rect(center=box.center))
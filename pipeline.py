@@ -0,0 +1,87 @@
+#
+# Threaded simulation pipeline
+# Physics runs on its own thread at a fixed rate and publishes immutable
+# snapshots of the aircraft state.  The renderer picks up the latest
+# snapshot whenever it is ready for a new frame, so a slow frame never
+# holds up the physics.
+#
+
+import collections
+import threading
+import time
+
+# Everything the renderer, or telemetry, needs for one frame
+Snapshot = collections.namedtuple('Snapshot', [
+  't',                                    # Simulation time
+  'n_world', 'e_world', 'z_world',        # Position
+  'roll', 'pitch', 'hdg',                 # Orientation
+  'yaw_d', 'x_d', 'y_dd', 'z_d_world',    # Rates
+  'roll_d', 'pitch_d', 'tas',
+  'alpha',                                # Angle of attack
+  'aileron', 'elevator', 'rudder',        # Controls
+  'throttle', 'mixture', 'flap', 'autorudder',
+  'pbrake', 'brake',
+  'rpm', 'fuel_flow', 'egt',              # Engine
+  'fuel_left', 'fuel_right',              # Fuel
+  'view', 'viewangle', 'zoom',            # View
+  'resolution', 'smooth',
+  'traffic'])                             # Other aircraft, (n, e, z, roll, pitch, hdg) of each
+
+# Double buffer of snapshots
+# The writer fills the back slot, then swaps it to the front.  Readers only
+# ever see a complete snapshot.
+class DoubleBuffer:
+
+  def __init__(self, initial):
+    self.slots = [initial, initial]
+    self.front = 0
+    self.seq   = 0 # Incremented every time a snapshot is published
+    self.cond  = threading.Condition()
+
+  # Publish a new snapshot (writer thread)
+  def publish(self, snapshot):
+    back = 1 - self.front
+    self.slots[back] = snapshot
+    with self.cond:
+      self.front = back
+      self.seq += 1
+      self.cond.notify_all()
+
+  # Wait for a snapshot newer than seq (reader thread)
+  # Returns (seq, snapshot), or (seq, None) if nothing new arrived in time
+  def wait(self, seq, timeout):
+    with self.cond:
+      if self.cond.wait_for(lambda: self.seq != seq, timeout):
+        return (self.seq, self.slots[self.front])
+      return (seq, None)
+
+# Thread that calls func() every interval seconds
+# Deadlines are absolute, so a late tick doesn't push back the ones after it.
+# The thread stops if func() returns False or calls sys.exit()
+class FixedRateThread(threading.Thread):
+
+  def __init__(self, interval, func):
+    super().__init__(daemon=True)
+    self.interval = interval
+    self.func     = func
+    self.stopping = threading.Event()
+    self.busy     = 0.0 # Fraction of the last interval spent in func()
+
+  def run(self):
+    deadline = time.perf_counter()
+    while not self.stopping.is_set():
+      start = time.perf_counter()
+      try:
+        if self.func() == False:
+          break
+      except SystemExit:
+        break
+      now = time.perf_counter()
+      self.busy = (now - start) / self.interval
+      deadline += self.interval
+      if deadline < now:
+        deadline = now # Too far behind to catch up, so don't try
+      self.stopping.wait(deadline - now)
+
+  def stop(self):
+    self.stopping.set()
@@ -12,6 +12,10 @@ class FixedPitchProp:
   diameter        = 1.94       # Rotor diameter in metres
   peak_efficiency = 0.85       # About the best one can for for GA propeller
 
+  # Params: verbose - print the workings of every step
+  def __init__(self, verbose=True):
+    self.verbose = verbose
+
   # Return coeffients of thrust and coeffient of torque
   # Params: advance_ratio - advance ratio of propeller
   # Returns (coeff_thrust, coeff_torque, shaft_power)
@@ -68,10 +72,11 @@ class FixedPitchProp:
     shaft_power = torque * rot_rev_per_sec * 2 * math.pi
     efficiency = (thrust_coeff * advance_ratio) / (2 * math.pi * torque_coeff)
 
-    print(f"Advance ratio: {advance_ratio:.2f}")
-    print(f"Prop Thrust:   {thrust:.1f} N")
-    print(f"Prop Torque:   {torque:.1f} Nm")
-    print(f"Shaft Power:   {shaft_power/1000:.0f} kW")
-    print(f"Prop Eff:      {efficiency*100.0:.1f}%")
+    if self.verbose:
+      print(f"Advance ratio: {advance_ratio:.2f}")
+      print(f"Prop Thrust:   {thrust:.1f} N")
+      print(f"Prop Torque:   {torque:.1f} Nm")
+      print(f"Shaft Power:   {shaft_power/1000:.0f} kW")
+      print(f"Prop Eff:      {efficiency*100.0:.1f}%")
     return (thrust, torque, shaft_power)
 
@@ -0,0 +1,224 @@
+#
+# Batched scanline polygon filling, and line drawing
+# pygame.draw.polygon() costs a Python call and a list of points for every
+# polygon, which adds up with hundreds of small ones (runway segments,
+# stripes.)  Here all the polygons of a frame are filled at once, straight
+# into a surface's pixels, with NumPy.
+#  - Polygons come in as the ragged arrays of clip.py, in screen coordinates
+#  - The pixels filled are exactly those pygame.draw.polygon() fills:
+#    vertices truncated to whole pixels, and edges filled inclusively, so
+#    the picture is the same whichever way it is drawn
+#  - Polygons drawn later cover earlier ones, as if drawn one at a time
+#  - Lines are drawn the same way, a pixel for each step along them
+# Which is quicker, this or pygame.draw, depends on the scene and the
+# machine, so a Chooser times both and picks.
+#
+
+import numpy as np
+
+class Rasterizer:
+
+  long_span = 256 # Spans this long or longer are filled a slice at a time
+
+  # Params: size - (w, h) of the surfaces to fill
+  def __init__(self, size):
+    (self.w, self.h) = size
+    self.top = np.full(self.w * self.h, -1, dtype=np.intp) # Topmost polygon at each pixel
+    self.top_rows = self.top.reshape(self.h, self.w)
+
+  # Fill polygons
+  # Params: pixels - (w, h) array from surfarray.pixels2d()
+  #         pts, counts - ragged polygon arrays, screen coordinates
+  #         colours - (P,) array of mapped colour of every polygon
+  #         order - indices of the polygons to fill, in the order to fill them
+  def fill_polygons(self, pixels, pts, counts, colours, order):
+    (w, h) = (self.w, self.h)
+    if len(order) == 0 or pts.shape[0] == 0:
+      return
+
+    # Priority of each polygon: later in order is higher, -1 not drawn.
+    # Like pygame.draw.polygon(), polygons of under 3 points aren't drawn.
+    priority = np.full(counts.size, -1, dtype=np.intp)
+    priority[order] = np.arange(len(order))
+    priority[counts < 3] = -1
+    drawn = np.flatnonzero(priority >= 0)
+    if drawn.size == 0:
+      return
+
+    # Vertices are truncated to whole pixels, as pygame does
+    xy = np.trunc(np.clip(pts[np.repeat(priority >= 0, counts)], -2.0**30, 2.0**30)).astype(np.int64)
+    (vx, vy) = (xy[:, 0], xy[:, 1])
+    (counts, priority) = (counts[drawn], priority[drawn])
+    starts = np.cumsum(counts) - counts
+    owner = np.repeat(np.arange(counts.size), counts) # Polygon of each vertex
+    prev = np.arange(vx.size) - 1                     # Vertex before each one
+    prev[starts] = starts + counts - 1
+    miny = np.minimum.reduceat(vy, starts)
+    maxy = np.maximum.reduceat(vy, starts)
+
+    # Spans are (row, first column, last column, polygon), from the same
+    # three cases as in pygame
+    spans = []
+
+    # 1. Polygons only one row high are a line from end to end
+    flat = miny == maxy
+    if np.any(flat):
+      spans.append((miny[flat], np.minimum.reduceat(vx, starts)[flat],
+                    np.maximum.reduceat(vx, starts)[flat], priority[flat]))
+
+    # 2. Every other row a polygon covers is filled between pairs of
+    # crossings of its edges.  Each edge from y1 down to y2 crosses rows
+    # y1 to y2 - 1, and y2 as well on the polygon's bottom row.
+    (xa, ya, xb, yb) = (vx[prev], vy[prev], vx, vy)
+    down = ya < yb
+    (x1, y1) = (np.where(down, xa, xb), np.minimum(ya, yb))
+    (x2, y2) = (np.where(down, xb, xa), np.maximum(ya, yb))
+    r0 = np.clip(y1, 0, h)
+    r1 = np.clip(y2 + (y2 == maxy[owner]), 0, h)
+    n = np.where((ya != yb) & ~flat[owner], np.maximum(r1 - r0, 0), 0)
+    total = int(np.sum(n))
+    if total > 0:
+      e = np.repeat(np.arange(n.size), n)
+      row = r0[e] + np.arange(total) - np.repeat(np.cumsum(n) - n, n)
+      group = owner[e] * h + row
+
+      # Each crossing is where the edge is at the top of the row, rounded
+      # towards zero, as pygame does
+      (q, r) = np.divmod((row - y1[e]) * (x2[e] - x1[e]), y2[e] - y1[e])
+      x = x1[e] + q
+      x += (x < 0) & (r != 0)
+
+      # Then sorted along each row and taken in pairs.  Clamping to just
+      # off the surface keeps the order, and what is on it.
+      x = np.clip(x, -1, w)
+      s = np.argsort(group * (w + 2) + (x + 1))
+      (x, group) = (x[s], group[s])
+      spans.append((group[0::2] % h, x[0::2], x[1::2], priority[group[0::2] // h]))
+
+    # 3. Horizontal edges part way down, which the rows can miss
+    level = (ya == yb) & (yb > miny[owner]) & (yb < maxy[owner])
+    if np.any(level):
+      spans.append((yb[level], np.minimum(xa, xb)[level], np.maximum(xa, xb)[level],
+                    priority[owner[level]]))
+
+    if len(spans) == 0:
+      return
+    (row, c0, c1, poly) = (np.concatenate(a) for a in zip(*spans))
+    onsurface = (row >= 0) & (row < h)
+    (row, poly) = (np.where(onsurface, row, 0), poly.astype(np.intp))
+    c0 = np.clip(c0, 0, w)
+    c1 = np.clip(c1 + 1, 0, w)
+    n = np.where(onsurface, np.maximum(c1 - c0, 0), 0)
+    colour = colours[np.asarray(order)]
+
+    # Long spans, mostly of polygons close up, are filled a slice at a
+    # time, bottom polygon first.  Expanding them into pixels would cost
+    # more.  If there are short spans too, each leaves its polygon in top,
+    # so short spans of polygons underneath can't cover it.
+    long = n >= self.long_span
+    n = np.where(long, 0, n)
+    total = int(np.sum(n))
+    if np.any(long):
+      s = np.flatnonzero(long)
+      s = s[np.argsort(poly[s], kind='stable')]
+      for (a, b, y, p) in zip(c0[s].tolist(), c1[s].tolist(), row[s].tolist(), poly[s].tolist()):
+        pixels[a:b, y] = colour[p]
+        if total > 0:
+          self.top_rows[y, a:b] = p
+
+    # Every pixel of the short spans.  The topmost polygon at each pixel is
+    # found first, so pixels covered more than once all get the same
+    # colour, whatever order the writes happen in.
+    if total > 0:
+      flat = np.arange(total) + np.repeat(row * w + c0 - (np.cumsum(n) - n), n)
+      np.maximum.at(self.top, flat, np.repeat(poly, n))
+      colour = colour[self.top[flat]]
+      if pixels.T.flags['C_CONTIGUOUS']:
+        pixels.T.reshape(-1)[flat] = colour # Rows one after the other, no gaps
+      else:
+        pixels[flat % w, flat // w] = colour
+      self.top.fill(-1)
+
+  # Draw line segments one pixel wide, all at once
+  # Params: pixels - (w, h) array from surfarray.pixels2d()
+  #         ends - (K, 4) array of x1, y1, x2, y2 of every segment, screen
+  #                coordinates
+  #         colour - mapped colour
+  def draw_lines(self, pixels, ends, colour):
+    (x1, y1, x2, y2) = self.clip_lines(ends).T
+    if x1.size == 0:
+      return
+
+    # One pixel for every step along the longer axis (DDA)
+    (dx, dy) = (x2 - x1, y2 - y1)
+    n = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.intp) + 1
+    total = int(np.sum(n))
+    seg = np.repeat(np.arange(n.size), n)
+    t = (np.arange(total) - np.repeat(np.cumsum(n) - n, n)) / np.maximum(n - 1, 1)[seg]
+    xs = (x1[seg] + t * dx[seg]).astype(np.intp)
+    ys = (y1[seg] + t * dy[seg]).astype(np.intp)
+    pixels[xs, ys] = colour
+
+  # Clip line segments to the surface (Liang-Barsky)
+  # Params: ends - (K, 4) array of x1, y1, x2, y2
+  # Returns (J, 4) array of the segments, or parts of segments, on it
+  def clip_lines(self, ends):
+    (x1, y1, x2, y2) = ends.T
+    (dx, dy) = (x2 - x1, y2 - y1)
+    edge = 1e-6 # Keeps the far edges inside the last pixel
+    t0 = np.zeros(len(ends))
+    t1 = np.ones(len(ends))
+    keep = np.ones(len(ends), dtype=bool)
+    # Inside where p * t <= q, for each side
+    for (p, q) in ((-dx, x1), (dx, self.w - edge - x1), (-dy, y1), (dy, self.h - edge - y1)):
+      with np.errstate(divide='ignore', invalid='ignore'):
+        r = q / p
+      t0 = np.where(p < 0, np.maximum(t0, r), t0)
+      t1 = np.where(p > 0, np.minimum(t1, r), t1)
+      keep &= (p != 0) | (q >= 0)
+    keep &= t0 <= t1
+    (t0, t1) = (t0[keep, None], t1[keep, None])
+    start = np.column_stack((x1, y1))[keep]
+    delta = np.column_stack((dx, dy))[keep]
+    return np.hstack((start + t0 * delta, start + t1 * delta))
+
+# Times two or more ways of doing the same thing, and settles on the
+# quickest.  Each is tried for a few frames in turn, then the one with the
+# lowest median time is used until reset() is called.
+class Chooser:
+
+  # Params: names - names of the ways
+  #         trials - frames to time each one for
+  def __init__(self, names, trials=10):
+    self.names  = list(names)
+    self.trials = trials
+    self.reset()
+
+  # Time them all again, eg: after the scene or the size changes
+  def reset(self):
+    self.times  = {n: [] for n in self.names}
+    self.choice = None
+    self.frame  = 0
+
+  # Returns name of the way to use this frame
+  def pick(self):
+    if self.choice != None:
+      return self.choice
+    return self.names[self.frame % len(self.names)]
+
+  # Returns name of the way whose results to show this frame: the first,
+  # until one is chosen, so the picture doesn't change from frame to frame
+  # while they are timed
+  def shown(self):
+    if self.choice != None:
+      return self.choice
+    return self.names[0]
+
+  # Record how long the way used this frame took
+  def record(self, name, seconds):
+    if self.choice != None:
+      return
+    self.frame += 1
+    self.times[name].append(seconds)
+    if all(len(t) >= self.trials for t in self.times.values()):
+      self.choice = min(self.names, key=lambda n: np.median(self.times[n]))
@@ -0,0 +1,76 @@
+#
+# Frame recorder
+# Copies rendered frames into a small pool of buffers and hands them to a
+# writer thread, which saves them as a PNG image sequence or as a raw RGB24
+# video file.  The sim loop never waits for the writer - if it falls behind,
+# frames are dropped instead.
+#
+# Raw video can be converted with eg:
+#   ffmpeg -f rawvideo -pix_fmt rgb24 -s 1600x900 -r 10 -i out.raw out.mp4
+#
+
+import os
+import queue
+import threading
+import numpy as np
+import pygame
+
+class FrameRecorder:
+
+  # Params: path - directory for a PNG sequence, or a file ending in .raw
+  #                or .rgb for raw video
+  #         size - (w, h) of frames, in pixels
+  #         depth - number of frames that can be waiting to be written
+  def __init__(self, path, size, depth=8):
+    (w, h) = size
+    self.size    = size
+    self.raw     = os.path.splitext(path)[1] in ('.raw', '.rgb')
+    self.path    = path
+    self.count   = 0 # Frames written
+    self.dropped = 0 # Frames dropped because the writer was behind
+    if self.raw:
+      self.file = open(path, 'wb')
+    else:
+      os.makedirs(path, exist_ok=True)
+
+    # Buffers cycle from free -> pending -> free, so nothing is allocated per frame
+    self.free    = queue.Queue()
+    self.pending = queue.Queue(maxsize=depth)
+    for i in range(0, depth):
+      self.free.put(np.empty((h, w, 3), dtype=np.uint8))
+
+    self.thread = threading.Thread(target=self.writer, daemon=True)
+    self.thread.start()
+
+  # Queue a frame for writing
+  # Params: pixels - (w, h, 3) array, eg: from pygame.surfarray.pixels3d()
+  def record(self, pixels):
+    try:
+      buf = self.free.get_nowait()
+    except queue.Empty:
+      self.dropped += 1
+      return
+    np.copyto(buf, pixels.transpose(1, 0, 2)) # Rows first, as video expects
+    self.pending.put(buf)
+
+  # Writer thread
+  def writer(self):
+    while True:
+      buf = self.pending.get()
+      if buf is None:
+        break
+      if self.raw:
+        self.file.write(buf)
+      else:
+        img = pygame.image.frombuffer(buf, self.size, 'RGB')
+        pygame.image.save(img, os.path.join(self.path, f"frame{self.count:06d}.png"))
+      self.count += 1
+      self.free.put(buf)
+
+  # Write out any frames still queued and stop the writer thread
+  def close(self):
+    self.pending.put(None)
+    self.thread.join()
+    if self.raw:
+      self.file.close()
+    print(f"Recorded {self.count:d} frames to {self.path}, {self.dropped:d} dropped")
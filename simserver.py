@@ -0,0 +1,323 @@
+#!/usr/bin/python3
+
+#
+# Simulation server
+# A long-running headless process hosting any number of aircraft, for
+# analysis tools to fly over a local Unix socket without starting the
+# simulator for every run.
+#  - Clients create aircraft, set their controls or state, step them and
+#    read them back, with a compact binary protocol
+#  - Step requests from all clients are collected for a short window, then
+#    run together a frame at a time: the wing coefficients for every
+#    aircraft are looked up in one batch for each time step, instead of one
+#    at a time.  Each request is answered as soon as its own frames are
+#    done, and other requests are served between frames, so a long one
+#    doesn't hold up the rest.
+#  - Aircraft belong to the connection that created them: only it can set,
+#    step or destroy them, though any connection can GET them.  They are
+#    destroyed when it closes, even part way through a STEP.
+#
+# Run the server with:  python3 simserver.py [--socket PATH]
+#
+# Protocol:
+#   Every message, both ways, is a 4 byte little endian length of the rest,
+#   then the rest.  A request is an op code byte then its arguments, and
+#   gets one response, in order: a status byte then the result.  All
+#   integers are unsigned 32 bit and all values float64, little endian.
+#
+#   op  request                         result
+#   0   FIELDS                          names of the state fields, utf-8,
+#                                       one per line
+#   1   CREATE                          id
+#   2   DESTROY id
+#   3   SET id (field value)...         field is a one byte index into
+#                                       FIELDS
+#   4   STEP id frames                  state after stepping
+#   5   GET id                          state
+#
+#   A state is one value for every field, in order.  Each frame is
+#   Airplane.frame_int seconds of simulated time.
+#
+#   status  0 ok, 1 no such aircraft (or not this connection's, except for
+#   GET), 2 bad request, 3 aircraft has crashed (with its state, for STEP
+#   and GET)
+#
+
+import os
+import signal
+import struct
+import asyncio
+import argparse
+import tempfile
+import numpy as np
+
+import aerodb
+import airplane
+
+default_socket = os.path.join(tempfile.gettempdir(), 'flightsim.sock')
+
+op_fields  = 0
+op_create  = 1
+op_destroy = 2
+op_set     = 3
+op_step    = 4
+op_get     = 5
+
+status_ok       = 0
+status_no_such  = 1
+status_bad      = 2
+status_crashed  = 3
+
+# State of an aircraft, as sent to clients
+fields = ['t', 'n_world', 'e_world', 'z_world', 'roll', 'pitch', 'hdg',
+          'x_d', 'y_d', 'z_d', 'z_d_world', 'roll_d', 'pitch_d', 'yaw_d',
+          'x_dd', 'y_dd', 'z_dd', 'alpha', 'tas',
+          'thrust', 'rpm', 'fuel_flow', 'egt', 'fuel_left', 'fuel_right',
+          'aileron', 'elevator', 'rudder', 'throttle', 'mixture', 'flap',
+          'pbrake', 'brake', 'starter', 'autorudder', 'crashed']
+# Fields the model works out for itself, so can't be set
+outputs = {'x_dd', 'y_dd', 'z_dd', 'alpha', 'tas', 'thrust', 'rpm', 'fuel_flow', 'egt', 'crashed'}
+flags   = {'pbrake', 'brake', 'starter', 'autorudder', 'crashed'}
+
+length = struct.Struct('<I')
+ident  = struct.Struct('<I')
+step   = struct.Struct('<II')
+assign = struct.Struct('<Bd')
+state  = struct.Struct('<%dd' % len(fields))
+
+def pack_state(plane):
+  return state.pack(*[float(getattr(plane, f)) for f in fields])
+
+class Server:
+
+  batch_min = 16 # Fewer aircraft than this are quicker looked up one at a time
+
+  # Params: window - seconds to collect step requests for, before running
+  #                  them together
+  def __init__(self, window=0.002):
+    self.window   = window
+    self.wing     = aerodb.load()['wing']
+    self.batch    = aerodb.Interpolator(self.wing)
+    self.aircraft = {} # By id
+    self.next_id  = 1
+    self.pending  = {} # Step requests waiting to be run: by aircraft, a
+                       # list of [frames left, future] in order
+    self.wakeup   = asyncio.Event()
+    self.clients  = set() # Tasks serving each connection
+    self.batches  = 0
+    self.steps    = 0
+
+  # Serve one client connection.  The next request's length is read while
+  # the one before is dispatched, so a client that hangs up during a STEP is
+  # noticed straight away.
+  async def handle(self, reader, writer):
+    owned = set()
+    self.clients.add(asyncio.current_task())
+    header = asyncio.ensure_future(reader.readexactly(length.size))
+    try:
+      while True:
+        (n,) = length.unpack(await header)
+        request = await reader.readexactly(n)
+        header = asyncio.ensure_future(reader.readexactly(length.size))
+        response = await self.dispatch(request, owned, header)
+        writer.write(length.pack(len(response)) + response)
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+      pass
+    except asyncio.CancelledError:
+      pass # Server shutting down
+    finally:
+      header.cancel()
+      for id in owned:
+        self.aircraft.pop(id, None)
+      writer.close()
+      self.clients.discard(asyncio.current_task())
+
+  # Returns response to one request
+  # Params: request - the request, op code first
+  #         owned - ids of the aircraft the connection created
+  #         header - reading of the next request, which fails if the client
+  #                  hangs up
+  async def dispatch(self, request, owned, header):
+    if len(request) == 0:
+      return bytes([status_bad])
+    op = request[0]
+    try:
+      if op == op_fields:
+        return bytes([status_ok]) + '\n'.join(fields).encode()
+      if op == op_create:
+        id = self.next_id
+        self.next_id += 1
+        self.aircraft[id] = airplane.Airplane(self.wing, verbose=False)
+        owned.add(id)
+        return bytes([status_ok]) + ident.pack(id)
+      if op in (op_destroy, op_set, op_step, op_get):
+        (id,) = ident.unpack_from(request, 1)
+        plane = self.aircraft.get(id)
+        if plane == None or (op != op_get and id not in owned):
+          return bytes([status_no_such])
+      if op == op_destroy:
+        del self.aircraft[id]
+        owned.discard(id)
+        return bytes([status_ok])
+      if op == op_set:
+        if (len(request) - 1 - ident.size) % assign.size != 0:
+          return bytes([status_bad])
+        updates = [assign.unpack_from(request, pos)
+                   for pos in range(1 + ident.size, len(request), assign.size)]
+        if any(f >= len(fields) or fields[f] in outputs for (f, v) in updates):
+          return bytes([status_bad])
+        for (f, v) in updates:
+          setattr(plane, fields[f], bool(v) if fields[f] in flags else v)
+        return bytes([status_ok])
+      if op == op_step:
+        (id, frames) = step.unpack_from(request, 1)
+        if not plane.crashed and frames > 0:
+          done = asyncio.get_running_loop().create_future()
+          self.pending.setdefault(plane, []).append([frames, done])
+          self.wakeup.set()
+          await asyncio.wait((done, header), return_when=asyncio.FIRST_COMPLETED)
+          if not done.done() and header.done() and header.exception() != None:
+            done.cancel() # The stepper drops it
+            raise header.exception()
+          await done
+      if op in (op_step, op_get):
+        return bytes([status_crashed if plane.crashed else status_ok]) + pack_state(plane)
+    except struct.error:
+      pass
+    return bytes([status_bad])
+
+  # Run the step requests that have come in, rate limited by window.  Every
+  # aircraft with requests waiting is stepped one frame at a time, with the
+  # event loop let in between frames, so new requests join in and the
+  # others are answered.
+  async def stepper(self):
+    while True:
+      await self.wakeup.wait()
+      await asyncio.sleep(self.window) # Let more requests arrive
+      self.wakeup.clear()
+      while len(self.pending) > 0:
+        # Requests whose clients have gone are dropped
+        for (plane, requests) in list(self.pending.items()):
+          requests[:] = [r for r in requests if not r[1].done()]
+          if len(requests) == 0:
+            del self.pending[plane]
+        if len(self.pending) == 0:
+          break
+        self.step(list(self.pending))
+        for (plane, requests) in list(self.pending.items()):
+          requests[0][0] -= 1
+          while len(requests) > 0 and (requests[0][0] == 0 or plane.crashed):
+            requests.pop(0)[1].set_result(None)
+          if len(requests) == 0:
+            del self.pending[plane]
+        await asyncio.sleep(0)
+
+  # Step many aircraft one frame together
+  # Params: planes - aircraft to step
+  def step(self, planes):
+    self.batches += 1
+    active = [p for p in planes if not p.crashed]
+    for p in active:
+      p.step_engine()
+    for i in range(0, airplane.Airplane.intervals_per_frame):
+      for p in active:
+        p.update_airflow()
+      if len(active) >= self.batch_min:
+        inputs = np.array([p.coefficient_inputs() for p in active]).T
+        coefficients = self.batch.batch(*inputs).tolist()
+      else:
+        coefficients = [p.lookup_coefficients() for p in active]
+      for (p, c) in zip(active, coefficients):
+        p.update_forces(*c)
+      active = [p for p in active if not p.crashed]
+    self.steps += len(planes)
+
+# Simple blocking client, mostly as an example of the protocol
+class Client:
+
+  def __init__(self, path=default_socket):
+    import socket
+    self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    self.sock.connect(path)
+    self.fields = self.request(op_fields)[1].decode().split('\n')
+
+  # Returns (status, result)
+  def request(self, op, *args):
+    body = bytes([op]) + b''.join(args)
+    self.sock.sendall(length.pack(len(body)) + body)
+    (n,) = length.unpack(self.receive(length.size))
+    response = self.receive(n)
+    return (response[0], response[1:])
+
+  def receive(self, n):
+    buf = bytearray()
+    while len(buf) < n:
+      chunk = self.sock.recv(n - len(buf))
+      if len(chunk) == 0:
+        raise ConnectionError('Server closed the connection')
+      buf += chunk
+    return bytes(buf)
+
+  def create(self):
+    return ident.unpack(self.request(op_create)[1])[0]
+
+  def destroy(self, id):
+    self.request(op_destroy, ident.pack(id))
+
+  # Params: values - new values, by field name
+  # Returns status
+  def set(self, id, **values):
+    return self.request(op_set, ident.pack(id),
+                        *[assign.pack(self.fields.index(f), v) for (f, v) in values.items()])[0]
+
+  # Returns (status, dict of state by field name)
+  def step(self, id, frames=1):
+    (status, result) = self.request(op_step, step.pack(id, frames))
+    return (status, dict(zip(self.fields, state.unpack(result))) if len(result) == state.size else None)
+
+  def get(self, id):
+    (status, result) = self.request(op_get, ident.pack(id))
+    return (status, dict(zip(self.fields, state.unpack(result))) if len(result) == state.size else None)
+
+  def close(self):
+    self.sock.close()
+
+# Run a server until interrupted
+async def serve(path, window):
+  server = Server(window)
+  if os.path.exists(path):
+    os.unlink(path) # Left over from a server that didn't shut down cleanly
+  listener = await asyncio.start_unix_server(server.handle, path)
+  loop = asyncio.get_running_loop()
+  stepper = loop.create_task(server.stepper())
+  loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel) # Clean up on kill too
+  print(f"Simulation server on {path}")
+  try:
+    while True:
+      await asyncio.sleep(10)
+      if server.batches > 0:
+        print(f"{len(server.aircraft):d} aircraft, {server.steps / 10:.0f} frames/s "
+              f"in {server.batches / 10:.0f} batches/s")
+      server.batches = 0
+      server.steps   = 0
+  finally:
+    # Stop taking connections, hang up on the clients and wait for their
+    # handlers to finish
+    listener.close()
+    stepper.cancel()
+    for client in server.clients:
+      client.cancel()
+    await asyncio.gather(stepper, *server.clients, return_exceptions=True)
+    os.unlink(path)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Flight simulator simulation server')
+  parser.add_argument('--socket', default=default_socket, help=f"Unix socket to listen on (default: {default_socket})")
+  parser.add_argument('--window', type=float, default=0.002,
+                      help='seconds to collect step requests for before running them together (default: 0.002)')
+  args = parser.parse_args()
+  try:
+    asyncio.run(serve(args.socket, args.window))
+  except (KeyboardInterrupt, asyncio.CancelledError):
+    pass
@@ -7,51 +7,99 @@
 import math
 import pygame
 import convert
+import panel
+import cardatlas
+import attitude
 
 # Steam panel
-class Steam:
-
-  # Initialize graphics for steam panel
-  def __init__(self, display, offset, size):
-    self.display = display
-    self.offset  = offset
-    (sx, sy)     = size
-    self.xscale  = sx / 800 # Used for rescaling UI
-    self.yscale  = sy / 700 # Used for rescaling UI
-    self.size    = size
-    
-    self.font32  = pygame.font.Font('freesansbold.ttf', self.rescale_y(32))
-    self.font24  = pygame.font.Font('freesansbold.ttf', self.rescale_y(24))
-    self.font16  = pygame.font.Font('freesansbold.ttf', self.rescale_y(16))
-    self.black   = (0,0,0)
-    self.white   = (255,255,255)
-    self.grey    = (128,128,128)
-    self.brown   = (0x98,0x76,0x54)
-    self.blue    = (0x95,0xcb,0xdb)
-    self.magenta = (255,0,255)
-    self.red     = (255,0,0)
-    self.yellow  = (255,255,0)
-    self.green   = (0,255,0)
-    self.imgbuf  = pygame.Surface(size)
-
-  def rescale_x(self, pixels):
-    return int(round(pixels * self.xscale))
-
-  def rescale_y(self, pixels):
-    return int(round(pixels * self.yscale))
+class Steam(panel.Panel):
 
-  # Draw compass rose
-  def draw_rose(self, x, y, size):
-    (ww, hh) = size
-    centx = x + ww / 2   # Centre of compass rose - x
-    centy = y + hh / 2   # Centre of compass rose - y
-    radius = ww * 0.45   # Radius of compass rose
-  
-    # Compass rose
-    pygame.draw.circle(self.imgbuf, self.black, (centx, centy), radius, 0)
+  card_step = 0.5 # Resolution of pre-rotated compass card, degrees
+
+  # Set the size of the panel.  Everything scales with it.
+  def resize(self, size):
+    self.rose    = None # Compass card atlas, built on first use
+    self.ball    = None # Attitude indicator ball, built on first use
+    super().resize(size)
+
+  # Place the gauges on the panel
+  def layout(self):
+    (w, h) = self.size
+    border = 10
+    diameter = h/2.1
+    spacing = h/2.0
+    small = diameter*0.75
+    deg = math.radians
+
+    # Area covered by a round gauge and its face
+    def square(x, y, size):
+      return (int(x), int(y), int(size) + 3, int(size) + 3)
+
+    (x, y) = (border+spacing/4, border+spacing/4)
+    ff_egt = panel.Gauge(lambda x=x, y=y: self.draw_ff_egt(x, y, small), square(x, y, small),
+                         lambda: (deg(self.fuel_flow / 90 * 140) * small * 0.3,
+                                  deg(self.egt / 400 * 140) * small * 0.3), hz=2)
+    (x, y) = (border+spacing/4, border+spacing)
+    fuel = panel.Gauge(lambda x=x, y=y: self.draw_fuel(x, y, small), square(x, y, small),
+                       lambda: (deg(self.fuel_left / 106 * 140) * small * 0.3,
+                                deg(self.fuel_right / 106 * 140) * small * 0.3), hz=2)
+    (x, y) = (border+spacing, border)
+    asi = panel.Gauge(lambda x=x, y=y: self.draw_asi(x, y, diameter), square(x, y, diameter),
+                      lambda: (deg(self.airspeed / self.asi_fullscale * 270) * diameter * 0.4,))
+    (x, y) = (border+spacing, border+spacing)
+    turn_coord = panel.Gauge(lambda x=x, y=y: self.draw_turn_coord(x, y, diameter), square(x, y, diameter),
+                             lambda: (self.turnrate * 10 * diameter * 0.3,
+                                      self.sideslip * diameter / 20))
+    (x, y) = (border+2*spacing, border)
+    radius = diameter / 2 - self.rescale_x(8)
+    horizon = panel.Gauge(lambda x=x, y=y: self.draw_horizon(x, y, diameter), square(x, y, diameter),
+                          lambda: (math.degrees(self.pitch) * radius / 30.0,
+                                   self.roll * radius))
+    (x, y) = (border+2*spacing, border+spacing)
+    compass = panel.Gauge(lambda x=x, y=y: self.draw_compass(x, y, diameter), square(x, y, diameter),
+                          lambda: (self.hdg * diameter * 0.45,
+                                   int(math.degrees(self.hdg)))) # Digital readout
+    (x, y) = (border+3*spacing, border)
+    alt = panel.Gauge(lambda x=x, y=y: self.draw_alt(x, y, diameter), square(x, y, diameter),
+                      lambda: (self.altitude / 100000.0 * 2 * math.pi * diameter * 0.45,
+                               self.altitude / 10000.0 * 2 * math.pi * diameter * 0.25,
+                               self.altitude / 1000.0 * 2 * math.pi * diameter * 0.4))
+    (x, y) = (border+3*spacing, border+spacing)
+    vsi = panel.Gauge(lambda x=x, y=y: self.draw_vsi(x, y, diameter), square(x, y, diameter),
+                      lambda: (deg(self.roc / self.vsi_fullscale * 130) * diameter * 0.35,))
+    (x, y) = (border+4*spacing, border+spacing)
+    rpm = panel.Gauge(lambda x=x, y=y: self.draw_rpm(x, y, small), square(x, y, small),
+                      lambda: (deg(self.rpm / 4000 * 270) * small * 0.4,), hz=10)
+
+    # Controls, whose knobs stick out of their slots
+    (x, y, size) = (border+4.8*spacing, border+diameter/4, diameter*1.5)
+    (r15, r30) = (self.rescale_y(15), self.rescale_y(30))
+    controls = panel.Gauge(lambda x=x, y=y: self.draw_controls(x, y, size),
+                           (int(x) - r15, int(y) - r30, int(size * 1.5) + r15 + 3, int(size) + 2 * r30 + 3),
+                           lambda: (self.throttle * size, self.mixture * size,
+                                    self.aileron * size / 2, self.elevator * size / 2,
+                                    self.rudder * size / 2, self.autorudder,
+                                    self.flap > 0, int(self.flap * 10))) # Annunciator
+
+    # Angle of attack, centred on the corner
+    (tw, th) = self.font24.size("\u03b1=+00.0\u00b0")
+    alpha = panel.Gauge(self.draw_alpha, (0, 0, 10 + tw, 10 + th),
+                        lambda: (math.degrees(self.alpha) * 10,), hz=10)
+
+    return [ff_egt, fuel, asi, turn_coord, horizon, compass, alt, vsi, rpm, controls, alpha]
+
+  # Draw compass card onto surf, centred
+  # Params: hdg - heading in degrees
+  #         radius - radius of card
+  def draw_card(self, surf, hdg, radius):
+    (ww, hh) = surf.get_size()
+    centx = ww / 2
+    centy = hh / 2
+    hdg = convert.degtorad(hdg)
+    pygame.draw.circle(surf, self.black, (centx, centy), radius, 0)
     for i in range(0, 36*2):
       h = i / 2
-      a = convert.degtorad(h * 10) - self.hdg
+      a = convert.degtorad(h * 10) - hdg
       inner_rad = 0.9 if ((h % 1) == 0) else 0.975
       x1 = centx + radius * inner_rad * math.sin(a)
       y1 = centy - radius * inner_rad * math.cos(a)
@@ -59,7 +107,7 @@ class Steam:
       y2 = centy - radius * 1.0 * math.cos(a)
       xt = centx + radius * 0.8 * math.sin(a)
       yt = centy - radius * 0.8 * math.cos(a)
-      pygame.draw.line(self.imgbuf, self.white, (x1, y1), (x2, y2), 3)
+      pygame.draw.line(surf, self.white, (x1, y1), (x2, y2), 3)
  
       col = self.white 
       if h == 0:
@@ -84,51 +132,74 @@ class Steam:
         rtext = pygame.transform.rotate(text, -convert.radtodeg(a))
         textRect = rtext.get_rect()
         textRect.center = (xt, yt)
-        self.imgbuf.blit(rtext, textRect)
+        surf.blit(rtext, textRect)
+
+  # Draw compass rose
+  def draw_rose(self, x, y, size):
+    (ww, hh) = size
+    centx = x + ww / 2   # Centre of compass rose - x
+    centy = y + hh / 2   # Centre of compass rose - y
+    radius = ww * 0.45   # Radius of compass rose
+  
+    # Compass card, drawn at every step of heading up front
+    if self.rose == None:
+      cardsize = int(radius * 2) + 4
+      self.rose = cardatlas.CardAtlas('compass', (cardsize, cardsize),
+                                      lambda surf, hdg: self.draw_card(surf, hdg, radius),
+                                      self.card_step)
+    self.rose.blit(self.imgbuf, (centx, centy), convert.radtodeg(self.hdg))
  
     pygame.draw.line(self.imgbuf, self.white, (centx, centy - radius * 0.5), (centx, centy - radius * 0.9), 3) 
-    text = self.font32.render(f"{int(convert.radtodeg(self.hdg)):03d}",
-                              True, self.yellow, self.black)
+    text = self.text.render(self.font32, f"{int(convert.radtodeg(self.hdg)):03d}",
+                            self.yellow, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy - hh * 0.1)
     self.imgbuf.blit(text, textRect)
   
-  # Draw pitch lines on artificial horizon
-  # Params: surf - surface to draw on
-  #         pl - pitch for pitch line in degrees
-  #         l - length of pitch line
-  #         withtext - if True, label the line
-  def draw_pitchline(self, surf, pl, l, withtext):
-    (sx, sy) = surf.get_size()
-    radius = sx / 2
-    max_pitch = 30.0 # Must agree with the horizon code
-    pitch_px = (convert.radtodeg(self.pitch) + pl) * radius / max_pitch
-    hcent = radius + pitch_px * self.sin_roll
-    vcent = radius + pitch_px * self.cos_roll
-    x1 = hcent - l/2 * self.cos_roll
-    x2 = hcent + l/2 * self.cos_roll
-    y1 = vcent + l/2 * self.sin_roll
-    y2 = vcent - l/2 * self.sin_roll
-    pygame.draw.line(surf, self.white, (x1, y1), (x2, y2), self.rescale_y(2))
-    if (withtext and pl != 0):
-      text = self.font24.render(f"{int(math.fabs(pl)):2d}",
-                                True, self.white, self.blue if pl < 0 else self.brown)
-      rtext = pygame.transform.rotate(text, convert.radtodeg(self.roll))
-      textRect = rtext.get_rect()
-      textRect.center = (x2, y2)
-      surf.blit(rtext, textRect)
+  # Draw the pitch ladder, upright, for the artificial horizon
+  # Params: radius - radius of horizon
+  #         max_pitch - pitch at the edge of the horizon, in degrees
+  # Returns (strip, row of horizon)
+  def draw_ladder(self, radius, max_pitch):
+    k = radius / max_pitch  # Pixels per degree
+    margin = radius + 2     # Room to look past +/-90 degrees
+    w = int(radius * 2) + 4
+    h = int(180 * k + margin * 2)
+    row0 = int(round(margin + 90 * k))
+    cx = w / 2
+    strip = pygame.Surface((w, h), 0, self.imgbuf)
+    strip.fill(self.blue, (0, 0, w, row0))
+    strip.fill(self.brown, (0, row0, w, h - row0))
+
+    r2 = self.rescale_y(2)
+    r50 = self.rescale_y(50)
+    r75 = self.rescale_y(75)
+    r100 = self.rescale_y(100)
+    for pl in range(-8, 8):
+      for (dpl, l) in [(0, r100), (2.5, r50), (5, r75), (7.5, r50)]:
+        y = row0 + (pl * 10 + dpl) * k
+        pygame.draw.line(strip, self.white, (cx - l/2, y), (cx + l/2, y), r2)
+      if pl != 0:
+        text = self.font24.render(f"{abs(pl * 10):2d}", True, self.white,
+                                  self.blue if pl < 0 else self.brown)
+        textRect = text.get_rect()
+        textRect.center = (cx + r100/2, row0 + pl * 10 * k)
+        strip.blit(text, textRect)
+    return (strip, row0)
 
   # Airspeed indicator 
-  def draw_asi(self, x, y, size):
-    fullscale = 200.0
+  asi_fullscale = 200.0
+
+  def face_asi(self, surf, x, y, size):
+    fullscale = self.asi_fullscale
     stall     = 45.0
     vne       = 160.0
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent, size/20, 0)
     for i in range (0, int(fullscale/10)+1):
       spd = (i*10)
       if spd <= stall:
@@ -143,11 +214,18 @@ class Steam:
       x = centx + size*0.4*math.cos(ang)
       y = centy + size*0.4*math.sin(ang)
       textRect.center = (x, y)
-      self.imgbuf.blit(text, textRect)
+      surf.blit(text, textRect)
     text = self.font24.render("IAS Knots", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy-size/5)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_asi(self, x, y, size):
+    fullscale = self.asi_fullscale
+    centx = x + size / 2
+    centy = y + size / 2
+    cent = (centx, centy)
+    self.blit_face('asi', x, y, size, size, self.face_asi, size)
 
     ang = convert.degtorad((self.airspeed / fullscale) * 270 - 240)
     x = centx + size*0.4*math.cos(ang)
@@ -155,31 +233,57 @@ class Steam:
     pygame.draw.line(self.imgbuf, self.white, cent, (x, y), self.rescale_y(8))
    
   # Turn coordinator or "turn and slip" 
-  def draw_turn_coord(self, x, y, size):   
+  def face_turn_coord(self, surf, x, y, size):   
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
 
-    r4  = self.rescale_y(4)
     r6  = self.rescale_y(6)
     r8  = self.rescale_y(8)
     r10 = self.rescale_y(10)
     r20 = self.rescale_y(20)
 
+    # Sideslip tube
+    pygame.draw.rect(surf, self.white,
+                     (centx-size/3, centy+size/4-r10, size/1.5, r20), 1)
+
+    # Turn rate needle pivot
+    pygame.draw.circle(surf, self.white, (centx, centy+size/7), size/30, 0)
+
+    # Dot for two-minute turn (3 deg/sec)
+    ang = convert.degtorad(3.0) * 10 - math.pi / 2
+    x = centx + size * 0.3 * math.cos(ang)
+    y = centy + size * 0.3 * math.sin(ang)
+    pygame.draw.circle(surf, self.white, (x, y), r8)
+    x = centx - size * 0.3 * math.cos(ang)
+    pygame.draw.circle(surf, self.white, (x, y), r8)
+
+    # Dot for one-minute turn (6 deg/sec)
+    ang = convert.degtorad(6.0) * 10 - math.pi / 2
+    x = centx + size * 0.3 * math.cos(ang)
+    y = centy + size * 0.3 * math.sin(ang)
+    pygame.draw.circle(surf, self.white, (x, y), r6)
+    x = centx - size * 0.3 * math.cos(ang)
+    pygame.draw.circle(surf, self.white, (x, y), r6)
+
+  def draw_turn_coord(self, x, y, size):   
+    centx = x + size / 2
+    centy = y + size / 2
+    self.blit_face('turn_coord', x, y, size, size, self.face_turn_coord, size)
+
+    r10 = self.rescale_y(10)
+
     # Sideslip bubble
     ssmax = 5.0
     ss = self.sideslip
     ss = ss if ss < ssmax else ssmax
     ss = ss if ss > -ssmax else -ssmax
-    pygame.draw.rect(self.imgbuf, self.white,
-                     (centx-size/3, centy+size/4-r10, size/1.5, r20), 1)
     pygame.draw.circle(self.imgbuf, self.white,
                        (centx + ss * size / 20, centy + size / 4), r10, 1)
 
     # Turn rate
-    pygame.draw.circle(self.imgbuf, self.white, (centx, centy+size/7), size/30, 0)
     ang = self.turnrate * 10
     # Needle limits
     if (ang > math.pi / 3):
@@ -190,121 +294,75 @@ class Steam:
     x = centx + size * 0.3 * math.cos(ang)
     y = centy + size * 0.3 * math.sin(ang)
     pygame.draw.line(self.imgbuf, self.white, (centx, centy+size/7), (x, y), r10)
-
-    # Dot for two-minute turn (3 deg/sec)
-    ang = convert.degtorad(3.0) * 10 - math.pi / 2
-    x = centx + size * 0.3 * math.cos(ang)
-    y = centy + size * 0.3 * math.sin(ang)
-    pygame.draw.circle(self.imgbuf, self.white, (x, y), r8)
-    x = centx - size * 0.3 * math.cos(ang)
-    pygame.draw.circle(self.imgbuf, self.white, (x, y), r8)
-
-    # Dot for one-minute turn (6 deg/sec)
-    ang = convert.degtorad(6.0) * 10 - math.pi / 2
-    x = centx + size * 0.3 * math.cos(ang)
-    y = centy + size * 0.3 * math.sin(ang)
-    pygame.draw.circle(self.imgbuf, self.white, (x, y), r6)
-    x = centx - size * 0.3 * math.cos(ang)
-    pygame.draw.circle(self.imgbuf, self.white, (x, y), r6)
     
   # Artificial horizon 
-  def draw_horizon(self, x, y, size):   
+  # The face goes over the ball: airplane symbol, ring and bank marks
+  def face_horizon(self, surf, x, y, size, radius):
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-
-    # offset allows the circular gauge to be smaller than the bounding square region
-    offset = self.rescale_x(8)
-    radius = size / 2 - offset
-    # horimgbuf is of size radius*2 square. Will be cropped to a circle below.
-    horimgbuf = pygame.Surface((radius*2, radius*2))
-
-    # Draw brown/blue horizon
-    # Artificial horizon
-    l = radius * 2
-    imsize_y_deg = 90       # In degrees of pitch
-    max_pitch = 30.0        # Range of horizon +/- degrees
-    pitch_deg = convert.radtodeg(self.pitch)
-    pitch_px = pitch_deg * radius / max_pitch
-    hcent = radius + pitch_px * self.sin_roll
-    vcent = radius + pitch_px * self.cos_roll
-    x1 = hcent - l * self.cos_roll
-    x2 = hcent + l * self.cos_roll
-    y1 = vcent + l * self.sin_roll
-    y2 = vcent - l * self.sin_roll
-    pitch_px = (pitch_deg - imsize_y_deg) * radius / max_pitch
-    hcent = radius + pitch_px * self.sin_roll
-    vcent = radius + pitch_px * self.cos_roll
-    x3 = hcent - l * self.cos_roll
-    x4 = hcent + l * self.cos_roll
-    y3 = vcent + l * self.sin_roll
-    y4 = vcent - l * self.sin_roll
-    pygame.draw.polygon(horimgbuf, self.blue, [(x1, y1), (x2, y2), (x4, y4), (x3, y3)])
-    pitch_px = (pitch_deg + imsize_y_deg) * radius / max_pitch
-    hcent = radius + pitch_px * self.sin_roll
-    vcent = radius + pitch_px * self.cos_roll
-    x3 = hcent - l * self.cos_roll
-    x4 = hcent + l * self.cos_roll
-    y3 = vcent + l * self.sin_roll
-    y4 = vcent - l * self.sin_roll
-    pygame.draw.polygon(horimgbuf, self.brown, [(x1, y1), (x2, y2), (x4, y4), (x3, y3)])
+    ox = centx - radius # Top left of ball
+    oy = centy - radius
 
     r6 = self.rescale_y(6)
     r8 = self.rescale_y(8)
     r20 = self.rescale_y(20)
     r50 = self.rescale_y(50)
-    r75 = self.rescale_y(75)
-    r100 = self.rescale_y(100)
     r200 = self.rescale_y(200)
     r300 = self.rescale_y(300)
 
     # Airplane symbol 
-    pygame.draw.line(horimgbuf, self.yellow, (r200, radius), (r300, radius), r8)
-    pygame.draw.line(horimgbuf, self.yellow, (2*radius-r300, radius), (2*radius-r200, radius), r8)
-    pygame.draw.line(horimgbuf, self.yellow, (radius-r50, radius+r20), (radius, radius), r6)
-    pygame.draw.line(horimgbuf, self.yellow, (radius+r50, radius+r20), (radius, radius), r6)
-
-    # Pitch graticule
-    for pl in range(-8, 8):
-      self.draw_pitchline(horimgbuf, pl * 10,       r100, True)
-      self.draw_pitchline(horimgbuf, pl * 10 + 2.5, r50,  False)
-      self.draw_pitchline(horimgbuf, pl * 10 + 5,   r75,  False)
-      self.draw_pitchline(horimgbuf, pl * 10 + 7.5, r50,  False)
-   
-    # Use alpha channel to extract circular portion of horimgbuf
-    horimgbuf.convert_alpha()
-    maskimg = pygame.Surface(horimgbuf.get_size(), pygame.SRCALPHA)
-    pygame.draw.rect(maskimg, (128,128,128,255), (0, 0, radius*2, radius*2), 0)
-    pygame.draw.ellipse(maskimg, (255, 255, 255, 0), horimgbuf.get_rect())
-    horimgbuf.blit(maskimg, (0, 0), special_flags=0) # pygame.BLEND_RGBA_MIN)
-    self.imgbuf.blit(horimgbuf, (x+offset, y+offset), (0, 0, radius*2, radius*2))
+    pygame.draw.line(surf, self.yellow, (ox+r200, oy+radius), (ox+r300, oy+radius), r8)
+    pygame.draw.line(surf, self.yellow, (ox+2*radius-r300, oy+radius), (ox+2*radius-r200, oy+radius), r8)
+    pygame.draw.line(surf, self.yellow, (ox+radius-r50, oy+radius+r20), (ox+radius, oy+radius), r6)
+    pygame.draw.line(surf, self.yellow, (ox+radius+r50, oy+radius+r20), (ox+radius, oy+radius), r6)
+    # Clip it to the ball
+    pygame.draw.circle(surf, surf.get_colorkey(), cent, size, int(size - radius))
 
     # Ring around the instrument
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
 
     for a in [-45, -30, 0, +30, +45]:
       ang = convert.degtorad(a - 90)
       x = centx + size*0.45*math.cos(ang)
       y = centy + size*0.45*math.sin(ang)
-      pygame.draw.circle(self.imgbuf, self.white, (x, y), self.rescale_y(6))
+      pygame.draw.circle(surf, self.white, (x, y), r6)
+
+  def draw_horizon(self, x, y, size):   
+    # offset allows the circular gauge to be smaller than the bounding square region
+    offset = self.rescale_x(8)
+    radius = size / 2 - offset
+    max_pitch = 30.0        # Range of horizon +/- degrees
+
+    if self.ball == None:
+      (strip, row0) = self.draw_ladder(radius, max_pitch)
+      self.ball = attitude.AttitudeBall(strip, row0, radius)
+    pitch_px = convert.radtodeg(self.pitch) * radius / max_pitch
+    ball = self.ball.render(pitch_px, self.sin_roll, self.cos_roll)
+    self.imgbuf.blit(ball, (x+offset, y+offset))
+    self.blit_face('horizon', x, y, size, size, self.face_horizon, size, radius,
+                   colorkey=(255,0,255))
     
   # Gyro compass 
-  def draw_compass(self, x, y, size):   
+  def face_compass(self, surf, x, y, size):   
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+
+  def draw_compass(self, x, y, size):   
+    self.blit_face('compass', x, y, size, size, self.face_compass, size)
     self.draw_rose(x, y, (size, size))
     
   # Altimeter 
-  def draw_alt(self, x, y, size):   
+  def face_alt(self, surf, x, y, size):   
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent, size/20, 0)
     for i in range (0, 10):
       text = self.font32.render(f"{i:d}", True, self.white, self.black)
       textRect = text.get_rect()
@@ -312,11 +370,17 @@ class Steam:
       x = centx + size*0.4*math.cos(ang)
       y = centy + size*0.4*math.sin(ang)
       textRect.center = (x, y)
-      self.imgbuf.blit(text, textRect)
+      surf.blit(text, textRect)
     text = self.font24.render("ALT ftx1000", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy-size/5)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_alt(self, x, y, size):   
+    centx = x + size / 2
+    centy = y + size / 2
+    cent = (centx, centy)
+    self.blit_face('alt', x, y, size, size, self.face_alt, size)
 
     ang = convert.degtorad(self.altitude / 100000.0 * 360 - 90) # Outer
     x = centx + size*0.45*math.cos(ang)
@@ -332,14 +396,16 @@ class Steam:
     pygame.draw.line(self.imgbuf, self.white, cent, (x, y), self.rescale_y(4))
     
   # Vertical Speed Indicator (or "Rate of Climb") 
-  def draw_vsi(self, x, y, size):   
-    fullscale = 5000
+  vsi_fullscale = 5000
+
+  def face_vsi(self, surf, x, y, size):   
+    fullscale = self.vsi_fullscale
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent, size/20, 0)
     for i in range (-int(fullscale/1000), int(fullscale/1000)+1):
       roc = i * 1000
       text = self.font32.render(f"{i:+d}", True, self.white, self.black)
@@ -348,11 +414,18 @@ class Steam:
       x = centx + size*0.4*math.cos(ang)
       y = centy + size*0.4*math.sin(ang)
       textRect.center = (x, y)
-      self.imgbuf.blit(text, textRect)
+      surf.blit(text, textRect)
     text = self.font24.render("FPM x1000", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy-size/5)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_vsi(self, x, y, size):   
+    fullscale = self.vsi_fullscale
+    centx = x + size / 2
+    centy = y + size / 2
+    cent = (centx, centy)
+    self.blit_face('vsi', x, y, size, size, self.face_vsi, size)
 
     ang = (self.roc / fullscale) * 130
     # End stops for pointer
@@ -366,13 +439,13 @@ class Steam:
     pygame.draw.line(self.imgbuf, self.white, cent, (x, y), self.rescale_y(16))
 
   # Draw RPM guage
-  def draw_rpm(self, x, y, size):
+  def face_rpm(self, surf, x, y, size):
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent, size/20, 0)
     for i in range (0, 8):
       rpm = i * 5
       text = self.font24.render(f"{rpm:d}", True, self.white, self.black)
@@ -382,11 +455,17 @@ class Steam:
       x = centx + size*0.4*math.cos(ang)
       y = centy + size*0.4*math.sin(ang)
       textRect.center = (x, y)
-      self.imgbuf.blit(text, textRect)
+      surf.blit(text, textRect)
     text = self.font24.render("RPM x100", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy-size/5)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_rpm(self, x, y, size):
+    centx = x + size / 2
+    centy = y + size / 2
+    cent = (centx, centy)
+    self.blit_face('rpm', x, y, size, size, self.face_rpm, size)
 
     ang = (self.rpm / 4000) * 270
     ang = convert.degtorad(ang - 225)
@@ -395,38 +474,45 @@ class Steam:
     pygame.draw.line(self.imgbuf, self.white, cent, (x, y), self.rescale_y(8))
    
   # Draw fuel-flow and EGT dual guage
-  def draw_ff_egt(self, x, y, size):
+  def face_ff_egt(self, surf, x, y, size):
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
     cent_l = (centx - size/15, centy)
     cent_r = (centx + size/15, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent_l, size/20, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent_r, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent_l, size/20, 0)
+    pygame.draw.circle(surf, self.white, cent_r, size/20, 0)
 
     text = self.font16.render("90", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/5, centy-size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     text = self.font16.render("0", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/5, centy+size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     text = self.font16.render("FLOW", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/3, centy)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     text = self.font16.render("lbs/hr", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/3, centy+size/10)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
 
     text = self.font16.render("EGT", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx+size/3, centy)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_ff_egt(self, x, y, size):
+    centx = x + size / 2
+    centy = y + size / 2
+    cent_l = (centx - size/15, centy)
+    cent_r = (centx + size/15, centy)
+    self.blit_face('ff_egt', x, y, size, size, self.face_ff_egt, size)
 
     if self.fuel_flow > 90:
       self.fuel_flow = 90
@@ -449,33 +535,40 @@ class Steam:
     pygame.draw.line(self.imgbuf, self.white, cent_r, (x, y), self.rescale_y(4))
   
   # Draw dual fuel gauge
-  def draw_fuel(self, x, y, size):
+  def face_fuel(self, surf, x, y, size):
     centx = x + size / 2
     centy = y + size / 2
     cent = (centx, centy)
     cent_l = (centx - size/15, centy)
     cent_r = (centx + size/15, centy)
-    pygame.draw.circle(self.imgbuf, self.black, cent, size/2, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent, size/2, 2)
-    pygame.draw.circle(self.imgbuf, self.white, cent_l, size/20, 0)
-    pygame.draw.circle(self.imgbuf, self.white, cent_r, size/20, 0)
+    pygame.draw.circle(surf, self.black, cent, size/2, 0)
+    pygame.draw.circle(surf, self.white, cent, size/2, 2)
+    pygame.draw.circle(surf, self.white, cent_l, size/20, 0)
+    pygame.draw.circle(surf, self.white, cent_r, size/20, 0)
 
     text = self.font16.render("28", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/5, centy-size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     textRect.center = (centx+size/5, centy-size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     text = self.font16.render("0", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx-size/5, centy+size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     textRect.center = (centx+size/5, centy+size/3)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
     text = self.font16.render("FUEL gal", True, self.white, self.black)
     textRect = text.get_rect()
     textRect.center = (centx, centy-size/5)
-    self.imgbuf.blit(text, textRect)
+    surf.blit(text, textRect)
+
+  def draw_fuel(self, x, y, size):
+    centx = x + size / 2
+    centy = y + size / 2
+    cent_l = (centx - size/15, centy)
+    cent_r = (centx + size/15, centy)
+    self.blit_face('fuel', x, y, size, size, self.face_fuel, size)
 
     ang = (self.fuel_left / 106) * 140
     ang = convert.degtorad(ang - 250)
@@ -491,87 +584,47 @@ class Steam:
    
    
   # Draw control positions
+  def face_controls(self, surf, x, y, size):
+    r30 = self.rescale_y(30)
+    pygame.draw.rect(surf, self.black, (x, y, r30, size), 1)
+    pygame.draw.rect(surf, self.black, (x + size/4, y, r30, size), 1)
+    x += size / 2
+    pygame.draw.rect(surf, self.black, (x, y, size, size), 0)
+    border = self.rescale_y(10)
+    size -= border*2
+    x += border
+    y += border
+    pygame.draw.rect(surf, self.red, (x, y, size, size), 1)
+
   def draw_controls(self, x, y, size):
     r15 = self.rescale_y(15)
     r20 = self.rescale_y(20)
     r30 = self.rescale_y(30)
-    pygame.draw.rect(self.imgbuf, self.black, (x, y, r30, size), 1)
+    self.blit_face('controls', x, y, size*1.5, size, self.face_controls, size)
     pygame.draw.circle(self.imgbuf, self.black, (x+r15, y + size - size * self.throttle), r30)
-    pygame.draw.rect(self.imgbuf, self.black, (x + size/4, y, r30, size), 1)
     pygame.draw.circle(self.imgbuf, self.red, (x+r15 + size/4, y + size - size * self.mixture), r30)
     x += size / 2
-    pygame.draw.rect(self.imgbuf, self.black, (x, y, size, size), 0)
     border = self.rescale_y(10)
     size -= border*2
     x += border
     y += border
-    pygame.draw.rect(self.imgbuf, self.red, (x, y, size, size), 1)
     pygame.draw.circle(self.imgbuf, self.red,
                        (x+size/2+size/2*self.aileron, y+size/2+size/2*self.elevator), r20)
     pygame.draw.circle(self.imgbuf, self.red,
                        (x+size/2+size/2*self.rudder, y+size), r20,
                        1 if self.autorudder == True else 0)
     if self.flap > 0:
-      text = self.font32.render(f"FLAPS {int(self.flap*10):d}", True, self.red, self.black)
+      text = self.text.render(self.font32, f"FLAPS {int(self.flap*10):d}", self.red, self.black)
       textRect = text.get_rect()
       textRect.center = (x + size*0.8, y + size * 0.05)
       self.imgbuf.blit(text, textRect)
     
 
-  # Draw Steam Panel.  Main entry point.
-  def draw(self, roll, pitch, hdg, yaw_d, x_d, z_world, z_d_world,
-           aileron, elevator, rudder, throttle, mixture, flap, autorudder, y_dd, alpha,
-           rpm, fuel_flow, egt, fuel_left, fuel_right):
-    (w, h) = self.size
-
-    self.roll      = roll
-    self.pitch     = pitch
-    self.hdg       = hdg
-    self.turnrate  = yaw_d
-    self.sideslip  = y_dd
-    self.airspeed  = convert.speedtoknots(x_d)
-    self.roc       = convert.speedtofeetpermin(z_d_world)
-    self.altitude  = convert.metrestofeet(z_world)
-    self.rpm       = rpm
-    self.fuel_flow = fuel_flow
-    self.egt       = egt
-    self.fuel_left = fuel_left
-    self.fuel_right= fuel_right
-
-    self.aileron    = aileron
-    self.elevator   = elevator
-    self.rudder     = rudder
-    self.throttle   = throttle
-    self.mixture    = mixture
-    self.flap       = flap
-    self.autorudder = autorudder
-
-    self.sin_roll = math.sin(roll)
-    self.cos_roll = math.cos(roll)
-
-    pygame.draw.rect(self.imgbuf, self.grey, (0, 0, w, h), 0)
-    border = 10
-    diameter = h/2.1
-    spacing = h/2.0
-    self.draw_ff_egt(border+spacing/4, border+spacing/4, diameter*0.75)
-    self.draw_fuel(border+spacing/4, border+spacing, diameter*0.75)
-    self.draw_asi(border+spacing, border, diameter)
-    self.draw_turn_coord(border+spacing, border+spacing, diameter)
-    self.draw_horizon(border+2*spacing, border, diameter)
-    self.draw_compass(border+2*spacing, border+spacing, diameter)
-    self.draw_alt(border+3*spacing, border, diameter)
-    self.draw_vsi(border+3*spacing, border+spacing, diameter)
-    self.draw_rpm(border+4*spacing, border+spacing, diameter*0.75)
-    self.draw_controls(border+4.8*spacing, border+diameter/4, diameter*1.5)
-
-    # Angle of attack
-    text = self.font24.render(f"\u03b1={convert.radtodeg(alpha):+0.1f}\u00b0", True, self.magenta, self.black)
+  # Angle of attack readout
+  def draw_alpha(self):
+    text = self.text.render(self.font24, f"\u03b1={convert.radtodeg(self.alpha):+0.1f}\u00b0", self.magenta, self.black)
     textRect = text.get_rect()
     textRect.center = (10, 10)
     self.imgbuf.blit(text, textRect)
-    
-    (sx, sy) = self.size 
-    self.display.blit(self.imgbuf, self.offset, (0, 0, sx, sy)) # Blit buffer to real display
-    pygame.display.flip()
   
   
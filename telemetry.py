@@ -0,0 +1,136 @@
+#
+# Telemetry
+# Streams the aircraft's state over UDP in X-Plane's 'DATA' format, which
+# external visuals, moving maps and data loggers already understand.
+#  - The sim hands over snapshots, and a background thread packs and sends
+#    them, so the sim never waits on the network
+#  - Snapshots wait in a short queue.  If the sender falls behind, the
+#    oldest are dropped, as only the newest state matters.
+#
+# Packet layout: b'DATA', one byte 0, then for each data set a little
+# endian int32 data set number and 8 float32 values, -999 where unused.
+# Data sets sent (X-Plane 10/11 numbering):
+#   3  speeds: kias, keas, ktas, ktgs, -, mph ias, mph tas, mph gs
+#   4  mach, -, vertical speed fpm
+#   8  controls: elevator, aileron, rudder (-1 to +1)
+#   13 flaps: -, -, -, handle, position (0 to 1)
+#   14 brakes: gear, parking brake, left brake, right brake
+#   16 angular rates: pitch, roll, yaw, in rad/s
+#   17 attitude: pitch, roll, true heading, magnetic heading, in degrees
+#   18 alpha, -, flight path heading, flight path climb angle, in degrees
+#   20 latitude, longitude, altitude ft MSL, ft AGL, on the ground
+#   25 throttle (0 to 1)
+#   29 mixture (0 to 1)
+#   37 engine rpm
+#   45 fuel flow, lb/hr
+#   47 EGT, fahrenheit
+#   62 fuel tank weights, lb
+# Latitude and longitude are worked out from the sim's north and east
+# metres, relative to an origin.
+#
+
+import math
+import time
+import socket
+import struct
+import threading
+import collections
+import convert
+
+default_port = 49003 # Where X-Plane sends its own data output
+origin = (43.9844, -88.5570) # Latitude and longitude of the sim's (0, 0)
+metres_per_degree = 111320.0
+
+datasets = [3, 4, 8, 13, 14, 16, 17, 18, 20, 25, 29, 37, 45, 47, 62]
+unused = -999.0
+packet = struct.Struct('<4sx' + 'i8f' * len(datasets))
+
+class Exporter:
+
+  # Params: host, port - where to send to
+  #         rate - packets per second, at most
+  #         depth - snapshots that can wait to be sent
+  def __init__(self, host, port=default_port, rate=20, depth=4):
+    self.addr     = (host, port)
+    self.interval = 1.0 / rate
+    self.last     = -math.inf # When a snapshot was last queued
+    self.sent     = 0
+    self.dropped  = 0         # Snapshots dropped because the sender was behind
+    self.queue    = collections.deque(maxlen=depth)
+    self.cond     = threading.Condition()
+    self.stopping = False
+    self.buf      = bytearray(packet.size)
+    self.values   = [0.0] * (len(datasets) * 9)
+    self.sock     = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    self.thread   = threading.Thread(target=self.sender, daemon=True)
+    self.thread.start()
+
+  # Queue a snapshot to send, if it is time for one
+  # Params: s - pipeline.Snapshot
+  def send(self, s):
+    now = time.perf_counter()
+    if now - self.last < self.interval:
+      return
+    self.last = now
+    with self.cond:
+      if len(self.queue) == self.queue.maxlen:
+        self.dropped += 1 # The deque drops the oldest
+      self.queue.append(s)
+      self.cond.notify()
+
+  # Sender thread
+  def sender(self):
+    while True:
+      with self.cond:
+        self.cond.wait_for(lambda: self.stopping or len(self.queue) > 0)
+        if self.stopping:
+          break
+        s = self.queue.popleft()
+      self.pack(s)
+      try:
+        self.sock.sendto(self.buf, self.addr)
+        self.sent += 1
+      except OSError:
+        pass # eg: nothing listening.  Keep going.
+
+  # Pack a snapshot into buf
+  def pack(self, s):
+    kias  = convert.speedtoknots(s.x_d)
+    ktas  = convert.speedtoknots(s.tas)
+    lat   = origin[0] + s.n_world / metres_per_degree
+    lon   = origin[1] + s.e_world / (metres_per_degree * math.cos(math.radians(origin[0])))
+    alt   = convert.metrestofeet(s.z_world)
+    hdg   = math.degrees(s.hdg)
+    lbs   = convert.kgstolbs(0.72) # Per litre of avgas
+    rows = [
+      (kias, kias, ktas, ktas, unused, convert.speedtomph(s.x_d), convert.speedtomph(s.tas), convert.speedtomph(s.tas)),
+      (s.tas / 340.3, unused, convert.speedtofeetpermin(s.z_d_world)),
+      (s.elevator, s.aileron, s.rudder),
+      (unused, unused, unused, s.flap / 3, s.flap / 3),
+      (1.0, float(s.pbrake), float(s.brake), float(s.brake)),
+      (s.pitch_d, s.roll_d, s.yaw_d),
+      (math.degrees(s.pitch), math.degrees(s.roll), hdg, hdg),
+      (math.degrees(s.alpha), unused, hdg, math.degrees(math.atan2(s.z_d_world, max(s.tas, 0.1)))),
+      (lat, lon, alt, alt, float(s.z_world < 1e-3)),
+      (s.throttle,),
+      (s.mixture,),
+      (s.rpm,),
+      (s.fuel_flow,),
+      (s.egt,),
+      (s.fuel_left * lbs, s.fuel_right * lbs)]
+    v = self.values
+    for (i, (n, row)) in enumerate(zip(datasets, rows)):
+      j = i * 9
+      v[j] = n
+      v[j + 1:j + 1 + len(row)] = row
+      v[j + 1 + len(row):j + 9] = (unused,) * (8 - len(row))
+    packet.pack_into(self.buf, 0, b'DATA', *v)
+
+  # Stop the sender thread
+  def close(self):
+    with self.cond:
+      self.stopping = True
+      self.cond.notify()
+    self.thread.join()
+    self.sock.close()
+    print(f"Telemetry: sent {self.sent:d} packets to {self.addr[0]}:{self.addr[1]:d}, {self.dropped:d} dropped")
@@ -0,0 +1,93 @@
+#
+# Tests for the simulation server
+# Each test runs a Server on its own event loop in a thread, and talks to
+# it with simserver.Client over a socket in a temporary directory.
+#   python3 -m unittest test_simserver
+#
+
+import os
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+
+import simserver
+
+class ServerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.dir = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.dir.name, 'sim.sock')
+    self.loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    async def start():
+      self.server = simserver.Server()
+      self.listener = await asyncio.start_unix_server(self.server.handle, self.path)
+      self.stepper = asyncio.get_running_loop().create_task(self.server.stepper())
+      started.set()
+
+    self.thread = threading.Thread(target=self.loop.run_forever)
+    self.thread.start()
+    asyncio.run_coroutine_threadsafe(start(), self.loop)
+    started.wait(10)
+
+  def tearDown(self):
+    async def stop():
+      self.listener.close()
+      self.stepper.cancel()
+      for client in self.server.clients:
+        client.cancel()
+      await asyncio.gather(self.stepper, *self.server.clients, return_exceptions=True)
+    asyncio.run_coroutine_threadsafe(stop(), self.loop).result(10)
+    self.loop.call_soon_threadsafe(self.loop.stop)
+    self.thread.join(10)
+    self.loop.close()
+    self.dir.cleanup()
+
+  def test_disconnect_during_step(self):
+    client = simserver.Client(self.path)
+    id = client.create()
+    plane = self.server.aircraft[id]
+
+    # Ask for far more frames than can run, and hang up part way
+    body = bytes([simserver.op_step]) + simserver.step.pack(id, 1000000)
+    client.sock.sendall(simserver.length.pack(len(body)) + body)
+    time.sleep(0.2)
+    client.close()
+    time.sleep(0.2)
+
+    self.assertNotIn(id, self.server.aircraft) # Destroyed
+    t = plane.t
+    self.assertGreater(t, 0.0)
+    time.sleep(0.3)
+    self.assertEqual(plane.t, t)           # and not stepped any more
+    self.assertEqual(len(self.server.pending), 0)
+
+  def test_step_answered_after_pipelined_request(self):
+    client = simserver.Client(self.path)
+    id = client.create()
+    # A STEP then a GET sent together: both answered, in order
+    for body in [bytes([simserver.op_step]) + simserver.step.pack(id, 20),
+                 bytes([simserver.op_get]) + simserver.ident.pack(id)]:
+      client.sock.sendall(simserver.length.pack(len(body)) + body)
+    for i in range(0, 2):
+      (n,) = simserver.length.unpack(client.receive(simserver.length.size))
+      self.assertEqual(client.receive(n)[0], simserver.status_ok)
+    client.close()
+
+  def test_aircraft_belong_to_their_connection(self):
+    (owner, other) = (simserver.Client(self.path), simserver.Client(self.path))
+    id = owner.create()
+    self.assertEqual(other.set(id, throttle=1.0), simserver.status_no_such)
+    self.assertEqual(other.step(id)[0], simserver.status_no_such)
+    self.assertEqual(other.request(simserver.op_destroy, simserver.ident.pack(id))[0],
+                     simserver.status_no_such)
+    self.assertEqual(other.get(id)[0], simserver.status_ok) # Anyone can look
+    self.assertEqual(owner.step(id)[0], simserver.status_ok)
+    other.close()
+    owner.close()
+
+if __name__ == '__main__':
+  unittest.main()
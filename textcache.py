@@ -0,0 +1,46 @@
+#
+# Text cache
+# Rendering text and rotating it are among the slowest things the
+# instruments do, and they mostly draw the same few labels at the same few
+# angles frame after frame.  The cache keeps the finished surfaces, keyed by
+# font, string, colours and angle, and throws out the least recently used
+# ones when it fills up.
+#
+
+import collections
+import pygame
+
+class TextCache:
+
+  # Params: maxsize - number of surfaces to keep
+  #         step - angles are rounded to a multiple of this, in degrees
+  def __init__(self, maxsize=512, step=1.0):
+    self.maxsize = maxsize
+    self.step    = step
+    self.cache   = collections.OrderedDict()
+    self.hits    = 0
+    self.misses  = 0
+
+  # Render text, rotated anticlockwise by angle degrees
+  # Same as font.render() followed by pygame.transform.rotate()
+  # Returns the surface, which must not be drawn on
+  def render(self, font, text, colour, background=None, angle=0.0):
+    angle = (round(angle / self.step) * self.step) % 360.0
+    key = (font, text, colour, background, angle)
+    surf = self.cache.get(key)
+    if surf != None:
+      self.cache.move_to_end(key)
+      self.hits += 1
+      return surf
+
+    self.misses += 1
+    surf = font.render(text, True, colour, background)
+    if angle != 0.0:
+      surf = pygame.transform.rotate(surf, angle)
+    self.cache[key] = surf
+    if len(self.cache) > self.maxsize:
+      self.cache.popitem(last=False)
+    return surf
+
+  def clear(self):
+    self.cache.clear()
@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+
+#
+# Table-driven trigonometry
+# Sine and cosine looked up in tables, with linear interpolation between
+# entries, as an alternative to math and NumPy.
+#  - Table is floating point, with any number of entries round the circle
+#  - FixedTable is integers only, as the 8/16-bit port will have to do it:
+#    angles are 16-bit binary angles (65536 to the circle, so they wrap by
+#    themselves) and results are signed fixed point with 'one' as given
+#  - Each has scalar functions, and array ones taking and returning NumPy
+#    arrays
+# Run this module to compare them with math and NumPy for accuracy and
+# speed on this machine:
+#   python3 trig.py
+# In CPython a table lookup is several bytecodes against one call into C,
+# so math.sin() stays quicker than any table for single values.  The flight
+# model and renderer work out each sine and cosine once per step instead,
+# and leave the tables to the fixed point port, where they are the only
+# way.
+#
+
+import math
+import time
+import numpy as np
+
+tau = 2 * math.pi
+
+class Table:
+
+  # Params: size - entries round the circle, a power of two
+  def __init__(self, size=4096):
+    self.size  = size
+    self.mask  = size - 1
+    self.scale = size / tau # Entries per radian
+    self.quarter = size // 4
+    # One entry over the end so interpolation never has to wrap
+    self.table = np.sin(np.arange(size + 1) * (tau / size))
+    self.values = self.table.tolist()
+
+  # Sine of an angle in radians
+  def sin(self, a):
+    x = a * self.scale
+    i = math.floor(x)
+    f = x - i
+    i &= self.mask
+    t = self.values
+    return t[i] + (t[i + 1] - t[i]) * f
+
+  # Cosine of an angle in radians
+  def cos(self, a):
+    return self.sin(a + math.pi / 2)
+
+  # Returns (sine, cosine) of an angle in radians
+  def sincos(self, a):
+    x = a * self.scale
+    i = math.floor(x)
+    f = x - i
+    t = self.values
+    j = (i + self.quarter) & self.mask
+    i &= self.mask
+    return (t[i] + (t[i + 1] - t[i]) * f, t[j] + (t[j + 1] - t[j]) * f)
+
+  # Sines of an array of angles in radians
+  def sin_array(self, a):
+    x = np.asarray(a, dtype=float) * self.scale
+    i = np.floor(x)
+    f = x - i
+    i = i.astype(np.intp) & self.mask
+    t = self.table
+    return t[i] + (t[i + 1] - t[i]) * f
+
+  # Cosines of an array of angles in radians
+  def cos_array(self, a):
+    return self.sin_array(np.asarray(a, dtype=float) + math.pi / 2)
+
+class FixedTable:
+
+  # Params: bits - log2 of the entries round the circle, up to 16
+  #         one - fixed point value of 1.0, eg: 16384 (Q14) so that the
+  #               results and their products fit in 16 and 32 bits
+  def __init__(self, bits=8, one=16384):
+    self.bits  = bits
+    self.one   = one
+    self.shift = 16 - bits          # Angle bits below the table index
+    self.mask  = (1 << bits) - 1
+    self.quarter = 1 << (bits - 2)
+    table = np.round(np.sin(np.arange((1 << bits) + 1) * (tau / (1 << bits))) * one)
+    self.table = table.astype(np.int32)
+    self.values = self.table.tolist()
+
+  # Binary angle, 0 to 65535, of an angle in radians
+  @staticmethod
+  def angle(a):
+    return int(round(a * 65536 / tau)) & 0xffff
+
+  # Sine of a binary angle, as fixed point
+  def sin(self, b):
+    i = (b >> self.shift) & self.mask
+    f = b & ((1 << self.shift) - 1)
+    t = self.values
+    return t[i] + (((t[i + 1] - t[i]) * f) >> self.shift)
+
+  # Cosine of a binary angle, as fixed point
+  def cos(self, b):
+    return self.sin(b + 0x4000)
+
+  # Sines of an array of binary angles, as fixed point
+  def sin_array(self, b):
+    b = np.asarray(b, dtype=np.int32)
+    i = (b >> self.shift) & self.mask
+    f = b & ((1 << self.shift) - 1)
+    t = self.table
+    return t[i] + (((t[i + 1] - t[i]) * f) >> self.shift)
+
+  # Cosines of an array of binary angles, as fixed point
+  def cos_array(self, b):
+    return self.sin_array(np.asarray(b, dtype=np.int32) + 0x4000)
+
+# Accuracy and speed of the tables against math and NumPy
+def benchmark(n=200000):
+  rng = np.random.default_rng(1)
+  angles = rng.uniform(-tau, tau, n)
+  exact = np.sin(angles)
+  scalars = angles[:20000].tolist()
+
+  # Seconds per call of func over every angle in values
+  def per_call(func, values):
+    start = time.perf_counter()
+    for a in values:
+      func(a)
+    return (time.perf_counter() - start) / len(values)
+
+  # Seconds per element of func on the whole array
+  def per_element(func, values):
+    best = math.inf
+    for i in range(0, 5):
+      start = time.perf_counter()
+      func(values)
+      best = min(best, time.perf_counter() - start)
+    return best / len(values)
+
+  print(f"{'':24s}{'max error':>12s}{'scalar ns':>12s}{'array ns':>12s}")
+  print(f"{'math / numpy':24s}{0.0:12.2e}{per_call(math.sin, scalars) * 1e9:12.1f}"
+        f"{per_element(np.sin, angles) * 1e9:12.2f}")
+  for size in [256, 1024, 4096, 16384]:
+    t = Table(size)
+    error = np.max(np.abs(t.sin_array(angles) - exact))
+    print(f"{f'Table({size:d})':24s}{error:12.2e}{per_call(t.sin, scalars) * 1e9:12.1f}"
+          f"{per_element(t.sin_array, angles) * 1e9:12.2f}")
+  binary = np.round(angles * 65536 / tau).astype(np.int64) & 0xffff
+  exact = np.sin(binary * (tau / 65536))
+  for bits in [6, 8, 10]:
+    t = FixedTable(bits)
+    error = np.max(np.abs(t.sin_array(binary) / t.one - exact))
+    print(f"{f'FixedTable({bits:d}, Q14)':24s}{error:12.2e}"
+          f"{per_call(t.sin, binary[:20000].tolist()) * 1e9:12.1f}"
+          f"{per_element(t.sin_array, binary) * 1e9:12.2f}")
+
+if __name__ == '__main__':
+  benchmark()
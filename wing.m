@@ -314,26 +314,6 @@ grid
 grid minor
 title("Resampled Moment - Clean(b), Flap30(r)")
 
-fp = fopen("wing_tables.py", "w");
-fprintf(fp, "clean_tab = [\n");
-for ii = 1:361
-  if ii > 1
-    fprintf(fp, ",\n");
-  end
-  fprintf(fp, "(%.5f, %.5f, %.5f)", clean_lift_resampled(ii), clean_drag_resampled(ii), clean_moment_resampled(ii));
-end
-fprintf(fp, "\n]\n\n");
-
-fprintf(fp, "flap30_delta_tab = [\n");
-for ii = 1:361
-  if ii > 1
-    fprintf(fp, ",\n");
-  end
-  fprintf(fp, "(%.5f, %.5f, %.5f)", flap30_lift_delta(ii), flap30_drag_delta(ii), flap30_moment_delta(ii));
-end
-fprintf(fp, "\n]\n");
-fclose(fp);
-
-
-
-
+% The simulator's tables are generated from the data above, the same way, by
+% aerodb.py, into wing_tables.bin.  Run it after changing the data:
+%   python3 aerodb.py
@@ -1,727 +0,0 @@
-clean_tab = [
-(-0.24786, 0.00663, -0.17780),
-(-0.20206, 0.00798, -0.11788),
-(-0.15626, 0.00934, -0.05796),
-(-0.11047, 0.01070, 0.00196),
-(-0.06467, 0.01205, 0.06188),
-(-0.01887, 0.01341, 0.12180),
-(0.02693, 0.01477, 0.18172),
-(0.07272, 0.01613, 0.24164),
-(0.11852, 0.01748, 0.30156),
-(0.16432, 0.01884, 0.36148),
-(0.21012, 0.02020, 0.42140),
-(0.22651, 0.02370, 0.45199),
-(0.24291, 0.02720, 0.48258),
-(0.25930, 0.03070, 0.51317),
-(0.27570, 0.03420, 0.54376),
-(0.29210, 0.03771, 0.57435),
-(0.30849, 0.04121, 0.60494),
-(0.32489, 0.04471, 0.63553),
-(0.34128, 0.04821, 0.66612),
-(0.35768, 0.05171, 0.69671),
-(0.37408, 0.05522, 0.72730),
-(0.41137, 0.06055, 0.74865),
-(0.44867, 0.06589, 0.77000),
-(0.48596, 0.07123, 0.79135),
-(0.52326, 0.07657, 0.81270),
-(0.56056, 0.08191, 0.83405),
-(0.59785, 0.08725, 0.85540),
-(0.63515, 0.09259, 0.87675),
-(0.67245, 0.09793, 0.89810),
-(0.70974, 0.10327, 0.91945),
-(0.74704, 0.10861, 0.94080),
-(0.74944, 0.11354, 0.95532),
-(0.75185, 0.11847, 0.96983),
-(0.75426, 0.12341, 0.98435),
-(0.75667, 0.12834, 0.99886),
-(0.75907, 0.13327, 1.01337),
-(0.76148, 0.13821, 1.02789),
-(0.76389, 0.14314, 1.04241),
-(0.76629, 0.14807, 1.05692),
-(0.76870, 0.15301, 1.07144),
-(0.77111, 0.15794, 1.08595),
-(0.77351, 0.16287, 1.10047),
-(0.77592, 0.16781, 1.11498),
-(0.77833, 0.17274, 1.12949),
-(0.78073, 0.17767, 1.14401),
-(0.78314, 0.18261, 1.15853),
-(0.78555, 0.18754, 1.17304),
-(0.78795, 0.19247, 1.18756),
-(0.79036, 0.19741, 1.20207),
-(0.79277, 0.20234, 1.21659),
-(0.79517, 0.20727, 1.23110),
-(0.78725, 0.21247, 1.24585),
-(0.77933, 0.21767, 1.26060),
-(0.77142, 0.22287, 1.27535),
-(0.76350, 0.22807, 1.29010),
-(0.75558, 0.23326, 1.30485),
-(0.74766, 0.23846, 1.31960),
-(0.73974, 0.24366, 1.33435),
-(0.73182, 0.24886, 1.34910),
-(0.72390, 0.25406, 1.36385),
-(0.71598, 0.25925, 1.37860),
-(0.68904, 0.26360, 1.38317),
-(0.66210, 0.26795, 1.38774),
-(0.63516, 0.27229, 1.39231),
-(0.60822, 0.27664, 1.39688),
-(0.58128, 0.28098, 1.40145),
-(0.55434, 0.28533, 1.40602),
-(0.52741, 0.28967, 1.41059),
-(0.50047, 0.29402, 1.41516),
-(0.47353, 0.29836, 1.41973),
-(0.44659, 0.30271, 1.42430),
-(0.42089, 0.30644, 1.42802),
-(0.39519, 0.31016, 1.43174),
-(0.36948, 0.31389, 1.43546),
-(0.34378, 0.31762, 1.43918),
-(0.31808, 0.32135, 1.44290),
-(0.29238, 0.32508, 1.44662),
-(0.26668, 0.32881, 1.45034),
-(0.24098, 0.33254, 1.45406),
-(0.21528, 0.33627, 1.45778),
-(0.18957, 0.34000, 1.46150),
-(0.15932, 0.34158, 1.46178),
-(0.12906, 0.34316, 1.46206),
-(0.09881, 0.34474, 1.46234),
-(0.06855, 0.34631, 1.46262),
-(0.03830, 0.34789, 1.46290),
-(0.00804, 0.34947, 1.46318),
-(-0.02221, 0.35105, 1.46346),
-(-0.05247, 0.35263, 1.46374),
-(-0.08272, 0.35421, 1.46402),
-(-0.11298, 0.35578, 1.46430),
-(-0.15051, 0.35624, 1.46136),
-(-0.18804, 0.35669, 1.45842),
-(-0.22557, 0.35715, 1.45548),
-(-0.26310, 0.35760, 1.45254),
-(-0.30063, 0.35806, 1.44960),
-(-0.33817, 0.35851, 1.44666),
-(-0.37570, 0.35897, 1.44372),
-(-0.41323, 0.35942, 1.44078),
-(-0.45076, 0.35988, 1.43784),
-(-0.48829, 0.36033, 1.43490),
-(-0.52183, 0.35823, 1.42518),
-(-0.55536, 0.35613, 1.41546),
-(-0.58889, 0.35402, 1.40574),
-(-0.62243, 0.35192, 1.39602),
-(-0.65596, 0.34981, 1.38630),
-(-0.68950, 0.34771, 1.37658),
-(-0.72303, 0.34561, 1.36686),
-(-0.75657, 0.34350, 1.35714),
-(-0.79010, 0.34140, 1.34742),
-(-0.82363, 0.33929, 1.33770),
-(-0.85262, 0.33596, 1.30827),
-(-0.88160, 0.33263, 1.27884),
-(-0.91058, 0.32930, 1.24941),
-(-0.93956, 0.32597, 1.21998),
-(-0.96854, 0.32264, 1.19055),
-(-0.99752, 0.31931, 1.16112),
-(-1.02650, 0.31597, 1.13169),
-(-1.05548, 0.31264, 1.10226),
-(-1.08446, 0.30931, 1.07283),
-(-1.11344, 0.30598, 1.04340),
-(-1.12372, 0.30003, 1.03271),
-(-1.13401, 0.29407, 1.02202),
-(-1.14429, 0.28812, 1.01133),
-(-1.15457, 0.28216, 1.00064),
-(-1.16486, 0.27621, 0.98995),
-(-1.17514, 0.27025, 0.97926),
-(-1.18542, 0.26430, 0.96857),
-(-1.19571, 0.25834, 0.95788),
-(-1.20599, 0.25239, 0.94719),
-(-1.21627, 0.24643, 0.93650),
-(-1.22019, 0.24079, 0.91577),
-(-1.22412, 0.23515, 0.89504),
-(-1.22804, 0.22951, 0.87431),
-(-1.23196, 0.22387, 0.85358),
-(-1.23589, 0.21824, 0.83285),
-(-1.23981, 0.21260, 0.81212),
-(-1.24373, 0.20696, 0.79139),
-(-1.24765, 0.20132, 0.77066),
-(-1.25158, 0.19568, 0.74993),
-(-1.25550, 0.19004, 0.72920),
-(-1.24666, 0.18422, 0.71484),
-(-1.23783, 0.17839, 0.70048),
-(-1.22899, 0.17257, 0.68612),
-(-1.22016, 0.16675, 0.67176),
-(-1.21132, 0.16092, 0.65740),
-(-1.20249, 0.15510, 0.64304),
-(-1.19365, 0.14927, 0.62868),
-(-1.18482, 0.14345, 0.61432),
-(-1.17598, 0.13763, 0.59996),
-(-1.16715, 0.13180, 0.58560),
-(-1.14086, 0.12560, 0.56630),
-(-1.11458, 0.11940, 0.54700),
-(-1.08830, 0.11319, 0.52770),
-(-1.06201, 0.10699, 0.50840),
-(-1.03573, 0.10078, 0.48910),
-(-1.01492, 0.09482, 0.46058),
-(-0.99410, 0.08885, 0.43206),
-(-0.97329, 0.08288, 0.40354),
-(-0.95248, 0.07691, 0.37502),
-(-0.93166, 0.07094, 0.34650),
-(-0.93410, 0.06721, 0.40303),
-(-0.93653, 0.06348, 0.45957),
-(-0.93896, 0.05975, 0.51610),
-(-0.93137, 0.05384, 0.48160),
-(-0.92378, 0.04794, 0.44710),
-(-0.91619, 0.04204, 0.41260),
-(-0.98735, 0.03790, 0.34050),
-(-1.05850, 0.03376, 0.26840),
-(-0.99335, 0.02702, 0.21830),
-(-0.92820, 0.02027, 0.16820),
-(-0.84665, 0.01776, 0.15710),
-(-0.75174, 0.01535, 0.14210),
-(-0.65844, 0.01276, 0.13470),
-(-0.54744, 0.01114, 0.11990),
-(-0.44015, 0.00959, 0.10900),
-(-0.33151, 0.00820, 0.09920),
-(-0.22138, 0.00729, 0.08300),
-(-0.11001, 0.00659, 0.06910),
-(0.00606, 0.00616, 0.05130),
-(0.12350, 0.00600, 0.03150),
-(0.24056, 0.00610, 0.01260),
-(0.35861, 0.00645, -0.00260),
-(0.48025, 0.00684, -0.02820),
-(0.59879, 0.00780, -0.05510),
-(0.71759, 0.00880, -0.07410),
-(0.82648, 0.01022, -0.09820),
-(0.93203, 0.01190, -0.11740),
-(1.05021, 0.01361, -0.15090),
-(1.15787, 0.01582, -0.17730),
-(1.25612, 0.01814, -0.20640),
-(1.34818, 0.02084, -0.23900),
-(1.43629, 0.02365, -0.26390),
-(1.51462, 0.02684, -0.29710),
-(1.55397, 0.02990, -0.32540),
-(1.60000, 0.03384, -0.36310),
-(1.50602, 0.03819, -0.43365),
-(1.41203, 0.04253, -0.50420),
-(1.40861, 0.04916, -0.52057),
-(1.40519, 0.05580, -0.53693),
-(1.40176, 0.06243, -0.55330),
-(1.37654, 0.06886, -0.57916),
-(1.35133, 0.07529, -0.60502),
-(1.32611, 0.08173, -0.63088),
-(1.30089, 0.08816, -0.65674),
-(1.27567, 0.09459, -0.68260),
-(1.27363, 0.10038, -0.68427),
-(1.27159, 0.10617, -0.68593),
-(1.26956, 0.11196, -0.68760),
-(1.26752, 0.11775, -0.68927),
-(1.26548, 0.12354, -0.69093),
-(1.26344, 0.12933, -0.69260),
-(1.26141, 0.13512, -0.69427),
-(1.25937, 0.14092, -0.69593),
-(1.25733, 0.14671, -0.69760),
-(1.25529, 0.15250, -0.69927),
-(1.25325, 0.15829, -0.70093),
-(1.25122, 0.16408, -0.70260),
-(1.24918, 0.16987, -0.70427),
-(1.24714, 0.17566, -0.70593),
-(1.24510, 0.18145, -0.70760),
-(1.24786, 0.18787, -0.73668),
-(1.25062, 0.19429, -0.76576),
-(1.25338, 0.20070, -0.79484),
-(1.25614, 0.20712, -0.82392),
-(1.25890, 0.21354, -0.85300),
-(1.26166, 0.21996, -0.88208),
-(1.26442, 0.22637, -0.91116),
-(1.26718, 0.23279, -0.94024),
-(1.26994, 0.23921, -0.96932),
-(1.27270, 0.24563, -0.99840),
-(1.25557, 0.24958, -0.99997),
-(1.23845, 0.25354, -1.00154),
-(1.22132, 0.25749, -1.00311),
-(1.20419, 0.26145, -1.00468),
-(1.18707, 0.26540, -1.00625),
-(1.16994, 0.26936, -1.00782),
-(1.15282, 0.27331, -1.00939),
-(1.13569, 0.27727, -1.01096),
-(1.11856, 0.28122, -1.01253),
-(1.10144, 0.28518, -1.01410),
-(1.08444, 0.29309, -1.04639),
-(1.06743, 0.30100, -1.07868),
-(1.05043, 0.30891, -1.11097),
-(1.03343, 0.31682, -1.14326),
-(1.01643, 0.32474, -1.17555),
-(0.99942, 0.33265, -1.20784),
-(0.98242, 0.34056, -1.24013),
-(0.96542, 0.34847, -1.27242),
-(0.94842, 0.35638, -1.30471),
-(0.93142, 0.36429, -1.33700),
-(0.90156, 0.36619, -1.34623),
-(0.87170, 0.36809, -1.35546),
-(0.84184, 0.36999, -1.36469),
-(0.81198, 0.37189, -1.37392),
-(0.78212, 0.37378, -1.38315),
-(0.75226, 0.37568, -1.39238),
-(0.72240, 0.37758, -1.40161),
-(0.69254, 0.37948, -1.41084),
-(0.66268, 0.38138, -1.42007),
-(0.63282, 0.38327, -1.42930),
-(0.58712, 0.38231, -1.43767),
-(0.54143, 0.38135, -1.44604),
-(0.49573, 0.38038, -1.45441),
-(0.45003, 0.37942, -1.46278),
-(0.40433, 0.37845, -1.47115),
-(0.35863, 0.37749, -1.47952),
-(0.31293, 0.37652, -1.48789),
-(0.26724, 0.37556, -1.49626),
-(0.22154, 0.37459, -1.50463),
-(0.17584, 0.37363, -1.51300),
-(0.13707, 0.37244, -1.51840),
-(0.09830, 0.37125, -1.52380),
-(0.05953, 0.37006, -1.52920),
-(0.02076, 0.36887, -1.53460),
-(-0.01800, 0.36769, -1.54000),
-(-0.05677, 0.36650, -1.54540),
-(-0.09554, 0.36531, -1.55080),
-(-0.13431, 0.36412, -1.55620),
-(-0.17308, 0.36293, -1.56160),
-(-0.21185, 0.36175, -1.56700),
-(-0.24208, 0.35848, -1.56916),
-(-0.27231, 0.35522, -1.57132),
-(-0.30254, 0.35196, -1.57348),
-(-0.33277, 0.34869, -1.57564),
-(-0.36300, 0.34543, -1.57780),
-(-0.39323, 0.34217, -1.57996),
-(-0.42346, 0.33891, -1.58212),
-(-0.45369, 0.33564, -1.58428),
-(-0.48392, 0.33238, -1.58644),
-(-0.51415, 0.32912, -1.58860),
-(-0.53477, 0.32529, -1.58059),
-(-0.55538, 0.32145, -1.57258),
-(-0.57600, 0.31762, -1.56457),
-(-0.59662, 0.31379, -1.55656),
-(-0.61723, 0.30996, -1.54855),
-(-0.63785, 0.30613, -1.54054),
-(-0.65846, 0.30230, -1.53253),
-(-0.67908, 0.29847, -1.52452),
-(-0.69969, 0.29464, -1.51651),
-(-0.72031, 0.29080, -1.50850),
-(-0.73398, 0.28563, -1.49742),
-(-0.74766, 0.28045, -1.48634),
-(-0.76133, 0.27527, -1.47526),
-(-0.77500, 0.27010, -1.46418),
-(-0.78868, 0.26492, -1.45310),
-(-0.80235, 0.25975, -1.44202),
-(-0.81602, 0.25457, -1.43094),
-(-0.82970, 0.24939, -1.41986),
-(-0.84337, 0.24422, -1.40878),
-(-0.85705, 0.23904, -1.39770),
-(-0.86290, 0.23253, -1.38262),
-(-0.86875, 0.22602, -1.36754),
-(-0.87460, 0.21952, -1.35246),
-(-0.88046, 0.21301, -1.33738),
-(-0.88631, 0.20650, -1.32230),
-(-0.89216, 0.19999, -1.30722),
-(-0.89802, 0.19348, -1.29214),
-(-0.90387, 0.18698, -1.27706),
-(-0.90972, 0.18047, -1.26198),
-(-0.91558, 0.17396, -1.24690),
-(-0.93771, 0.17039, -1.23729),
-(-0.95985, 0.16682, -1.22768),
-(-0.98199, 0.16325, -1.21807),
-(-1.00413, 0.15969, -1.20846),
-(-1.02626, 0.15612, -1.19885),
-(-1.04840, 0.15255, -1.18924),
-(-1.07054, 0.14898, -1.17963),
-(-1.09268, 0.14541, -1.17002),
-(-1.11482, 0.14184, -1.16041),
-(-1.13695, 0.13827, -1.15080),
-(-1.09597, 0.13121, -1.12514),
-(-1.05499, 0.12414, -1.09948),
-(-1.01400, 0.11707, -1.07382),
-(-0.97302, 0.11000, -1.04816),
-(-0.93203, 0.10293, -1.02250),
-(-0.89105, 0.09586, -0.99684),
-(-0.85007, 0.08879, -0.97118),
-(-0.80908, 0.08173, -0.94552),
-(-0.76810, 0.07466, -0.91986),
-(-0.72712, 0.06759, -0.89420),
-(-0.74363, 0.06351, -0.88903),
-(-0.76015, 0.05942, -0.88386),
-(-0.77667, 0.05534, -0.87869),
-(-0.79319, 0.05126, -0.87352),
-(-0.80971, 0.04718, -0.86835),
-(-0.82623, 0.04309, -0.86318),
-(-0.84275, 0.03901, -0.85801),
-(-0.85927, 0.03493, -0.85284),
-(-0.87579, 0.03085, -0.84767),
-(-0.89231, 0.02676, -0.84250),
-(-0.82721, 0.02475, -0.77581),
-(-0.76211, 0.02274, -0.70912),
-(-0.69701, 0.02073, -0.64243),
-(-0.63191, 0.01872, -0.57574),
-(-0.56681, 0.01671, -0.50905),
-(-0.50170, 0.01469, -0.44236),
-(-0.43660, 0.01268, -0.37567),
-(-0.37150, 0.01067, -0.30898),
-(-0.30640, 0.00866, -0.24229),
-(-0.24130, 0.00665, -0.17560)
-]
-
-flap30_delta_tab = [
-(-0.15150, 0.02310, 0.00330),
-(-0.14343, 0.02397, -0.00186),
-(-0.13536, 0.02484, -0.00702),
-(-0.12729, 0.02571, -0.01218),
-(-0.11922, 0.02658, -0.01734),
-(-0.11115, 0.02745, -0.02250),
-(-0.10308, 0.02832, -0.02766),
-(-0.09501, 0.02919, -0.03282),
-(-0.08694, 0.03006, -0.03798),
-(-0.07887, 0.03093, -0.04314),
-(-0.07080, 0.03180, -0.04830),
-(-0.08875, 0.02624, -0.05038),
-(-0.10670, 0.02068, -0.05246),
-(-0.12465, 0.01512, -0.05454),
-(-0.14260, 0.00956, -0.05662),
-(-0.16055, 0.00400, -0.05870),
-(-0.17850, -0.00156, -0.06078),
-(-0.19645, -0.00712, -0.06286),
-(-0.21440, -0.01268, -0.06494),
-(-0.23235, -0.01824, -0.06702),
-(-0.25030, -0.02380, -0.06910),
-(-0.23265, -0.02287, -0.06502),
-(-0.21500, -0.02194, -0.06094),
-(-0.19735, -0.02101, -0.05686),
-(-0.17970, -0.02008, -0.05278),
-(-0.16205, -0.01915, -0.04870),
-(-0.14440, -0.01822, -0.04462),
-(-0.12675, -0.01729, -0.04054),
-(-0.10910, -0.01636, -0.03646),
-(-0.09145, -0.01543, -0.03238),
-(-0.07380, -0.01450, -0.02830),
-(-0.07512, -0.01376, -0.02876),
-(-0.07644, -0.01302, -0.02922),
-(-0.07776, -0.01228, -0.02968),
-(-0.07908, -0.01154, -0.03014),
-(-0.08040, -0.01080, -0.03060),
-(-0.08172, -0.01006, -0.03106),
-(-0.08304, -0.00932, -0.03152),
-(-0.08436, -0.00858, -0.03198),
-(-0.08568, -0.00784, -0.03244),
-(-0.08700, -0.00710, -0.03290),
-(-0.08402, -0.00428, -0.03277),
-(-0.08104, -0.00146, -0.03264),
-(-0.07806, 0.00136, -0.03251),
-(-0.07508, 0.00418, -0.03238),
-(-0.07210, 0.00700, -0.03225),
-(-0.06912, 0.00982, -0.03212),
-(-0.06614, 0.01264, -0.03199),
-(-0.06316, 0.01546, -0.03186),
-(-0.06018, 0.01828, -0.03173),
-(-0.05720, 0.02110, -0.03160),
-(-0.05562, 0.02130, -0.03187),
-(-0.05404, 0.02150, -0.03214),
-(-0.05246, 0.02170, -0.03241),
-(-0.05088, 0.02190, -0.03268),
-(-0.04930, 0.02210, -0.03295),
-(-0.04772, 0.02230, -0.03322),
-(-0.04614, 0.02250, -0.03349),
-(-0.04456, 0.02270, -0.03376),
-(-0.04298, 0.02290, -0.03403),
-(-0.04140, 0.02310, -0.03430),
-(-0.03824, 0.02107, -0.03400),
-(-0.03508, 0.01904, -0.03370),
-(-0.03192, 0.01701, -0.03340),
-(-0.02876, 0.01498, -0.03310),
-(-0.02560, 0.01295, -0.03280),
-(-0.02244, 0.01092, -0.03250),
-(-0.01928, 0.00889, -0.03220),
-(-0.01612, 0.00686, -0.03190),
-(-0.01296, 0.00483, -0.03160),
-(-0.00980, 0.00280, -0.03130),
-(-0.01135, -0.00845, -0.03251),
-(-0.01290, -0.01970, -0.03372),
-(-0.01445, -0.03095, -0.03493),
-(-0.01600, -0.04220, -0.03614),
-(-0.01755, -0.05345, -0.03735),
-(-0.01910, -0.06470, -0.03856),
-(-0.02065, -0.07595, -0.03977),
-(-0.02220, -0.08720, -0.04098),
-(-0.02375, -0.09845, -0.04219),
-(-0.02530, -0.10970, -0.04340),
-(-0.02412, -0.10386, -0.04546),
-(-0.02294, -0.09802, -0.04752),
-(-0.02176, -0.09218, -0.04958),
-(-0.02058, -0.08634, -0.05164),
-(-0.01940, -0.08050, -0.05370),
-(-0.01822, -0.07466, -0.05576),
-(-0.01704, -0.06882, -0.05782),
-(-0.01586, -0.06298, -0.05988),
-(-0.01468, -0.05714, -0.06194),
-(-0.01350, -0.05130, -0.06400),
-(-0.01047, -0.05523, -0.06506),
-(-0.00744, -0.05916, -0.06612),
-(-0.00441, -0.06309, -0.06718),
-(-0.00138, -0.06702, -0.06824),
-(0.00165, -0.07095, -0.06930),
-(0.00468, -0.07488, -0.07036),
-(0.00771, -0.07881, -0.07142),
-(0.01074, -0.08274, -0.07248),
-(0.01377, -0.08667, -0.07354),
-(0.01680, -0.09060, -0.07460),
-(0.02331, -0.09167, -0.07078),
-(0.02982, -0.09274, -0.06696),
-(0.03633, -0.09381, -0.06314),
-(0.04284, -0.09488, -0.05932),
-(0.04935, -0.09595, -0.05550),
-(0.05586, -0.09702, -0.05168),
-(0.06237, -0.09809, -0.04786),
-(0.06888, -0.09916, -0.04404),
-(0.07539, -0.10023, -0.04022),
-(0.08190, -0.10130, -0.03640),
-(0.08652, -0.10502, -0.03784),
-(0.09114, -0.10874, -0.03928),
-(0.09576, -0.11246, -0.04072),
-(0.10038, -0.11618, -0.04216),
-(0.10500, -0.11990, -0.04360),
-(0.10962, -0.12362, -0.04504),
-(0.11424, -0.12734, -0.04648),
-(0.11886, -0.13106, -0.04792),
-(0.12348, -0.13478, -0.04936),
-(0.12810, -0.13850, -0.05080),
-(0.13183, -0.13802, -0.05621),
-(0.13556, -0.13754, -0.06162),
-(0.13929, -0.13706, -0.06703),
-(0.14302, -0.13658, -0.07244),
-(0.14675, -0.13610, -0.07785),
-(0.15048, -0.13562, -0.08326),
-(0.15421, -0.13514, -0.08867),
-(0.15794, -0.13466, -0.09408),
-(0.16167, -0.13418, -0.09949),
-(0.16540, -0.13370, -0.10490),
-(0.16685, -0.12981, -0.10172),
-(0.16830, -0.12592, -0.09854),
-(0.16975, -0.12203, -0.09536),
-(0.17120, -0.11814, -0.09218),
-(0.17265, -0.11425, -0.08900),
-(0.17410, -0.11036, -0.08582),
-(0.17555, -0.10647, -0.08264),
-(0.17700, -0.10258, -0.07946),
-(0.17845, -0.09869, -0.07628),
-(0.17990, -0.09480, -0.07310),
-(0.18647, -0.09417, -0.07533),
-(0.19304, -0.09354, -0.07756),
-(0.19961, -0.09291, -0.07979),
-(0.20618, -0.09228, -0.08202),
-(0.21275, -0.09165, -0.08425),
-(0.21932, -0.09102, -0.08648),
-(0.22589, -0.09039, -0.08871),
-(0.23246, -0.08976, -0.09094),
-(0.23903, -0.08913, -0.09317),
-(0.24560, -0.08850, -0.09540),
-(0.25046, -0.08770, -0.09406),
-(0.25532, -0.08690, -0.09272),
-(0.26018, -0.08610, -0.09138),
-(0.26504, -0.08530, -0.09004),
-(0.26990, -0.08450, -0.08870),
-(0.26832, -0.07996, -0.08800),
-(0.26674, -0.07542, -0.08730),
-(0.26516, -0.07088, -0.08660),
-(0.26358, -0.06634, -0.08590),
-(0.26200, -0.06180, -0.08520),
-(0.26357, -0.05603, -0.08247),
-(0.26513, -0.05027, -0.07973),
-(0.26670, -0.04450, -0.07700),
-(0.25123, -0.03843, -0.07447),
-(0.23577, -0.03237, -0.07193),
-(0.22030, -0.02630, -0.06940),
-(0.33715, -0.03890, -0.10320),
-(0.45400, -0.05150, -0.13700),
-(0.48110, -0.03195, -0.11815),
-(0.50820, -0.01240, -0.09930),
-(0.53710, -0.00700, -0.10590),
-(0.54630, -0.00150, -0.10850),
-(0.56520, 0.00540, -0.11480),
-(0.57600, 0.01080, -0.11870),
-(0.57750, 0.01690, -0.12110),
-(0.57900, 0.02150, -0.12210),
-(0.58630, 0.02790, -0.12850),
-(0.58380, 0.03300, -0.13150),
-(0.58600, 0.03830, -0.13560),
-(0.58120, 0.04240, -0.13570),
-(0.57850, 0.04830, -0.13910),
-(0.57490, 0.05260, -0.14070),
-(0.56560, 0.05690, -0.14240),
-(0.55980, 0.06080, -0.14200),
-(0.55500, 0.06470, -0.14400),
-(0.53950, 0.06750, -0.14210),
-(0.52480, 0.07080, -0.14090),
-(0.51190, 0.07380, -0.13920),
-(0.48780, 0.07550, -0.13390),
-(0.46410, 0.07610, -0.12800),
-(0.44370, 0.07620, -0.12540),
-(0.39800, 0.07400, -0.11250),
-(0.32950, 0.06910, -0.09850),
-(0.06930, 0.11220, -0.08820),
-(0.00930, 0.09370, -0.06600),
-(0.05120, 0.09540, -0.07520),
-(0.09310, 0.09710, -0.08440),
-(0.11417, 0.10197, -0.08803),
-(0.13523, 0.10683, -0.09167),
-(0.15630, 0.11170, -0.09530),
-(0.16722, 0.11674, -0.09784),
-(0.17814, 0.12178, -0.10038),
-(0.18906, 0.12682, -0.10292),
-(0.19998, 0.13186, -0.10546),
-(0.21090, 0.13690, -0.10800),
-(0.21413, 0.14299, -0.10633),
-(0.21737, 0.14909, -0.10467),
-(0.22060, 0.15518, -0.10300),
-(0.22383, 0.16127, -0.10133),
-(0.22707, 0.16737, -0.09967),
-(0.23030, 0.17346, -0.09800),
-(0.23353, 0.17955, -0.09633),
-(0.23677, 0.18565, -0.09467),
-(0.24000, 0.19174, -0.09300),
-(0.24323, 0.19783, -0.09133),
-(0.24647, 0.20393, -0.08967),
-(0.24970, 0.21002, -0.08800),
-(0.25293, 0.21611, -0.08633),
-(0.25617, 0.22221, -0.08467),
-(0.25940, 0.22830, -0.08300),
-(0.25098, 0.22423, -0.07901),
-(0.24256, 0.22016, -0.07502),
-(0.23414, 0.21609, -0.07103),
-(0.22572, 0.21202, -0.06704),
-(0.21730, 0.20795, -0.06305),
-(0.20888, 0.20388, -0.05906),
-(0.20046, 0.19981, -0.05507),
-(0.19204, 0.19574, -0.05108),
-(0.18362, 0.19167, -0.04709),
-(0.17520, 0.18760, -0.04310),
-(0.16460, 0.18326, -0.04113),
-(0.15400, 0.17892, -0.03916),
-(0.14340, 0.17458, -0.03719),
-(0.13280, 0.17024, -0.03522),
-(0.12220, 0.16590, -0.03325),
-(0.11160, 0.16156, -0.03128),
-(0.10100, 0.15722, -0.02931),
-(0.09040, 0.15288, -0.02734),
-(0.07980, 0.14854, -0.02537),
-(0.06920, 0.14420, -0.02340),
-(0.06612, 0.13800, -0.01961),
-(0.06304, 0.13180, -0.01582),
-(0.05996, 0.12560, -0.01203),
-(0.05688, 0.11940, -0.00824),
-(0.05380, 0.11320, -0.00445),
-(0.05072, 0.10700, -0.00066),
-(0.04764, 0.10080, 0.00313),
-(0.04456, 0.09460, 0.00692),
-(0.04148, 0.08840, 0.01071),
-(0.03840, 0.08220, 0.01450),
-(0.02263, 0.06163, 0.01456),
-(0.00686, 0.04106, 0.01462),
-(-0.00891, 0.02049, 0.01468),
-(-0.02468, -0.00008, 0.01474),
-(-0.04045, -0.02065, 0.01480),
-(-0.05622, -0.04122, 0.01486),
-(-0.07199, -0.06179, 0.01492),
-(-0.08776, -0.08236, 0.01498),
-(-0.10353, -0.10293, 0.01504),
-(-0.11930, -0.12350, 0.01510),
-(-0.10628, -0.11013, 0.01808),
-(-0.09326, -0.09676, 0.02106),
-(-0.08024, -0.08339, 0.02404),
-(-0.06722, -0.07002, 0.02702),
-(-0.05420, -0.05665, 0.03000),
-(-0.04118, -0.04328, 0.03298),
-(-0.02816, -0.02991, 0.03596),
-(-0.01514, -0.01654, 0.03894),
-(-0.00212, -0.00317, 0.04192),
-(0.01090, 0.01020, 0.04490),
-(0.00511, 0.01657, 0.04203),
-(-0.00068, 0.02294, 0.03916),
-(-0.00647, 0.02931, 0.03629),
-(-0.01226, 0.03568, 0.03342),
-(-0.01805, 0.04205, 0.03055),
-(-0.02384, 0.04842, 0.02768),
-(-0.02963, 0.05479, 0.02481),
-(-0.03542, 0.06116, 0.02194),
-(-0.04121, 0.06753, 0.01907),
-(-0.04700, 0.07390, 0.01620),
-(-0.04880, 0.05779, 0.01828),
-(-0.05060, 0.04168, 0.02036),
-(-0.05240, 0.02557, 0.02244),
-(-0.05420, 0.00946, 0.02452),
-(-0.05600, -0.00665, 0.02660),
-(-0.05780, -0.02276, 0.02868),
-(-0.05960, -0.03887, 0.03076),
-(-0.06140, -0.05498, 0.03284),
-(-0.06320, -0.07109, 0.03492),
-(-0.06500, -0.08720, 0.03700),
-(-0.06409, -0.08212, 0.03656),
-(-0.06318, -0.07704, 0.03612),
-(-0.06227, -0.07196, 0.03568),
-(-0.06136, -0.06688, 0.03524),
-(-0.06045, -0.06180, 0.03480),
-(-0.05954, -0.05672, 0.03436),
-(-0.05863, -0.05164, 0.03392),
-(-0.05772, -0.04656, 0.03348),
-(-0.05681, -0.04148, 0.03304),
-(-0.05590, -0.03640, 0.03260),
-(-0.05349, -0.03779, 0.03361),
-(-0.05108, -0.03918, 0.03462),
-(-0.04867, -0.04057, 0.03563),
-(-0.04626, -0.04196, 0.03664),
-(-0.04385, -0.04335, 0.03765),
-(-0.04144, -0.04474, 0.03866),
-(-0.03903, -0.04613, 0.03967),
-(-0.03662, -0.04752, 0.04068),
-(-0.03421, -0.04891, 0.04169),
-(-0.03180, -0.05030, 0.04270),
-(-0.02633, -0.05661, 0.04456),
-(-0.02086, -0.06292, 0.04642),
-(-0.01539, -0.06923, 0.04828),
-(-0.00992, -0.07554, 0.05014),
-(-0.00445, -0.08185, 0.05200),
-(0.00102, -0.08816, 0.05386),
-(0.00649, -0.09447, 0.05572),
-(0.01196, -0.10078, 0.05758),
-(0.01743, -0.10709, 0.05944),
-(0.02290, -0.11340, 0.06130),
-(0.02210, -0.11166, 0.06010),
-(0.02130, -0.10992, 0.05890),
-(0.02050, -0.10818, 0.05770),
-(0.01970, -0.10644, 0.05650),
-(0.01890, -0.10470, 0.05530),
-(0.01810, -0.10296, 0.05410),
-(0.01730, -0.10122, 0.05290),
-(0.01650, -0.09948, 0.05170),
-(0.01570, -0.09774, 0.05050),
-(0.01490, -0.09600, 0.04930),
-(-0.00092, -0.08875, 0.04458),
-(-0.01674, -0.08150, 0.03986),
-(-0.03256, -0.07425, 0.03514),
-(-0.04838, -0.06700, 0.03042),
-(-0.06420, -0.05975, 0.02570),
-(-0.08002, -0.05250, 0.02098),
-(-0.09584, -0.04525, 0.01626),
-(-0.11166, -0.03800, 0.01154),
-(-0.12748, -0.03075, 0.00682),
-(-0.14330, -0.02350, 0.00210),
-(-0.15945, -0.02225, 0.00035),
-(-0.17560, -0.02100, -0.00140),
-(-0.19175, -0.01975, -0.00315),
-(-0.20790, -0.01850, -0.00490),
-(-0.22405, -0.01725, -0.00665),
-(-0.24020, -0.01600, -0.00840),
-(-0.25635, -0.01475, -0.01015),
-(-0.27250, -0.01350, -0.01190),
-(-0.28865, -0.01225, -0.01365),
-(-0.30480, -0.01100, -0.01540),
-(-0.28937, -0.00760, -0.01353),
-(-0.27394, -0.00420, -0.01166),
-(-0.25851, -0.00080, -0.00979),
-(-0.24308, 0.00260, -0.00792),
-(-0.22765, 0.00600, -0.00605),
-(-0.21222, 0.00940, -0.00418),
-(-0.19679, 0.01280, -0.00231),
-(-0.18136, 0.01620, -0.00044),
-(-0.16593, 0.01960, 0.00143),
-(-0.15050, 0.02300, 0.00330)
-]
@@ -4,6 +4,10 @@
 
 import pygame
 import math
+import time
+import numpy as np
+import clip
+import raster
 
 class World:
   # Coordinates are north, east, up (in metres)
@@ -11,26 +15,79 @@ class World:
   # followed by a list of points in (N, E, U) format
   # Each object is drawn with a vector connecting each pair of points in the object
   world = []
-  worlddots = []
-  polygons = []
 
-  sin_roll  = 0.0
-  cos_roll  = 1.0
-  sin_pitch = 0.0
-  cos_pitch = 1.0
-  sin_hdg   = 0.0
-  cos_hdg   = 1.0
-  zoom      = 1.0
+  # Polygons are in the same format, but are filled.  Each polygon also has a
+  # draw layer and an optional outline colour.
+  polygons = []
+  poly_layers = []
+  poly_outlines = []
+
+  # Draw layers.  Polygons on the ground can never hide anything standing
+  # above the ground, so they are all drawn first, lowest layer first.
+  # Polygons above the ground are then depth-sorted and drawn far to near.
+  layer_area    = 0 # Lakes and other coloured regions of the ground
+  layer_surface = 1 # Runway surfaces
+  layer_marking = 2 # Markings painted on the runway surface
+  layer_solid   = 3 # Faces of solid objects, depth-sorted
+
+  # Order polygons were drawn in last frame
+  draw_order = np.zeros(0, dtype=np.intp)
+
+  # Other aircraft are drawn as a wireframe, segments between pairs of
+  # points in (forward, right, up) metres from the aircraft's centre
+  traffic_colour = (255, 255, 0)
+  traffic_model  = np.array([
+    [(4.0, 0.0, 0.0),  (-4.0, 0.0, 0.0)],  # Fuselage
+    [(0.5, -5.5, 0.3), (0.5, 5.5, 0.3)],   # Wing leading edge
+    [(-0.8, -5.5, 0.3), (-0.8, 5.5, 0.3)], # Wing trailing edge
+    [(0.5, -5.5, 0.3), (-0.8, -5.5, 0.3)], # Wing tips
+    [(0.5, 5.5, 0.3), (-0.8, 5.5, 0.3)],
+    [(-3.5, -1.7, 0.0), (-3.5, 1.7, 0.0)], # Tailplane
+    [(-4.0, 0.0, 0.0), (-4.0, 0.0, 1.5)],  # Fin
+    [(-4.0, 0.0, 1.5), (-3.0, 0.0, 0.0)],
+    [(4.0, 0.0, 0.0), (3.5, 0.0, 0.6)],    # Windscreen
+    [(3.5, 0.0, 0.6), (0.5, 0.0, 0.6)]])
+
+  # Direction of the sun (N, E, U), for shading solid objects
+  sun = (-0.4, 0.5, 0.77)
+
+  # Ground grid dots are held as an (N, 3) array of (N, E, U) points, with a
+  # parallel array of thinning levels: 0 for dots on major grid crossings,
+  # 1 for dots every 1000m along a grid line, 2 for all the rest
+  worlddots  = np.zeros((0, 3))
+  dots_level = np.zeros(0, dtype=np.int8)
+
+  # Dot thinning - beyond dot_thin_dist metres only level 0 and 1 dots are
+  # drawn, beyond 4 * dot_thin_dist only level 0 dots.  dot_density scales
+  # these distances (smaller is sparser and cheaper.)
+  dot_thin_dist = 4000.0
+  dot_density   = 1.0
+
+  # Level of detail - runway markings are only drawn within detail_dist
+  # metres.  lod_bias scales this (smaller is less detail and cheaper.)
+  detail_dist = 2500.0
+  lod_bias    = 1.0
+
+  # Dynamic resolution - the view is drawn at resolution * res_bias of its
+  # size on the display, and scaled up when it is blitted.  Filling
+  # polygons costs in proportion to the pixels, so this is the biggest
+  # saving there is.  resolution is chosen by the user, res_bias by the
+  # quality governor.
+  resolution = 1.0
+  res_bias   = 1.0
+  smooth     = False # Scale up with smoothscale (filtered) rather than scale
+
+  # Sky, ground and ground polygons are filled either by pygame.draw or by
+  # the NumPy rasterizer, whichever is quicker here, and lines drawn either
+  # way too.  Every viewport uses the same way.  fill_method and
+  # line_method can be set to 'pygame' or 'numpy' to use one regardless.
+  fill_method = None
+  line_method = None
 
   focal_plane = 1.0
 
-  # 3D coordinates of last point successfully projected
-  last_x     = 0.0
-  last_y     = 0.0
-  last_z     = 0.0
-
-  # True if last point projected was inside frustrum, False otherwise
-  inside = True
+  # Distance to the horizon, where the ground stops
+  horizon_dist = 100000.0
 
   # Bunch of RGB colours
   sky_blue  = (135, 206, 235)
@@ -39,6 +96,10 @@ class World:
   wht_stripe= (200, 200, 200)
   dark_gray = (50, 50, 50)
   black     = (0, 0, 0)
+  white     = (255, 255, 255)
+  bldg_wall = (190, 180, 160)
+  bldg_roof = (150, 80, 70)
+  glass     = (110, 130, 160)
 
   # Rotate point x,y by hdg radians and translate to origin n,e
   def rotate_translate_pt(self, n, e, hdg, x, y):
@@ -57,6 +118,7 @@ class World:
     numstripes = int(round(length/sl)) # Number of stripes
     r = []  # Runway outline
     p = []  # Polygons
+    m = []  # Markings
 
     r.append(self.wht_stripe) # Colour is first element
     # Runway outline
@@ -88,306 +150,462 @@ class World:
       stripe.append(self.rotate_translate_pt(n, e, orient, i*sl+(sl*.25), +0.5))
       stripe.append(self.rotate_translate_pt(n, e, orient, i*sl+(sl*.25), -0.5))
       stripe.append(self.rotate_translate_pt(n, e, orient, i*sl+(sl*.25), -0.5))
-      p.append(stripe)
+      m.append(stripe)
 
-    return ([r], p)
+    return ([r], p, m)
 
   # Make a little house
-  def make_building(self,x,y,sz,h):
-    cube   = [self.black,
-              (x+0, y+0, 0), (x+sz, y+0, 0), (x+sz, y+sz, 0), (x+0, y+sz, 0), (x+0, y+0, 0),
-              (x+0, y+0, h), (x+sz, y+0, h), (x+sz, y+sz, h), (x+0, y+sz, h), (x+0, y+0, h)]
-    l1 = [self.black, (x+sz, y+0, 0), (x+sz, y+0, h)]
-    l2 = [self.black, (x+sz, y+sz, 0), (x+sz, y+sz, h)]
-    l3 = [self.black, (x+0, y+sz, 0), (x+0, y+sz, h)]
-    return [cube, l1, l2, l3]
-   
+  # Returns a list of polygons, one per face, shaded according to which way
+  # they face the sun
+  def make_building(self, x, y, sz, h, wall=bldg_wall, roof=bldg_roof):
+    base = [(x+0, y+0), (x+sz, y+0), (x+sz, y+sz), (x+0, y+sz)] # Anticlockwise
+    faces = [[self.shade(roof, (0, 0, 1))] + [(n, e, h) for (n, e) in base]]
+    for i in range(0, 4):
+      (n1, e1) = base[i]
+      (n2, e2) = base[(i + 1) % 4]
+      # Walls are wound the same way as the roof when seen from outside
+      normal = (e2 - e1, n1 - n2, 0)
+      faces.append([self.shade(wall, normal), (n1, e1, 0), (n2, e2, 0), (n2, e2, h), (n1, e1, h)])
+    return faces
+
+  # Shade colour for a face with the given (not necessarily unit) normal
+  def shade(self, colour, normal):
+    light = np.dot(normal, self.sun) / (np.linalg.norm(normal) * np.linalg.norm(self.sun))
+    light = 0.55 + 0.45 * max(light, 0.0)
+    return tuple(int(c * light) for c in colour)
+
+  # Add polygons to the world, in the given draw layer
+  def add_polygons(self, polys, layer, outline=None):
+    self.polygons += polys
+    self.poly_layers += [layer] * len(polys)
+    self.poly_outlines += [outline] * len(polys)
+
   # Make some area polygons
   def make_polygons(self):
     p1 = [self.lake_blue, (-1500, 0, 0), (-1500, 200, 0), (-1400, 300, 0), (-1300, 200, 0), (-1300, 0, 0), (-1400, -100, 0)] # Little lake
     p2 = [self.lake_blue, (-2500, -5000, 0), (+2500, -5000, 0), (+2500, -7500, 0), (-2500, -7500, 0)] # Big lake
     return [p1, p2]
 
-  # Update the camera angle
-  # roll,pitch,hdg is camera angle
-  # zoom is the distance to the projection plane
-  def update_view(self, roll, pitch, hdg, zoom):
-    self.sin_roll  = math.sin(-roll)
-    self.cos_roll  = math.cos(-roll)
-    self.sin_pitch = math.sin(-pitch)
-    self.cos_pitch = math.cos(-pitch)
-    self.sin_hdg   = math.sin(hdg)
-    self.cos_hdg   = math.cos(hdg)
-    self.zoom      = zoom
-
-  # x,y,z are 3D world coordinates of point to project
-  # north,east,alt is camera pos
-  def project_point(self, x, y, z, north, east, alt, horizon = False):
-
-    alt += 3 # Viewpoint above the ground
-
-    if horizon == False:
-
-      # Translate camera position
-      x -= north
-      y -= east
-      z -= alt
-
-      # Rotation around z-axis (heading)
-      x_z = x * self.cos_hdg - y * self.sin_hdg
-      y_z = x * self.sin_hdg + y * self.cos_hdg
-      z_z = z
-
-    else:
-      # If drawing horizon, no translation for position,
-      # or rotation for heading
-      z -= alt
-      x_z = x
-      y_z = y
-      z_z = z
-
-    # Rotation around y-axis (pitch)
-    x_zy = x_z * self.cos_pitch + z_z * self.sin_pitch
-    y_zy = y_z
-    z_zy = -x_z * self.sin_pitch + z_z * self.cos_pitch
-
-    # Rotation around x-axis (roll)
-    x_zyx = x_zy
-    y_zyx = y_zy * self.cos_roll - z_zy * self.sin_roll
-    z_zyx = y_zy * self.sin_roll + z_zy * self.cos_roll
-
-    if x_zyx > self.focal_plane:
-      # Point is within the frustrum
-      # Store the 3D coordinates of successfully-projected point
-      self.last_x = x_zyx
-      self.last_y = y_zyx
-      self.last_z = z_zyx
-      self.inside = True
-      return (self.zoom * y_zyx / x_zyx, self.zoom * z_zyx / x_zyx)
-    else:
-      # Point is closer to viewer than the focal plane
-      if self.inside == False:
-        # Previous point was also outside frustrum
-        self.last_x = x_zyx
-        self.last_y = y_zyx
-        self.last_z = z_zyx
-        return -1
+  # Normal of a polygon by Newell's method.  Points out of the side from
+  # which the vertices are seen to go anticlockwise.
+  def newell_normal(self, verts):
+    v = np.array(verts, dtype=float)
+    w = np.roll(v, -1, axis=0)
+    return (np.sum((v[:, 1] - w[:, 1]) * (v[:, 2] + w[:, 2])),
+            np.sum((v[:, 2] - w[:, 2]) * (v[:, 0] + w[:, 0])),
+            np.sum((v[:, 0] - w[:, 0]) * (v[:, 1] + w[:, 1])))
+
+  # Work out the order to draw polygons in this frame (painter's algorithm)
+  # Ground polygons go first, in layer order, then solid faces far to near.
+  # The camera moves very little between frames, so last frame's order is
+  # almost right.  Sorting in that order with a stable sort (timsort, which
+  # finds the existing runs) costs close to linear time.
+  # Params: d - (P, 3) array of polygon centres relative to the eye
+  # Returns array of polygon indices, in the order they should be drawn
+  def sort_polygons(self, d):
+    depth = np.sqrt(np.sum(d * d, axis=1))
+    key = self.poly_layer * 1e9 - np.where(self.poly_solid, depth, 0.0)
+    order = self.draw_order
+    self.draw_order = order[np.argsort(key[order], kind='stable')]
+    return self.draw_order
+
+  # Ground grid dots left after distance-based thinning, relative to the eye
+  # Params: eye - (north, east, alt) of the eye
+  def thin_dots(self, eye):
+    rel = self.worlddots - eye
+    d2 = rel[:, 0] * rel[:, 0] + rel[:, 1] * rel[:, 1]
+    t1 = self.dot_thin_dist * self.dot_density
+    t2 = t1 * 4
+    keep = (self.dots_level == 0) | ((self.dots_level == 1) & (d2 < t2 * t2)) | (d2 < t1 * t1)
+    return rel[keep]
+
+  # Segments of the other aircraft's wireframes, all at once
+  # Params: traffic - (n, e, z, roll, pitch, hdg) of each aircraft
+  # Returns (K, 2, 3) array of the ends of every segment, world coordinates
+  def traffic_segments(self, traffic):
+    a = np.asarray(traffic, dtype=float)
+    (sr, cr) = (np.sin(a[:, 3])[:, None], np.cos(a[:, 3])[:, None])
+    (sp, cp) = (np.sin(a[:, 4])[:, None], np.cos(a[:, 4])[:, None])
+    (sh, ch) = (np.sin(a[:, 5])[:, None], np.cos(a[:, 5])[:, None])
+    m = self.traffic_model.reshape(-1, 3)
+    (f, r, u) = (m[:, 0], m[:, 1], m[:, 2])
+
+    # Roll, pitch, then heading, into (N, E, U) for every aircraft
+    r1 = r * cr + u * sr
+    u1 = -r * sr + u * cr
+    f2 = f * cp - u1 * sp
+    u2 = f * sp + u1 * cp
+    return np.stack((a[:, 0:1] + f2 * ch - r1 * sh,
+                     a[:, 1:2] + f2 * sh + r1 * ch,
+                     a[:, 2:3] + u2), axis=-1).reshape(-1, 2, 3)
+
+  # Yaw of each viewport from the camera's direction
+  # The viewports' fields of view are laid side by side, so together they
+  # make one wide view with the middle straight ahead.
+  def viewport_yaws(self, cam):
+    fovs = [cam.fov(vp.size[0]) for vp in self.viewports]
+    left = -sum(fovs) / 2
+    yaws = []
+    for fov in fovs:
+      yaws.append(left + fov / 2)
+      left += fov
+    return yaws
+
+  # Draw the whole world, in every viewport
+  # Params: cam - camera.Camera to draw from.  Each viewport looks its own
+  #               way off to the side of it, see viewport_yaws().
+  #         traffic - (n, e, z, roll, pitch, hdg) of other aircraft
+  def show(self, cam, traffic=()):
+    # Everything that depends on where the eye is but not which way it
+    # looks is done once for all the viewports: back-face culling, leaving
+    # out detail that is too far away to matter, the draw order, and moving
+    # every point to be relative to the eye.  Then each viewport has only
+    # a rotation to do.
+    eye = cam.eye
+    d = self.poly_centre - eye
+    near = self.detail_dist * self.lod_bias
+    drawn = (~self.poly_solid | (np.sum(self.poly_normal * d, axis=1) < 0)) & \
+            (~self.poly_detail | (np.sum(d * d, axis=1) < near * near))
+    order = self.sort_polygons(d)
+    nground = np.count_nonzero(~self.poly_solid)
+    verts = self.poly_verts - eye
+    lines = self.line_verts - eye
+    dots = self.thin_dots(eye)
+    others = self.traffic_segments(traffic) - eye if len(traffic) > 0 else None
+
+    for (vp, yaw) in zip(self.viewports, self.viewport_yaws(cam)):
+      vp.look(cam.turned(yaw))
+      rotation = vp.rotation.T
+
+      # Horizon
+      fill = self.fill_method or self.fill_chooser.pick()
+      plane = vp.horizon_plane(eye[2])
+      start = time.perf_counter()
+      if fill == 'numpy':
+        (pts, counts) = vp.horizon_polygons(plane)
+        pixels = pygame.surfarray.pixels2d(vp.imgbuf)
+        vp.raster.fill_polygons(pixels, pts, counts, vp.horizon_mapped, [0, 1])
+        del pixels # Unlock imgbuf
       else:
-        # Previous point was inside frustrum
-        p = self.clip_to_focal_plane(x_zyx, y_zyx, z_zyx, leaving=True)
-        self.last_x = x_zyx
-        self.last_y = y_zyx
-        self.last_z = z_zyx
-        return p
-
-  # Compute the intersection of line from (self.last_x,self.last_y,self.last_z)
-  # to (x_zyx,y_zyx,z_zyx) with the focal plane.
-  def clip_to_focal_plane(self, x_zyx, y_zyx, z_zyx, leaving=True):
-    delta_x = x_zyx - self.last_x
-    delta_y = y_zyx - self.last_y
-    delta_z = z_zyx - self.last_z
-    ratio = (self.focal_plane - self.last_x) / delta_x
-    x_zyx = self.last_x + ratio * delta_x
-    y_zyx = self.last_y + ratio * delta_y
-    z_zyx = self.last_z + ratio * delta_z
-    self.inside = not leaving
-    return (self.zoom * y_zyx / x_zyx, self.zoom * z_zyx / x_zyx)
-
-  # Draw polygon where one side is from pt1->pt2 and other side is parallel
-  # at a distance of h pixels.  Used for filling ground and sky.
-  def sky_and_ground(self, pt1, pt2, sky, colour):
-    if sky == True:
-      h = 10000
-    else:
-      h = -10000
-    (x1, y1) = pt1
-    (x2, y2) = pt2
-    opp = y2 - y1
-    adj = x2 - x1
-    hyp = math.sqrt(opp * opp + adj * adj)
-    x1 += self.middle_x
-    x2 += self.middle_x
-    y1 = self.middle_y - y1
-    y2 = self.middle_y - y2
-    x3 = x1 - h * opp / hyp
-    x4 = x2 - h * opp / hyp
-    y3 = y1 - h * adj / hyp
-    y4 = y2 - h * adj / hyp
-    pygame.draw.polygon(self.imgbuf, colour, [(x1, y1), (x2, y2), (x4, y4), (x3, y3)])
-  
-  # Utility function used for drawing lines
-  # Params: colour is the RGB colour
-  #         pt1, pt2 are (x,y) coordinates for endpoints
-  def drawline(self, colour, pt1, pt2):
-    (x1, y1) = pt1
-    (x2, y2) = pt2
-    x1 += self.middle_x
-    x2 += self.middle_x
-    y1 = self.middle_y - y1
-    y2 = self.middle_y - y2
-    pygame.draw.line(self.imgbuf, colour, (x1, y1), (x2, y2))
-
-  # Draw the whole world
-  # north,east,alt is camera pos
-  # roll,pitch,hdg is camera angle
-  # zoom is the distance to the projection plane
-  # viewangle is direction of view in degrees
-  def show(self, north, east, alt, roll, pitch, hdg, zoom, viewangle):
-    if viewangle == 45:
-      self.update_view(roll, pitch, hdg-math.pi*0.25, zoom)
-    elif viewangle == 90:
-      self.update_view(pitch, -roll, hdg-math.pi*0.5, zoom)
-    elif viewangle == 135:
-      self.update_view(-roll, -pitch, hdg-math.pi*0.75, zoom)
-    elif viewangle == 180:
-      self.update_view(-roll, -pitch, hdg-math.pi, zoom)
-    elif viewangle == -135:
-      self.update_view(-roll, -pitch, hdg+math.pi*0.75, zoom)
-    elif viewangle == -90:
-      self.update_view(-pitch, roll, hdg+math.pi/2, zoom)
-    elif viewangle == -45:
-      self.update_view(roll, pitch, hdg+math.pi*0.25, zoom)
-    else:
-      self.update_view(roll, pitch, hdg, zoom)
-
-#   pygame.draw.rect(self.imgbuf, (0, 0, 0), self.rect) # Erase
-
-    # Horizon line
-    pt1 = self.project_point(100000, -100000, 0.0, north, east, alt, horizon = True)
-    pt2 = self.project_point(100000, +100000, 0.0, north, east, alt, horizon = True)
-    if pt1 != -1 and pt2 != -1:
-      self.sky_and_ground(pt1, pt2, sky=True,  colour=self.sky_blue)  # Sky
-      self.sky_and_ground(pt1, pt2, sky=False, colour=self.grass_grn) # Ground
-   
-    for poly in self.polygons:
-      ptlist = []
-      self.inside = False
-      counter = 0
-      first = True
-      for vertex in poly:
-        if counter == 0:
-          # First element of the list is the colour
-          colour = vertex
-        else:
-          (n, e, u) = vertex
-          prev_inside = self.inside
-          old_last_x = self.last_x
-          old_last_y = self.last_y
-          old_last_z = self.last_z
-          pt = self.project_point(n, e, u, north, east, alt)
-          if pt != -1:
-            (x, y) = pt
-            pt =  (x + self.middle_x, self.middle_y - y)
-          if counter == 1 and self.inside == True:
-            # First point of shape
-            if self.inside == True:
-              ptlist.append(pt)
-          elif self.inside == True and prev_inside == True:
-            # Line entirely within frustrum - normal draw
-            ptlist.append(pt)
-          elif self.inside == True and prev_inside == False:
-            # Line entering the frustrum - need to add extra point
-            (x, y) = self.clip_to_focal_plane(old_last_x, old_last_y, old_last_z, leaving=False)
-            ptlist.append((x + self.middle_x, self.middle_y - y))
-            ptlist.append(pt)
-          elif self.inside == False and prev_inside == True:
-            # Line leaving the frustrum - normal draw
-            ptlist.append(pt)
-          else:
-            # Line entirely outside of frustrum - don't draw
-            pass
-        counter += 1
-      if len(ptlist) > 2:
-        pygame.draw.polygon(self.imgbuf, colour, ptlist)
-
-    for obj in self.world:
-      prev_pt = -1
-      self.inside = False
-      counter = 0
-      first = True
-      for vertex in obj:
-        if counter == 0:
-          # First element of the list is the colour
-          colour = vertex
-        else:
-          (n, e, u) = vertex
-          prev_inside = self.inside
-          old_last_x = self.last_x
-          old_last_y = self.last_y
-          old_last_z = self.last_z
-          pt = self.project_point(n, e, u, north, east, alt)
-          if counter == 1:
-            # First point of shape (which can be -1 if it lies outside frustrum)
-            prev_pt = pt
-          elif self.inside == True and prev_inside == True:
-            # Line entirely within frustrum - normal draw
-            self.drawline(colour, prev_pt, pt)
-            prev_pt = pt
-          elif self.inside == True and prev_inside == False:
-            # Line entering the frustrum - need to clip to compute prev_pt
-            prev_pt = self.clip_to_focal_plane(old_last_x, old_last_y, old_last_z, leaving=False)
-            self.drawline(colour, prev_pt, pt)
-            prev_pt = pt
-          elif self.inside == False and prev_inside == True:
-            # Line leaving the frustrum - clipping is handled already in project_point()
-            self.drawline(colour, prev_pt, pt)
-            prev_pt = pt
-          else:
-            # Line entirely outside of frustrum - don't draw
-            pass
-        counter += 1
-
-    for dot in self.worlddots:
-      (n, e, u) = dot
-      pt = self.project_point(n, e, u, north, east, alt)
-      if pt != -1:
-        (x, y) = pt
-        x += self.middle_x
-        y = self.middle_y - y
-        self.imgbuf.set_at((int(x), int(y)), (255, 255, 255))
-    self.display.blit(self.imgbuf, (self.ox, self.oy), (0, 0, self.sx, self.sy))
-    pygame.display.update()
+        vp.sky_and_ground(plane,  self.sky_blue)  # Sky
+        vp.sky_and_ground(-plane, self.grass_grn) # Ground
+      elapsed = time.perf_counter() - start
+
+      # Culling for this viewport: polygons wholly outside one of the planes
+      # of its frustrum, going by their bounding spheres, are left out.  The
+      # rest are rotated all at once, clipped against every plane of the
+      # frustrum and then projected, so only the visible part of each
+      # polygon is handed to pygame.
+      planes = vp.frustum_planes()
+      unit = planes / np.linalg.norm(planes[:, 0:3], axis=1)[:, None]
+      dist = (d @ rotation) @ unit[:, 0:3].T + unit[:, 3]
+      inside = drawn & np.all(dist >= -self.poly_radius[:, None], axis=1)
+      counts = np.where(inside, self.poly_counts, 0)
+      pts = verts[np.repeat(inside, self.poly_counts)] @ rotation
+      (pts, counts) = clip.clip_polygons_to_planes(pts, counts, planes)
+      scr = vp.project(pts)
+      start = time.perf_counter()
+      if fill == 'numpy':
+        pixels = pygame.surfarray.pixels2d(vp.imgbuf)
+        vp.raster.fill_polygons(pixels, scr, counts, vp.poly_mapped, order[:nground])
+        del pixels
+      else:
+        vp.draw_polygons(order[:nground], scr, counts)
+      self.fill_chooser.record(fill, elapsed + time.perf_counter() - start)
+
+      # Wireframe objects.  The two ways of drawing lines differ by a pixel
+      # here and there, so while they are being timed the one not shown
+      # draws into scratch.
+      method = self.line_method or self.line_chooser.pick()
+      shown = self.line_method or self.line_chooser.shown()
+      target = vp.imgbuf if method == shown else vp.scratch
+      pts = lines @ rotation
+      elapsed = 0.0
+      for (colour, a, b, first) in self.line_sets:
+        elapsed += vp.draw_segments(colour, pts[a], pts[b], first, method, target)
+        if method != shown:
+          vp.draw_segments(colour, pts[a], pts[b], first, shown, vp.imgbuf)
+      self.line_chooser.record(method, elapsed)
+
+      vp.draw_points(dots @ rotation, self.white)
+
+      # Solid objects last, as nothing on the ground can hide them
+      vp.draw_polygons(order[nground:], scr, counts)
+
+      # Other aircraft
+      if others is not None:
+        pts = others @ rotation
+        first = np.ones(len(pts), dtype=bool)
+        vp.draw_segments(self.traffic_colour, pts[:, 0], pts[:, 1], first, shown, vp.imgbuf)
+
+      # Filtering costs more than drawing at full size, so not while the
+      # governor is cutting back
+      vp.blit(self.smooth and self.res_bias == 1.0)
+
+  # Set the fraction of the display size to draw at
+  def set_resolution(self, resolution):
+    self.resolution = resolution
+    for vp in self.viewports:
+      vp.resize_buffer()
+
+  # Set the quality governor's share of it
+  def set_res_bias(self, bias):
+    self.res_bias = bias
+    for vp in self.viewports:
+      vp.resize_buffer()
 
   # Build the world!
-  def __init__(self, display, offset, size):
-    (l, p) = self.make_runway(3000, 0, 0, orient=0.00)
-    self.world = l
-    self.polygons = self.make_polygons()
-    self.polygons += p
-    (l, p) = self.make_runway(3000, 0, -1500, orient=math.pi/4)
-    self.world += l
-    self.polygons += p
-    (l, p) = self.make_runway(2000, 5000, 7500, orient=math.pi)
-    self.world += l
-    self.polygons += p
-    (l, p) = self.make_runway(2000, -5000, 2500, orient=math.pi/8)
-    self.world += l
-    self.polygons += p
+  # Params: compositor - where to draw
+  #         offset, size - area of the display to draw in
+  #         views - number of viewports to split it into, side by side, eg:
+  #                 3 for left, front and right windows
+  def __init__(self, compositor, offset, size, views=1):
+    self.world = []
+    self.polygons = []
+    self.poly_layers = []
+    self.poly_outlines = []
+    self.add_polygons(self.make_polygons(), self.layer_area)
+    for (length, n, e, orient) in [(3000, 0, 0, 0.00), (3000, 0, -1500, math.pi/4),
+                                   (2000, 5000, 7500, math.pi), (2000, -5000, 2500, math.pi/8)]:
+      (l, p, m) = self.make_runway(length, n, e, orient)
+      self.world += l
+      self.add_polygons(p, self.layer_surface)
+      self.add_polygons(m, self.layer_marking)
     for i in range(1,6):
-      self.world += self.make_building(200+i*200,150,50,30)
-    self.world += self.make_building(-2000,-2000,100,750) # Skyscraper
-    self.display = display
+      self.add_polygons(self.make_building(200+i*200,150,50,30), self.layer_solid, self.black)
+    self.add_polygons(self.make_building(-2000,-2000,100,750,
+                                         wall=self.glass, roof=self.glass), self.layer_solid, self.black) # Skyscraper
+    self.compositor = compositor
+
+    # Polygons as ragged arrays (see clip.py), so they can be transformed
+    # and clipped in bulk
+    self.poly_colours = [poly[0] for poly in self.polygons]
+    self.poly_counts  = np.array([len(poly) - 1 for poly in self.polygons])
+    self.poly_verts   = np.array([v for poly in self.polygons for v in poly[1:]], dtype=float)
+    self.poly_layer   = np.array(self.poly_layers)
+    self.poly_solid   = self.poly_layer == self.layer_solid
+    self.poly_detail  = self.poly_layer == self.layer_marking
+    self.poly_centre  = np.array([np.mean(poly[1:], axis=0) for poly in self.polygons])
+    self.poly_radius  = np.array([np.max(np.linalg.norm(np.subtract(poly[1:], c), axis=1))
+                                  for (poly, c) in zip(self.polygons, self.poly_centre)])
+    self.poly_normal  = np.array([self.newell_normal(poly[1:]) for poly in self.polygons])
+    self.draw_order   = np.arange(len(self.polygons))
+
+    # Wireframe objects as one array of vertices, and for each colour the
+    # indices of both ends of every segment, and whether each segment starts
+    # a new object
+    self.line_verts = np.array([v for obj in self.world for v in obj[1:]], dtype=float)
+    ends = np.cumsum([len(obj) - 1 for obj in self.world])
+    self.line_sets = []
+    for colour in dict.fromkeys(obj[0] for obj in self.world):
+      a = np.concatenate([np.arange(end - len(obj) + 1, end - 1)
+                          for (obj, end) in zip(self.world, ends) if obj[0] == colour])
+      first = np.ones(a.size, dtype=bool)
+      first[1:] = a[1:] != a[:-1] + 1
+      self.line_sets.append((colour, a, a + 1, first))
+
+    # Which ways of filling and drawing lines are quicker, timed across all
+    # the viewports
+    self.fill_chooser = raster.Chooser(['pygame', 'numpy'])
+    self.line_chooser = raster.Chooser(['pygame', 'numpy'])
+
+    # Viewports, splitting the area into equal widths
+    (x, y) = offset
+    (w, h) = size
+    edges = [x + w * i // views for i in range(0, views + 1)]
+    self.viewports = [Viewport(self, (left, y), (right - left, h))
+                      for (left, right) in zip(edges, edges[1:])]
+
+    # Ground grid as dots
+    gridsize = 40000 # Total extent of grid is (gridsize*2)^2
+    gridint1 = 200   # Minor spacing
+    gridint2 = 2000  # Major spacing
+    major = np.arange(-gridsize, gridsize, gridint2)
+    minor = np.arange(-gridsize, gridsize, gridint1)
+    (maj, mnr) = np.meshgrid(major, minor, indexing='ij')
+    maj = maj.ravel()
+    mnr = mnr.ravel()
+    level = np.where(mnr % gridint2 == 0, 0, np.where(mnr % 1000 == 0, 1, 2))
+    zeros = np.zeros(maj.size)
+    self.worlddots = np.concatenate((np.column_stack((maj, mnr, zeros)),   # Lines of constant north
+                                     np.column_stack((mnr, maj, zeros))))  # Lines of constant east
+    self.dots_level = np.concatenate((level, level)).astype(np.int8)
+
+# One view of the world: an area of the display, and the buffer it is drawn
+# into first, at the world's resolution.  Each has its own camera rotation,
+# frustrum and rasterizer; the world does the work they can share.
+class Viewport:
+
+  rotation = np.identity(3) # World to camera, this frame
+  zoom     = 1.0            # Distance to the projection plane in imgbuf pixels
+  scale    = 1.0            # Fraction of the display size imgbuf is drawn at
+
+  # Params: world - the World it is a view of
+  #         offset, size - area of the display it fills
+  def __init__(self, world, offset, size):
+    self.world  = world
+    self.offset = offset
+    self.size   = size
+    self.imgbuf = pygame.Surface((0, 0))
+    self.resize_buffer()
+
+  # Make imgbuf the size to draw at now, if it isn't already.  Only the
+  # buffers change; the scenery is all in world coordinates.
+  def resize_buffer(self):
+    (w, h) = self.size
+    scale = max(0.1, min(self.world.resolution * self.world.res_bias, 1.0))
+    size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+    if size == self.imgbuf.get_size():
+      return
+    self.scale  = size[0] / w
     self.imgbuf = pygame.Surface(size)
-    (self.ox, self.oy) = offset
+    self.scratch = pygame.Surface(size) # For timing ways of drawing without showing them
     (self.sx, self.sy) = size
     self.middle_x = self.sx/2
     self.middle_y = self.sy/2
-    self.rect = pygame.Rect(0, 0, self.sx, self.sy)
-
-    return # BAIL EARLY
-    # Draw ground grid as dots
-    gridsize = 40000 # Total extent of grid is (gridsize*2)^2
-    gridint1 = 200   # Minor spacing
-    gridint2 = 2000  # Major spacing
-    north_min = -gridsize
-    north_max = +gridsize
-    east_min  = -gridsize
-    east_max  = +gridsize
-    for n in range(north_min, north_max, gridint2):
-      for e in range(east_min, east_max, gridint1):
-        self.worlddots.append((n, e, 0))
-    for e in range(east_min, east_max, gridint2):
-      for n in range(north_min, north_max, gridint1):
-        self.worlddots.append((n, e, 0))
-
-
+    self.screen_rect = np.array([(0, 0), (self.sx, 0), (self.sx, self.sy), (0, self.sy)], dtype=float)
+
+    # The rasterizer works in this size and pixel format, and which way of
+    # filling is quicker may have changed with the size
+    self.raster       = raster.Rasterizer(size)
+    self.poly_mapped  = np.array([self.imgbuf.map_rgb(c) for c in self.world.poly_colours], dtype=np.uint32)
+    self.horizon_mapped = np.array([self.imgbuf.map_rgb(self.world.sky_blue),
+                                    self.imgbuf.map_rgb(self.world.grass_grn)], dtype=np.uint32)
+    self.world.fill_chooser.reset()
+    self.world.line_chooser.reset()
+
+  # Point the viewport the way a camera looks, for this frame
+  def look(self, cam):
+    self.rotation = cam.rotation
+    self.zoom     = cam.zoom * self.scale
+
+  # Planes bounding the view frustrum in camera coordinates, as (a, b, c, d)
+  # where a*x + b*y + c*z + d >= 0 is inside.  These are the focal plane plus
+  # the four planes through the eye and the edges of the screen.
+  def frustum_planes(self):
+    return np.array([(1.0,           0.0,        0.0,        -self.world.focal_plane),
+                     (self.middle_x, +self.zoom, 0.0,        0.0),  # Left
+                     (self.middle_x, -self.zoom, 0.0,        0.0),  # Right
+                     (self.middle_y, 0.0,        +self.zoom, 0.0),  # Bottom
+                     (self.middle_y, 0.0,        -self.zoom, 0.0)]) # Top
+
+  # Project an (N, 3) array of camera coordinates, all in front of the
+  # focal plane, onto imgbuf
+  # Returns (N, 2) array of screen coordinates
+  def project(self, pts):
+    return np.column_stack((self.middle_x + self.zoom * pts[:, 1] / pts[:, 0],
+                            self.middle_y - self.zoom * pts[:, 2] / pts[:, 0]))
+
+  # The horizon as a plane (a, b, c) on screen, with the sky on the inside,
+  # where a*x + b*y + c >= 0
+  # The ground is taken to stop at horizon_dist all round, so the horizon
+  # dips below level the higher the eye is.  The two points on it either
+  # side of the way the camera faces, with the eye, make a plane; a pixel
+  # is sky if the ray through it goes above the plane.
+  # Params: alt - height of the eye
+  def horizon_plane(self, alt):
+    r = self.rotation
+    ahead = r[0] if abs(r[0, 2]) < 0.999 else r[2] # Straight up or down, go by the top of the screen
+    ahead = np.array((ahead[0], ahead[1], 0.0)) / math.hypot(ahead[0], ahead[1])
+    right = np.array((-ahead[1], ahead[0], 0.0))
+    dist = self.world.horizon_dist
+    normal = np.cross(dist * (ahead + right) - (0, 0, alt), dist * (ahead - right) - (0, 0, alt))
+    if normal[2] < 0:
+      normal = -normal
+    # The ray through pixel (x, y) is (zoom, x - middle_x, middle_y - y) in
+    # camera coordinates
+    m = r @ normal
+    return np.array([m[1], -m[2], m[0] * self.zoom - m[1] * self.middle_x + m[2] * self.middle_y])
+
+  # Fill the part of the screen inside a plane from horizon_plane().
+  # The screen rectangle is clipped against it so only the visible area is
+  # filled.  Used for filling ground and sky.
+  def sky_and_ground(self, plane, colour):
+    (pts, counts) = clip.clip_polygons(self.screen_rect, np.array([4]), plane)
+    if counts[0] > 2:
+      pygame.draw.polygon(self.imgbuf, colour, pts.tolist())
+
+  # The sky and the ground, as sky_and_ground() fills them, as ragged
+  # polygon arrays for Rasterizer.fill_polygons()
+  def horizon_polygons(self, plane):
+    (sky, nsky) = clip.clip_polygons(self.screen_rect, np.array([4]), plane)
+    (ground, nground) = clip.clip_polygons(self.screen_rect, np.array([4]), -plane)
+    return (np.concatenate((sky, ground)), np.concatenate((nsky, nground)))
+
+  # Draw projected polygons
+  # Params: order - indices of polygons to draw, in order
+  #         scr, counts - ragged arrays of screen coordinates of every
+  #                       polygon after clipping (see clip.py)
+  def draw_polygons(self, order, scr, counts):
+    starts = (np.cumsum(counts) - counts).tolist()
+    counts = counts.tolist()
+    (colours, outlines) = (self.world.poly_colours, self.world.poly_outlines)
+    for i in order.tolist():
+      if counts[i] > 2:
+        ptlist = scr[starts[i]:starts[i] + counts[i]].tolist()
+        pygame.draw.polygon(self.imgbuf, colours[i], ptlist)
+        if outlines[i] != None:
+          pygame.draw.polygon(self.imgbuf, outlines[i], ptlist, 1)
+
+  # Draw line segments, clipped against the focal plane
+  # Segments that carry on from the one before, unclipped, are joined into
+  # polylines, so pygame.draw.lines() draws each run in one call.  Or the
+  # rasterizer draws them all in one go.
+  # Params: colour - RGB colour
+  #         p, q - (K, 3) arrays of the segments' ends, camera coordinates
+  #         first - (K,) True where a segment doesn't follow on from the one
+  #                 before it
+  #         method - 'pygame' or 'numpy'
+  #         target - surface to draw on, imgbuf or scratch
+  # Returns time taken to draw, in seconds, not counting the clipping
+  def draw_segments(self, colour, p, q, first, method, target):
+    # Clip against the focal plane
+    focal_plane = self.world.focal_plane
+    p_out = p[:, 0] <= focal_plane
+    q_out = q[:, 0] <= focal_plane
+    with np.errstate(divide='ignore', invalid='ignore'):
+      t = np.clip((focal_plane - p[:, 0:1]) / (q[:, 0:1] - p[:, 0:1]), 0.0, 1.0)
+    (p, q) = (np.where(p_out[:, None], p + (q - p) * t, p),
+              np.where(q_out[:, None], p + (q - p) * t, q))
+    visible = ~(p_out & q_out)
+    joined = ~first & np.roll(visible & ~q_out, 1) & ~p_out
+    (p, q, joined) = (p[visible], q[visible], joined[visible])
+    if len(p) == 0:
+      return 0.0
+    ends = np.hstack((self.project(p), self.project(q)))
+
+    start = time.perf_counter()
+    if method == 'numpy':
+      pixels = pygame.surfarray.pixels2d(target)
+      self.raster.draw_lines(pixels, ends, target.map_rgb(colour))
+      del pixels # Unlock target
+    else:
+      runs = np.flatnonzero(~joined).tolist() + [len(ends)]
+      ends = ends.tolist()
+      for (i, j) in zip(runs, runs[1:]):
+        pygame.draw.lines(target, colour, False, [ends[i][0:2]] + [e[2:4] for e in ends[i:j]])
+    return time.perf_counter() - start
+
+  # Plot single pixels, eg: the ground grid dots
+  # The points are culled and projected at once using NumPy and the
+  # survivors are written straight into imgbuf's pixels.
+  # Params: pts - (N, 3) array of camera coordinates
+  #         colour - RGB colour
+  def draw_points(self, pts, colour):
+    # Cull points behind the focal plane, then project
+    scr = self.project(pts[pts[:, 0] > self.world.focal_plane])
+    (sx, sy) = (scr[:, 0], scr[:, 1])
+
+    # Cull points outside the screen
+    onscreen = (sx >= 0) & (sx < self.sx) & (sy >= 0) & (sy < self.sy)
+    pixels = pygame.surfarray.pixels2d(self.imgbuf)
+    pixels[sx[onscreen].astype(np.intp), sy[onscreen].astype(np.intp)] = self.imgbuf.map_rgb(colour)
+    del pixels # Unlock imgbuf
+
+  # Put the finished view on the display
+  # Params: smooth - filter when scaling up
+  def blit(self, smooth):
+    if self.scale == 1.0:
+      self.world.compositor.blit(self.imgbuf, self.offset)
+    else:
+      self.world.compositor.blit_scaled(self.imgbuf, self.offset + self.size, smooth)